@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, APIRouter
 from pydantic import BaseModel, Field, HttpUrl, AnyUrl
 from typing import List, Dict, Optional, Any
+import os
 import numpy as np
 from agents import DataCollectorAgent, DataProcessorAgent, ResultPresenterAgent
 import logging
@@ -84,9 +85,12 @@ class AnalysisRequest(BaseModel):
             }
         }
 
+# Pipeline ayarları (CLUSTER_DTYPE=float32 bellek ve bant genişliğini yarıya indirir)
+pipeline_config = {'dtype': os.getenv('CLUSTER_DTYPE', 'float64')}
+
 # Global ajan nesneleri
-collector = DataCollectorAgent()
-processor = DataProcessorAgent()
+collector = DataCollectorAgent(pipeline_config)
+processor = DataProcessorAgent(pipeline_config)
 presenter = ResultPresenterAgent()
 
 # Analiz sonuçlarını geçici olarak saklamak için
@@ -112,7 +116,7 @@ async def analyze_data(input_data: DataInput):
         
         # Veriyi numpy array'e dönüştür
         try:
-            data = np.array(input_data.data, dtype=np.float64)
+            data = np.array(input_data.data, dtype=pipeline_config['dtype'])
             logger.info(f"Veri boyutu: {data.shape}")
         except Exception as e:
             logger.error(f"Veri dönüştürme hatası: {str(e)}")
@@ -24,8 +24,8 @@ logger = logging.getLogger(__name__)
 class DataCollectorAgent:
     """Ajan 1: Veri toplama ve ön işleme."""
     
-    def __init__(self):
-        self.preprocessor = DataPreparation()
+    def __init__(self, config: Optional[Dict] = None):
+        self.preprocessor = DataPreparation(config)
         
     async def process_data(self, data: np.ndarray) -> Dict[str, Any]:
         """Ham veriyi işler ve temizler."""
@@ -47,7 +47,7 @@ class DataCollectorAgent:
             
             # Aykırı değerleri tespit et ve işle
             try:
-                numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
+                numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
                 outliers = self.preprocessor.detect_outliers(df, numeric_cols)
                 if any(len(indices) > 0 for indices in outliers.values()):
                     df = self.preprocessor.handle_outliers(df, outliers)
@@ -75,7 +75,7 @@ class DataCollectorAgent:
             return {
                 "status": "ok",
                 "metadata": metadata,
-                "clean_data": df.values
+                "clean_data": self.preprocessor.to_array(df)
             }
             
         except Exception as e:
@@ -88,9 +88,9 @@ class DataCollectorAgent:
 class DataProcessorAgent:
     """Ajan 2: Kümeleme analizi ve model yönetimi."""
     
-    def __init__(self):
-        self.static_optimizer = ClusteringOptimizer()
-        self.streaming_model = AutoCluster()
+    def __init__(self, config: Optional[Dict] = None):
+        self.static_optimizer = ClusteringOptimizer(config)
+        self.streaming_model = AutoCluster(config=config)
         
     async def analyze_data(self, data: np.ndarray, method: str = "static") -> Dict[str, Any]:
         """Veriyi analiz eder ve kümeleme yapar."""
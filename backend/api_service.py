@@ -6,7 +6,6 @@ from pathlib import Path
 import joblib
 from clustering import ClusteringOptimizer
 from auto_cluster import AutoCluster
-from sklearn.cluster import DBSCAN
 
 app = FastAPI(
     title="Kümeleme API",
@@ -72,12 +71,8 @@ async def predict(data: DataBatch):
         X = np.array([point.features for point in data.data])
         
         if static_model is not None:
-            # DBSCAN için özel işlem
-            if isinstance(static_model.best_model, DBSCAN):
-                # DBSCAN için fit_predict kullan
-                labels = static_model.best_model.fit_predict(X)
-            else:
-                labels = static_model.best_model.predict(X)
+            # Ölçekleme, PCA ve atama indeksi eğitimde kurulan haliyle kullanılır
+            labels = static_model.predict(X)
             
             response = {
                 "labels": labels.tolist(),
@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 from sklearn.base import BaseEstimator, ClusterMixin
 from sklearn.cluster import MiniBatchKMeans
 from sklearn.preprocessing import StandardScaler
@@ -11,7 +10,369 @@ from pathlib import Path
 import joblib
 from datetime import datetime
 import json
-from collections import deque
+import time
+from data_preparation import resolve_dtype
+
+class RingBuffer:
+    """
+    Sabit kapasiteli, dizi tabanlı halka tampon.
+    
+    Satırlar 2 * capacity uzunluğunda tek bir dizide iki kez (i ve
+    i + capacity konumlarına) yazılır. Böylece en eskiden en yeniye sıralı
+    içerik her zaman bitişik bir dilimdir ve view() kopya üretmeden döner.
+    Batch'ler satır satır değil, en fazla iki dilim ataması (ve aynaları)
+    ile yazılır.
+    """
+    
+    def __init__(self, capacity: int, dtype: Union[str, np.dtype] = 'float64'):
+        """
+        Args:
+            capacity: Tutulacak en fazla satır sayısı
+            dtype: Satırların veri tipi
+        """
+        if capacity < 1:
+            raise ValueError(f"Geçersiz tampon kapasitesi: {capacity}")
+        self.capacity = capacity
+        self.dtype = np.dtype(dtype)
+        # Özellik sayısı ilk batch ile belirlenir
+        self._data = None
+        self._end = 0
+        self._size = 0
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    def append(self, X: np.ndarray):
+        """
+        Batch'i tampona ekler; kapasite aşılırsa en eski satırlar düşer.
+        
+        Args:
+            X: Eklenecek satırlar (tek satır için 1 boyutlu olabilir)
+        """
+        X = np.asarray(X, dtype=self.dtype)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if self._data is None:
+            self._data = np.empty((2 * self.capacity, X.shape[1]), dtype=self.dtype)
+        elif X.shape[1] != self._data.shape[1]:
+            raise ValueError(f"Beklenen özellik sayısı {self._data.shape[1]}, "
+                             f"gelen: {X.shape[1]}")
+            
+        # Kapasiteden büyük batch'lerin yalnızca son satırları kalır
+        X = X[-self.capacity:]
+        n = len(X)
+        
+        # Kapasite sınırına kadar olan kısım ve başa sarılan kalan kısım
+        head = min(n, self.capacity - self._end)
+        for target, rows in ((self._end, X[:head]), (0, X[head:])):
+            if len(rows):
+                self._data[target:target + len(rows)] = rows
+                self._data[target + self.capacity:target + self.capacity + len(rows)] = rows
+                
+        self._end = (self._end + n) % self.capacity
+        self._size = min(self._size + n, self.capacity)
+        
+    def view(self) -> np.ndarray:
+        """
+        En eskiden en yeniye sıralı içeriği kopyasız döndürür.
+        
+        Dönen dizi salt okunurdur ve sonraki eklemelerle değişir; ekleme
+        sonrasında da kullanılacaksa kopyalanmalıdır.
+        
+        Returns:
+            np.ndarray: (len, n_features) boyutlu görünüm
+        """
+        if self._data is None:
+            return np.empty((0, 0), dtype=self.dtype)
+        start = (self._end - self._size) % self.capacity
+        window = self._data[start:start + self._size]
+        window.flags.writeable = False
+        return window
+        
+    def clear(self):
+        """Tamponu boşaltır (ayrılmış bellek korunur)."""
+        self._end = 0
+        self._size = 0
+
+class ClusterHistory:
+    """
+    Streaming geçmişi için sabit bellekli, sütun tabanlı zaman serisi deposu.
+    
+    Son capacity batch ham olarak dizilerde (halka düzeninde) tutulur. Dolu
+    depoya eklenen her batch en eski ham kaydı düşürür; düşen kayıtlar
+    rollup_size'lık pencerelerde küme başına min/ortalama/maks olarak özetlenir.
+    Özetler de rollup_capacity kadar tutulur, en eskileri silinir. Ekleme
+    O(küme sayısı) zamanda çalışır ve bellek kullanımı sabittir.
+    
+    Tüm akış boyunca küme boyutlarının ortalaması ve varyansı Welford
+    yöntemiyle artımlı olarak tutulur; istatistik sorguları geçmiş
+    uzunluğundan bağımsızdır.
+    """
+    
+    def __init__(self, capacity: int = 1000, rollup_size: int = 60,
+                 rollup_capacity: int = 1000):
+        """
+        Args:
+            capacity: Ham tutulacak en fazla batch sayısı
+            rollup_size: Bir özet penceresindeki batch sayısı
+            rollup_capacity: Tutulacak en fazla özet penceresi sayısı
+        """
+        if min(capacity, rollup_size, rollup_capacity) < 1:
+            raise ValueError("Geçmiş kapasiteleri pozitif olmalıdır")
+        self.capacity = capacity
+        self.rollup_size = rollup_size
+        self.rollup_capacity = rollup_capacity
+        self.total_samples = 0
+        self.n_batches = 0
+        # Küme boyutlarının akan ortalaması ve kare sapmalar toplamı (Welford)
+        self.size_mean = np.zeros(0)
+        self.size_m2 = np.zeros(0)
+        
+        # Ham kayıtlar
+        self.timestamps = np.zeros(capacity)
+        self.n_samples = np.zeros(capacity, dtype=np.int64)
+        self.inertia = np.full(capacity, np.nan)
+        self.cluster_sizes = np.zeros((capacity, 0), dtype=np.int64)
+        self._end = 0
+        self._size = 0
+        
+        # Özet pencereleri
+        self.rollup_start = np.zeros(rollup_capacity)
+        self.rollup_end = np.zeros(rollup_capacity)
+        self.rollup_count = np.zeros(rollup_capacity, dtype=np.int64)
+        self.rollup_samples = np.zeros(rollup_capacity, dtype=np.int64)
+        self.rollup_inertia = np.full(rollup_capacity, np.nan)
+        self.rollup_min = np.zeros((rollup_capacity, 0))
+        self.rollup_mean = np.zeros((rollup_capacity, 0))
+        self.rollup_max = np.zeros((rollup_capacity, 0))
+        self._rollup_end = 0
+        self._rollup_size = 0
+        # Henüz tamamlanmamış özet penceresinin toplamları
+        self._window = None
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    def _ensure_width(self, n_clusters: int):
+        """Küme sayısı artarsa küme sütunlarını genişletir (yeni kümeler 0 boyutludur)."""
+        extra = n_clusters - self.cluster_sizes.shape[1]
+        if extra <= 0:
+            return
+        self.cluster_sizes = np.pad(self.cluster_sizes, ((0, 0), (0, extra)))
+        self.rollup_min = np.pad(self.rollup_min, ((0, 0), (0, extra)))
+        self.rollup_mean = np.pad(self.rollup_mean, ((0, 0), (0, extra)))
+        self.rollup_max = np.pad(self.rollup_max, ((0, 0), (0, extra)))
+        # Yeni küme önceki batch'lerde 0 boyutluydu: ortalaması ve sapması 0
+        self.size_mean = np.pad(self.size_mean, (0, extra))
+        self.size_m2 = np.pad(self.size_m2, (0, extra))
+        if self._window is not None:
+            for key in ('min', 'sum', 'max'):
+                self._window[key] = np.pad(self._window[key], (0, extra))
+                
+    def append(self, timestamp: float, n_samples: int, cluster_sizes: np.ndarray,
+               inertia: float = np.nan):
+        """
+        Bir batch kaydı ekler.
+        
+        Args:
+            timestamp: Unix zaman damgası (sn)
+            n_samples: Batch'teki örnek sayısı
+            cluster_sizes: Küme başına örnek sayıları
+            inertia: Modelin inertia değeri (yoksa NaN)
+        """
+        cluster_sizes = np.asarray(cluster_sizes, dtype=np.int64)
+        self._ensure_width(len(cluster_sizes))
+        
+        if self._size == self.capacity:
+            self._roll_up(self._end)
+        else:
+            self._size += 1
+            
+        i = self._end
+        self.timestamps[i] = timestamp
+        self.n_samples[i] = n_samples
+        self.inertia[i] = inertia
+        self.cluster_sizes[i] = 0
+        self.cluster_sizes[i, :len(cluster_sizes)] = cluster_sizes
+        self._end = (self._end + 1) % self.capacity
+        
+        self.total_samples += int(n_samples)
+        self.n_batches += 1
+        
+        # Welford güncellemesi
+        sizes = self.cluster_sizes[i]
+        delta = sizes - self.size_mean
+        self.size_mean += delta / self.n_batches
+        self.size_m2 += delta * (sizes - self.size_mean)
+        
+    def distribution_stats(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Tüm akış boyunca küme boyutlarının ortalamasını ve standart sapmasını döndürür.
+        
+        Returns:
+            Tuple: Ortalama ve örneklem standart sapması (tek batch varken 0)
+        """
+        if self.n_batches < 2:
+            return self.size_mean.copy(), np.zeros_like(self.size_m2)
+        return self.size_mean.copy(), np.sqrt(self.size_m2 / (self.n_batches - 1))
+        
+    def _roll_up(self, i: int):
+        """Düşen ham kaydı açık özet penceresine ekler; pencere dolunca kaydeder."""
+        sizes = self.cluster_sizes[i].astype(np.float64)
+        if self._window is None:
+            self._window = {'start': self.timestamps[i], 'count': 0, 'samples': 0,
+                            'inertia_sum': 0.0, 'inertia_count': 0,
+                            'min': sizes.copy(), 'sum': np.zeros_like(sizes), 'max': sizes.copy()}
+        window = self._window
+        window['end'] = self.timestamps[i]
+        window['count'] += 1
+        window['samples'] += int(self.n_samples[i])
+        np.minimum(window['min'], sizes, out=window['min'])
+        np.maximum(window['max'], sizes, out=window['max'])
+        window['sum'] += sizes
+        if not np.isnan(self.inertia[i]):
+            window['inertia_sum'] += self.inertia[i]
+            window['inertia_count'] += 1
+            
+        if window['count'] == self.rollup_size:
+            self._store_window(window)
+            self._window = None
+            
+    def _store_window(self, window: Dict):
+        """Tamamlanan özet penceresini özet halkasına yazar."""
+        j = self._rollup_end
+        self.rollup_start[j] = window['start']
+        self.rollup_end[j] = window['end']
+        self.rollup_count[j] = window['count']
+        self.rollup_samples[j] = window['samples']
+        self.rollup_inertia[j] = (window['inertia_sum'] / window['inertia_count']
+                                  if window['inertia_count'] else np.nan)
+        self.rollup_min[j] = window['min']
+        self.rollup_mean[j] = window['sum'] / window['count']
+        self.rollup_max[j] = window['max']
+        self._rollup_end = (self._rollup_end + 1) % self.rollup_capacity
+        self._rollup_size = min(self._rollup_size + 1, self.rollup_capacity)
+        
+    @staticmethod
+    def _order(end: int, size: int, capacity: int) -> np.ndarray:
+        """Halka düzenindeki kayıtların eskiden yeniye indekslerini döndürür."""
+        return (end - size + np.arange(size)) % capacity
+        
+    def latest(self) -> Optional[Dict]:
+        """
+        Son batch kaydını döndürür.
+        
+        Returns:
+            Optional[Dict]: Zaman damgası, örnek sayısı, küme boyutları ve inertia
+        """
+        if self._size == 0:
+            return None
+        i = (self._end - 1) % self.capacity
+        return {'timestamp': float(self.timestamps[i]), 'n_samples': int(self.n_samples[i]),
+                'cluster_sizes': self.cluster_sizes[i], 'inertia': float(self.inertia[i])}
+        
+    def recent(self) -> Dict[str, np.ndarray]:
+        """
+        Ham kayıtları eskiden yeniye sıralı olarak döndürür.
+        
+        Returns:
+            Dict: 'timestamp', 'n_samples', 'cluster_sizes' ve 'inertia' dizileri
+        """
+        order = self._order(self._end, self._size, self.capacity)
+        return {'timestamp': self.timestamps[order], 'n_samples': self.n_samples[order],
+                'cluster_sizes': self.cluster_sizes[order], 'inertia': self.inertia[order]}
+        
+    def rollups(self) -> Dict[str, np.ndarray]:
+        """
+        Özet pencerelerini (tamamlanmamış son pencere dahil) eskiden yeniye döndürür.
+        
+        Returns:
+            Dict: 'start', 'end', 'count', 'n_samples', 'inertia' ve küme
+                başına 'min', 'mean', 'max' dizileri
+        """
+        order = self._order(self._rollup_end, self._rollup_size, self.rollup_capacity)
+        rollups = {'start': self.rollup_start[order], 'end': self.rollup_end[order],
+                   'count': self.rollup_count[order], 'n_samples': self.rollup_samples[order],
+                   'inertia': self.rollup_inertia[order], 'min': self.rollup_min[order],
+                   'mean': self.rollup_mean[order], 'max': self.rollup_max[order]}
+        if self._window is not None:
+            window = self._window
+            partial = {'start': window['start'], 'end': window['end'], 'count': window['count'],
+                       'n_samples': window['samples'],
+                       'inertia': (window['inertia_sum'] / window['inertia_count']
+                                   if window['inertia_count'] else np.nan),
+                       'min': window['min'], 'mean': window['sum'] / window['count'],
+                       'max': window['max']}
+            rollups = {key: np.concatenate([value, np.asarray(partial[key])[None]])
+                       for key, value in rollups.items()}
+        return rollups
+        
+    # to_dict/from_dict ile aynen saklanan diziler ve sayaçlar (halka düzeninde)
+    _ARRAYS = ('timestamps', 'n_samples', 'inertia', 'cluster_sizes',
+               'rollup_start', 'rollup_end', 'rollup_count', 'rollup_samples',
+               'rollup_inertia', 'rollup_min', 'rollup_mean', 'rollup_max',
+               'size_mean', 'size_m2')
+    _COUNTERS = ('total_samples', 'n_batches', '_end', '_size', '_rollup_end', '_rollup_size')
+        
+    def to_dict(self) -> Dict:
+        """Depoyu JSON'a yazılabilir bir sözlüğe dönüştürür (NaN değerleri None olur)."""
+        def to_list(values: np.ndarray) -> List:
+            if values.dtype.kind == 'f':
+                return np.where(np.isnan(values), None, values).tolist()
+            return values.tolist()
+            
+        window = None
+        if self._window is not None:
+            window = {key: (value.tolist() if isinstance(value, np.ndarray) else value)
+                      for key, value in self._window.items()}
+        return {
+            'capacity': self.capacity,
+            'rollup_size': self.rollup_size,
+            'rollup_capacity': self.rollup_capacity,
+            **{name: getattr(self, name) for name in self._COUNTERS},
+            **{name: to_list(getattr(self, name)) for name in self._ARRAYS},
+            'window': window
+        }
+        
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ClusterHistory':
+        """to_dict çıktısından depoyu yeniden oluşturur."""
+        history = cls(data['capacity'], data['rollup_size'], data['rollup_capacity'])
+        for name in cls._COUNTERS:
+            setattr(history, name, data[name])
+        for name in cls._ARRAYS:
+            template = getattr(history, name)
+            values = np.array(data[name], dtype=np.float64)
+            if template.ndim == 2:
+                values = values.reshape(len(template), -1) if values.size else template
+            setattr(history, name, values.astype(template.dtype))
+        if data['window'] is not None:
+            history._window = {key: (np.asarray(value, dtype=np.float64) if isinstance(value, list)
+                                     else value)
+                               for key, value in data['window'].items()}
+        return history
+        
+    @classmethod
+    def from_records(cls, label_history: List[Dict], metric_history: List[Dict],
+                     **kwargs) -> 'ClusterHistory':
+        """
+        Eski liste tabanlı geçmiş formatını depoya dönüştürür.
+        
+        Args:
+            label_history: Zaman damgası, örnek sayısı ve küme boyutları kayıtları
+            metric_history: Zaman damgası ve inertia kayıtları
+            **kwargs: ClusterHistory kapasite parametreleri
+            
+        Returns:
+            ClusterHistory: Kayıtları sırayla eklenmiş depo
+        """
+        history = cls(**kwargs)
+        inertia = {entry['timestamp']: entry['inertia'] for entry in metric_history}
+        for entry in label_history:
+            history.append(datetime.fromisoformat(entry['timestamp']).timestamp(),
+                           entry['n_samples'], entry['cluster_sizes'],
+                           inertia.get(entry['timestamp'], np.nan))
+        return history
 
 class AutoCluster:
     """Gerçek zamanlı/streaming veri için otomatik kümeleme sınıfı."""
@@ -27,10 +388,11 @@ class AutoCluster:
         """
         self.config = config or {}
         self.logger = self._setup_logger()
+        # Batch'lerin kayan nokta tipi ('float32' veya 'float64')
+        self.dtype = resolve_dtype(self.config.get('dtype', 'float64'))
         self.buffer_size = buffer_size
-        self.data_buffer = deque(maxlen=buffer_size)
-        self.label_history = []
-        self.metric_history = []
+        self.data_buffer = RingBuffer(buffer_size, self.dtype)
+        self.history = self._new_history()
         
         # Varsayılan model MiniBatchKMeans
         self.model = base_model or MiniBatchKMeans(
@@ -38,14 +400,33 @@ class AutoCluster:
             random_state=42
         )
         
-        # Online öğrenme için gerekli dönüştürücüler
+        # Online öğrenme için gerekli dönüştürücüler; bileşen sayısı
+        # (config['n_components'] oran ise) ilk batch'te belirlenir
         self.scaler = StandardScaler()
-        self.ipca = IncrementalPCA(
-            n_components=self.config.get('n_components', 0.95)
-        )
+        self.ipca = IncrementalPCA()
+        self._read_stream_config()
         
         self.is_initialized = False
         
+    def _new_history(self) -> ClusterHistory:
+        """config'deki kapasitelerle boş bir geçmiş deposu oluşturur."""
+        return ClusterHistory(
+            capacity=self.config.get('history_size', 1000),
+            rollup_size=self.config.get('history_rollup_size', 60),
+            rollup_capacity=self.config.get('history_rollup_capacity', 1000)
+        )
+        
+    def _read_stream_config(self):
+        """Dönüştürücü güncelleme ayarlarını config'den okur."""
+        # Ölçekleyici ve PCA her batch'te güncellensin mi
+        self.online_transform = self.config.get('online_transform', True)
+        # Merkez tabanlı modellerde tek mesafe hesabıyla atama + güncelleme (bkz. _fused_kmeans_step)
+        self.fused_update = self.config.get('fused_update', True)
+        # Üstel unutma katsayısı: 1 tüm geçmişi eşit tutar, küçük değerler eski batch'leri unutur
+        self.forgetting_factor = self.config.get('forgetting_factor', 1.0)
+        if not 0 < self.forgetting_factor <= 1:
+            raise ValueError(f"Geçersiz unutma katsayısı: {self.forgetting_factor}")
+        
     def _setup_logger(self) -> logging.Logger:
         """Logger ayarlarını yapılandırır."""
         logger = logging.getLogger(__name__)
@@ -57,13 +438,36 @@ class AutoCluster:
             logger.addHandler(handler)
         return logger
     
+    def _resolve_n_components(self, X_scaled: np.ndarray) -> int:
+        """
+        PCA bileşen sayısını belirler.
+        
+        config['n_components'] (0, 1) aralığında bir oransa ilk batch'in
+        açıklanan varyansına göre seçilir; IncrementalPCA oran kabul etmez ve
+        akış boyunca bileşen sayısı sabit kalmalıdır.
+        
+        Args:
+            X_scaled: Ölçeklenmiş ilk batch
+            
+        Returns:
+            int: Bileşen sayısı
+        """
+        n_components = self.config.get('n_components', 0.95)
+        max_components = min(X_scaled.shape)
+        if isinstance(n_components, float) and 0 < n_components < 1:
+            singular_values = np.linalg.svd(X_scaled - X_scaled.mean(axis=0), compute_uv=False)
+            ratios = np.cumsum(singular_values ** 2) / np.sum(singular_values ** 2)
+            n_components = int(np.searchsorted(ratios, n_components)) + 1
+        return max(1, min(int(n_components), max_components))
+        
     def _initialize_with_batch(self, X: np.ndarray):
         """İlk batch ile modeli başlatır."""
         self.scaler.fit(X)
         X_scaled = self.scaler.transform(X)
         
+        self.ipca.set_params(n_components=self._resolve_n_components(X_scaled))
         self.ipca.fit(X_scaled)
-        X_pca = self.ipca.transform(X_scaled)
+        X_pca = self.ipca.transform(X_scaled).astype(self.dtype, copy=False)
         
         self.model.fit(X_pca)
         self.is_initialized = True
@@ -71,6 +475,105 @@ class AutoCluster:
         self.logger.info("Model başlatıldı")
         self.logger.info(f"PCA bileşen sayısı: {self.ipca.n_components_}")
         
+    def _projection(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Ölçekleme ve PCA parametrelerinin kopyasını döndürür (mean, scale, pca_mean, components)."""
+        return (self.scaler.mean_.copy(), self.scaler.scale_.copy(),
+                self.ipca.mean_.copy(), self.ipca.components_.copy())
+        
+    def _update_transforms(self, X: np.ndarray):
+        """
+        Ölçekleyici istatistiklerini ve PCA tabanını yeni batch ile günceller.
+        
+        Unutma katsayısı λ < 1 ise güncellemeden önce geçmiş örnek sayıları λ,
+        PCA tekil değerleri sqrt(λ) ile çarpılır; eski batch'lerin ağırlığı
+        üstel olarak azalır. Batch başına maliyet batch boyutu ve bileşen
+        sayısıyla sınırlıdır. Projeksiyon değiştiği için küme merkezleri eski
+        dönüşümün tersi ve yeni dönüşümle yeni uzaya taşınır.
+        
+        Args:
+            X: Yeni veri batch'i
+        """
+        previous = self._projection()
+        
+        if self.forgetting_factor < 1:
+            self.scaler.n_samples_seen_ = self.scaler.n_samples_seen_ * self.forgetting_factor
+            self.ipca.n_samples_seen_ = self.ipca.n_samples_seen_ * self.forgetting_factor
+            self.ipca.singular_values_ = self.ipca.singular_values_ * np.sqrt(self.forgetting_factor)
+            
+        self.scaler.partial_fit(X)
+        self.ipca.partial_fit(self.scaler.transform(X))
+        
+        self._remap_centers(previous)
+        
+    def _remap_centers(self, previous: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]):
+        """
+        Küme merkezlerini eski projeksiyondan yenisine taşır.
+        
+        Merkez z önce eski dönüşümün tersiyle ham uzaya (x = (z C + m) σ + μ),
+        sonra yeni dönüşümle indirgenmiş uzaya götürülür.
+        
+        Args:
+            previous: Güncelleme öncesi _projection() çıktısı
+        """
+        if not hasattr(self.model, 'cluster_centers_'):
+            return
+        mean, scale, pca_mean, components = previous
+        centers = self.model.cluster_centers_
+        raw = (centers @ components + pca_mean) * scale + mean
+        remapped = ((raw - self.scaler.mean_) / self.scaler.scale_ - self.ipca.mean_) @ self.ipca.components_.T
+        self.model.cluster_centers_ = remapped.astype(centers.dtype, copy=False)
+        
+    def _fused_kmeans_step(self, X: np.ndarray) -> np.ndarray:
+        """
+        Tek bir mesafe hesabıyla batch'i etiketler ve merkezleri günceller.
+        
+        partial_fit + predict her noktanın merkez mesafelerini iki kez
+        hesaplar. Burada ||c||^2 - 2 x c^T skorları bir kez hesaplanır;
+        etiketler, batch inertia'sı ve mini-batch k-means güncellemesi
+        (merkez, atanan noktaların akan ortalaması: c += (toplam - n c) / N)
+        aynı atamadan çıkar. Sayaçlar MiniBatchKMeans ile aynı _counts
+        özniteliğinde tutulur; rastgele merkez yeniden ataması yapılmaz.
+        Etiketler güncelleme öncesi merkezlere göredir.
+        
+        Args:
+            X: İndirgenmiş batch
+            
+        Returns:
+            np.ndarray: Küme etiketleri
+        """
+        centers = self.model.cluster_centers_
+        n_clusters = len(centers)
+        counts = getattr(self.model, '_counts', None)
+        if counts is None:
+            # KMeans gibi sayaç tutmayan modeller: eğitim atamalarından başlatılır
+            counts = np.bincount(self.model.labels_, minlength=n_clusters).astype(centers.dtype)
+            
+        scores = X @ centers.T
+        scores *= -2
+        scores += np.einsum('ij,ij->i', centers, centers)
+        labels = np.argmin(scores, axis=1)
+        min_scores = scores[np.arange(len(X)), labels]
+        inertia = float(np.sum(min_scores) + np.einsum('ij,ij->', X, X))
+        
+        # Küme başına toplamlar: etikete göre sıralı satırların bölüt toplamları
+        batch_counts = np.bincount(labels, minlength=n_clusters)
+        nonempty = batch_counts > 0
+        order = np.argsort(labels, kind='stable')
+        starts = (np.cumsum(batch_counts) - batch_counts)[nonempty]
+        sums = np.add.reduceat(X[order], starts, axis=0)
+        
+        counts = counts + batch_counts
+        centers = centers.copy()
+        centers[nonempty] += ((sums - batch_counts[nonempty, None] * centers[nonempty])
+                              / counts[nonempty, None])
+        
+        self.model.cluster_centers_ = centers
+        self.model._counts = counts
+        self.model.inertia_ = inertia
+        if hasattr(self.model, 'n_steps_'):
+            self.model.n_steps_ += 1
+        return labels
+        
     def partial_fit(self, X: np.ndarray, update_buffer: bool = True) -> np.ndarray:
         """
         Yeni veriyi kullanarak modeli günceller.
@@ -82,40 +585,45 @@ class AutoCluster:
         Returns:
             np.ndarray: Küme etiketleri
         """
-        if not self.is_initialized:
+        X = np.asarray(X, dtype=self.dtype)
+        first_batch = not self.is_initialized
+        if first_batch:
             self._initialize_with_batch(X)
+        elif self.online_transform:
+            # İlk batch dönüştürücüleri zaten eğitti; sonrakiler onları günceller
+            self._update_transforms(X)
         
         # Veriyi ölçeklendir
         X_scaled = self.scaler.transform(X)
         
         # PCA uygula
-        X_pca = self.ipca.transform(X_scaled)
+        X_pca = self.ipca.transform(X_scaled).astype(self.dtype, copy=False)
         
         # Modeli güncelle ve tahmin yap
-        if hasattr(self.model, 'partial_fit'):
-            self.model.partial_fit(X_pca)
+        fused = self.fused_update and hasattr(self.model, 'cluster_centers_')
+        if fused and first_batch:
+            # Model bu batch üzerinde yeni eğitildi; etiketleri hazır
+            labels = self.model.labels_
+        elif fused:
+            labels = self._fused_kmeans_step(X_pca)
         else:
-            self.model.fit(X_pca)
-            
-        labels = self.model.predict(X_pca)
+            if hasattr(self.model, 'partial_fit'):
+                self.model.partial_fit(X_pca)
+            else:
+                self.model.fit(X_pca)
+            labels = self.model.predict(X_pca)
         
-        # Tampon belleği güncelle
+        # Tampon belleği güncelle (tüm batch tek seferde yazılır)
         if update_buffer:
-            for sample in X:
-                self.data_buffer.append(sample)
-        
-        # Geçmiş bilgileri kaydet
-        self.label_history.append({
-            'timestamp': datetime.now().isoformat(),
-            'n_samples': len(X),
-            'cluster_sizes': np.bincount(labels).tolist()
-        })
-        
-        if hasattr(self.model, 'inertia_'):
-            self.metric_history.append({
-                'timestamp': datetime.now().isoformat(),
-                'inertia': float(self.model.inertia_)
-            })
+            self.data_buffer.append(X)
+        
+        # Geçmiş bilgileri kaydet (sabit bellekli depo, eski kayıtlar özetlenir)
+        self.history.append(
+            time.time(),
+            len(X),
+            np.bincount(labels, minlength=getattr(self.model, 'n_clusters', 0)),
+            float(getattr(self.model, 'inertia_', np.nan))
+        )
         
         return labels
     
@@ -132,44 +640,59 @@ class AutoCluster:
         if not self.is_initialized:
             raise ValueError("Model henüz başlatılmamış!")
             
-        X_scaled = self.scaler.transform(X)
-        X_pca = self.ipca.transform(X_scaled)
+        X_scaled = self.scaler.transform(np.asarray(X, dtype=self.dtype))
+        X_pca = self.ipca.transform(X_scaled).astype(self.dtype, copy=False)
         return self.model.predict(X_pca)
     
     def get_cluster_stats(self) -> Dict:
         """
-        Küme istatistiklerini hesaplar.
+        Küme istatistiklerini döndürür.
+        
+        Ortalama, standart sapma ve toplam örnek sayısı her batch'te artımlı
+        güncellenir; çağrı maliyeti akış uzunluğundan bağımsızdır.
         
         Returns:
             Dict: Küme istatistikleri
         """
-        if not self.label_history:
+        latest = self.history.latest()
+        if latest is None:
             return {}
             
-        latest = self.label_history[-1]
-        historical = pd.DataFrame([h['cluster_sizes'] for h in self.label_history])
+        # Tek batch varken sapma tanımsızdır; JSON'a yazılabilsin diye 0 döner
+        mean, std = self.history.distribution_stats()
         
         stats = {
-            'current_distribution': latest['cluster_sizes'],
-            'mean_distribution': historical.mean().tolist(),
-            'std_distribution': historical.std().tolist(),
-            'total_samples_processed': sum(h['n_samples'] for h in self.label_history)
+            'current_distribution': latest['cluster_sizes'].tolist(),
+            'mean_distribution': mean.tolist(),
+            'std_distribution': std.tolist(),
+            'total_samples_processed': self.history.total_samples
         }
         
         return stats
     
     def plot_cluster_evolution(self, save_path: Optional[Union[str, Path]] = None):
-        """Küme boyutlarının zaman içindeki değişimini görselleştirir."""
-        if not self.label_history:
+        """
+        Küme boyutlarının zaman içindeki değişimini görselleştirir.
+        
+        Özetlenmiş eski pencereler ortalama çizgisi ve min-maks bandıyla,
+        son batch'ler ham olarak çizilir.
+        """
+        if len(self.history) == 0:
             self.logger.warning("Henüz veri işlenmemiş!")
             return
             
-        historical = pd.DataFrame([h['cluster_sizes'] for h in self.label_history])
-        timestamps = [datetime.fromisoformat(h['timestamp']) for h in self.label_history]
+        recent = self.history.recent()
+        rollups = self.history.rollups()
+        timestamps = [datetime.fromtimestamp(t) for t in recent['timestamp']]
+        rollup_times = [datetime.fromtimestamp(t) for t in rollups['end']]
         
         plt.figure(figsize=(12, 6))
-        for i in range(historical.shape[1]):
-            plt.plot(timestamps, historical[i], label=f'Küme {i}')
+        for i in range(recent['cluster_sizes'].shape[1]):
+            line, = plt.plot(timestamps, recent['cluster_sizes'][:, i], label=f'Küme {i}')
+            if len(rollup_times):
+                plt.plot(rollup_times, rollups['mean'][:, i], color=line.get_color())
+                plt.fill_between(rollup_times, rollups['min'][:, i], rollups['max'][:, i],
+                                 color=line.get_color(), alpha=0.2)
             
         plt.xlabel('Zaman')
         plt.ylabel('Küme Boyutu')
@@ -188,15 +711,18 @@ class AutoCluster:
         
     def plot_metric_evolution(self, save_path: Optional[Union[str, Path]] = None):
         """Model metriklerinin zaman içindeki değişimini görselleştirir."""
-        if not self.metric_history:
+        recent = self.history.recent()
+        rollups = self.history.rollups()
+        if np.all(np.isnan(recent['inertia'])):
             self.logger.warning("Henüz metrik kaydedilmemiş!")
             return
             
-        metrics_df = pd.DataFrame(self.metric_history)
-        metrics_df['timestamp'] = pd.to_datetime(metrics_df['timestamp'])
-        
         plt.figure(figsize=(12, 6))
-        plt.plot(metrics_df['timestamp'], metrics_df['inertia'], 'b-')
+        if len(rollups['end']):
+            plt.plot([datetime.fromtimestamp(t) for t in rollups['end']],
+                     rollups['inertia'], 'b-', alpha=0.5)
+        plt.plot([datetime.fromtimestamp(t) for t in recent['timestamp']],
+                 recent['inertia'], 'b-')
         plt.xlabel('Zaman')
         plt.ylabel('Inertia')
         plt.title('Model Performansının Zamanla Değişimi')
@@ -226,12 +752,9 @@ class AutoCluster:
         joblib.dump(self.scaler, save_path / 'scaler.joblib')
         joblib.dump(self.ipca, save_path / 'ipca.joblib')
         
-        # Geçmiş bilgileri JSON olarak kaydet
+        # Geçmiş deposunu JSON olarak kaydet
         with open(save_path / 'history.json', 'w') as f:
-            json.dump({
-                'label_history': self.label_history,
-                'metric_history': self.metric_history
-            }, f)
+            json.dump(self.history.to_dict(), f)
             
         # Konfigürasyon
         with open(save_path / 'config.json', 'w') as f:
@@ -257,12 +780,6 @@ class AutoCluster:
         self.scaler = joblib.load(load_path / 'scaler.joblib')
         self.ipca = joblib.load(load_path / 'ipca.joblib')
         
-        # Geçmiş bilgileri yükle
-        with open(load_path / 'history.json', 'r') as f:
-            history = json.load(f)
-            self.label_history = history['label_history']
-            self.metric_history = history['metric_history']
-            
         # Konfigürasyon
         with open(load_path / 'config.json', 'r') as f:
             config = json.load(f)
@@ -270,4 +787,22 @@ class AutoCluster:
             self.config = config['config']
             self.is_initialized = config['is_initialized']
             
+        # Geçmişi yükle; eski liste formatı depoya dönüştürülür
+        with open(load_path / 'history.json', 'r') as f:
+            history = json.load(f)
+        if 'label_history' in history:
+            template = self._new_history()
+            self.history = ClusterHistory.from_records(
+                history['label_history'], history['metric_history'],
+                capacity=template.capacity, rollup_size=template.rollup_size,
+                rollup_capacity=template.rollup_capacity
+            )
+        else:
+            self.history = ClusterHistory.from_dict(history)
+            
+        # Tampon kaydedilmez; yüklenen ayarlarla boş olarak yeniden oluşturulur
+        self.dtype = np.dtype(self.config.get('dtype', 'float64'))
+        self._read_stream_config()
+        self.data_buffer = RingBuffer(self.buffer_size, self.dtype)
+            
         self.logger.info("Model durumu yüklendi") 
\ No newline at end of file
@@ -0,0 +1,26 @@
+import time
+import tracemalloc
+from typing import Callable, Optional, Tuple
+
+def measure(func: Callable, track_memory: bool = True) -> Tuple[object, float, Optional[float]]:
+    """
+    Fonksiyonu çalıştırır; duvar saati süresini ve tepe bellek kullanımını ölçer.
+    
+    Args:
+        func: Ölçülecek fonksiyon
+        track_memory: tracemalloc ile tepe bellek ölçülsün mü
+    
+    Returns:
+        Tuple: Fonksiyon sonucu, süre (sn) ve tepe bellek (MB; ölçülmediyse None)
+    """
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak_mb = None
+    if track_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_mb = peak / 1024 ** 2
+    return result, elapsed, peak_mb
@@ -0,0 +1,105 @@
+import numpy as np
+from typing import Union, Dict, Optional
+from pathlib import Path
+
+# Artifact formatı değiştiğinde artırılır
+ARTIFACT_VERSION = 1
+
+class CompiledClusterPredictor:
+    """
+    Yalnızca NumPy ile çalışan, derlenmiş kümeleme tahmin edici.
+
+    ClusteringOptimizer.export_inference_artifact ile yazılan .npz dosyasını
+    yükler. Ölçekleyici ve PCA tek bir afin dönüşüme (W, b) birleştirilmiştir.
+    Merkez tabanlı modellerde (K-Means) bu dönüşüm merkez mesafeleriyle de
+    birleştirilir; etiketler tek bir matris çarpımı ve argmin ile bulunur:
+
+        argmin_j ||xW + b - c_j||^2 = argmin_j (xA + beta)_j
+        A = -2 W C^T,  beta_j = ||c_j||^2 - 2 b c_j^T
+
+    Diğer modellerde veri indirgenmiş uzaya taşınır ve referans noktaları
+    arasında en yakın komşu aranır (radius aşılırsa -1).
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        Args:
+            arrays: Artifact dizileri (bkz. export_inference_artifact)
+        """
+        version = int(arrays['version'])
+        if version != ARTIFACT_VERSION:
+            raise ValueError(f"Desteklenmeyen artifact sürümü: {version}")
+        
+        self.kind = str(arrays['kind'])
+        self.n_features_in_ = int(arrays['n_features_in'])
+        # Girdi, artifact'taki tabloların tipine (float32/float64) çevrilir
+        self.dtype = (arrays['A'] if self.kind == 'centroid' else arrays['W']).dtype
+        
+        if self.kind == 'centroid':
+            self.A = arrays['A']
+            self.beta = arrays['beta']
+        elif self.kind == 'nearest':
+            self.W = arrays['W']
+            self.b = arrays['b']
+            self.reference_points = arrays['reference_points']
+            self.reference_labels = arrays['reference_labels']
+            self.reference_sq_norms = np.einsum('ij,ij->i', self.reference_points,
+                                                self.reference_points)
+            radius = float(arrays['radius'])
+            self.radius = None if np.isnan(radius) else radius
+        else:
+            raise ValueError(f"Desteklenmeyen artifact türü: {self.kind}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'CompiledClusterPredictor':
+        """
+        Artifact dosyasını yükler.
+        
+        Args:
+            path: .npz dosya yolu
+        
+        Returns:
+            CompiledClusterPredictor: Tahmin edici
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return cls({key: data[key] for key in data.files})
+
+    def predict(self, X: np.ndarray, batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Ham (ölçeklenmemiş) veriyi etiketler.
+        
+        Args:
+            X: Girdi verisi
+            batch_size: En yakın komşu aramasında bir seferde işlenecek satır
+                sayısı (varsayılan: mesafe matrisi ~64 MB olacak şekilde)
+        
+        Returns:
+            np.ndarray: Küme etiketleri
+        """
+        X = np.asarray(X, dtype=self.dtype)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"Beklenen özellik sayısı {self.n_features_in_}, "
+                             f"gelen: {X.shape[1]}")
+        
+        if self.kind == 'centroid':
+            return np.argmin(X @ self.A + self.beta, axis=1)
+        
+        n_refs = len(self.reference_points)
+        if batch_size is None:
+            batch_size = max(1, (64 * 1024 * 1024) // (self.dtype.itemsize * n_refs))
+        
+        labels = np.empty(len(X), dtype=self.reference_labels.dtype)
+        for start in range(0, len(X), batch_size):
+            Y = X[start:start + batch_size] @ self.W + self.b
+            # ||y||^2 argmin için sabittir; yalnızca yarıçap kontrolünde eklenir
+            scores = self.reference_sq_norms - 2 * (Y @ self.reference_points.T)
+            nearest = np.argmin(scores, axis=1)
+            batch_labels = self.reference_labels[nearest]
+            if self.radius is not None:
+                sq_dist = scores[np.arange(len(Y)), nearest] + np.einsum('ij,ij->i', Y, Y)
+                batch_labels = np.where(sq_dist <= self.radius ** 2, batch_labels, -1)
+            labels[start:start + batch_size] = batch_labels
+        
+        return labels
@@ -1,18 +1,34 @@
 import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans, DBSCAN, AgglomerativeClustering
-from sklearn.metrics import silhouette_score, calinski_harabasz_score, davies_bouldin_score, silhouette_samples
+from sklearn.cluster import KMeans, MiniBatchKMeans, DBSCAN, HDBSCAN, AgglomerativeClustering
+from sklearn.metrics import silhouette_score, silhouette_samples, pairwise_distances_chunked
+from sklearn.metrics import pairwise_distances_argmin, pairwise_distances_argmin_min
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
+from sklearn.decomposition import PCA, IncrementalPCA
 from sklearn.manifold import TSNE
+from sklearn.neighbors import NearestNeighbors, KDTree, BallTree
+from sklearn.utils.extmath import randomized_svd, svd_flip
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.cluster.hierarchy import linkage as linkage_tree, fcluster, dendrogram
+from scipy.stats import norm
 import umap
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import Union, List, Dict, Optional, Tuple, Literal
+from typing import Union, List, Dict, Optional, Tuple, Literal, Callable, Iterator, Iterable
 import logging
+import hashlib
+import json
+import os
+import copy
+import time
+import tracemalloc
 from pathlib import Path
 import joblib
+from joblib import Parallel, delayed
 from tqdm import tqdm
+from cluster_predictor import ARTIFACT_VERSION
+from data_preparation import resolve_dtype
 
 class DimensionalityReducer:
     """Boyut azaltma yöntemlerini yöneten sınıf."""
@@ -20,17 +36,27 @@ class DimensionalityReducer:
     def __init__(self, method: Literal['pca', 'tsne', 'umap'] = 'pca',
                  n_components: Optional[int] = None,
                  random_state: int = 42,
+                 dtype: str = 'float64',
+                 oos_neighbors: int = 10,
                  **kwargs):
         """
         Args:
             method: Kullanılacak boyut azaltma yöntemi
             n_components: Hedef boyut sayısı
             random_state: Rastgele sayı üreteci için tohum değeri
+            dtype: Girdi ve çıktı dizilerinin veri tipi ('float32' veya 'float64')
+            oos_neighbors: t-SNE'de yeni noktaları yerleştirmek için kullanılan
+                komşu sayısı
             **kwargs: Seçilen yönteme özel parametreler
         """
         self.method = method
         self.n_components = n_components
         self.random_state = random_state
+        self.oos_neighbors = oos_neighbors
+        # t-SNE örneklem dışı dönüşümü için eğitim gömmesi ve komşuluk indeksi
+        self.embedding_ = None
+        self.neighbor_index_ = None
+        self.dtype = resolve_dtype(dtype)
         self.kwargs = kwargs
         self.model = None
         self._setup_model()
@@ -60,14 +86,51 @@ class DimensionalityReducer:
             
     def fit_transform(self, X: np.ndarray) -> np.ndarray:
         """Veriyi dönüştürür."""
-        return self.model.fit_transform(X)
+        X = np.asarray(X, dtype=self.dtype)
+        # UMAP her zaman float32 döndürür; çıktı seçilen tipe getirilir
+        X_embedded = self.model.fit_transform(X).astype(self.dtype, copy=False)
+        
+        if self.method == 'tsne':
+            self.embedding_ = X_embedded
+            self.neighbor_index_ = NearestNeighbors(
+                n_neighbors=min(self.oos_neighbors, len(X))
+            ).fit(X)
+        return X_embedded
         
     def transform(self, X: np.ndarray) -> np.ndarray:
         """Yeni veriyi dönüştürür."""
+        X = np.asarray(X, dtype=self.dtype)
         if self.method == 'tsne':
-            # t-SNE için yeni veri noktaları direkt dönüştürülemez
-            return self.fit_transform(X)
-        return self.model.transform(X)
+            return self._interpolate_embedding(X)
+        return self.model.transform(X).astype(self.dtype, copy=False)
+    
+    def _interpolate_embedding(self, X: np.ndarray) -> np.ndarray:
+        """
+        Yeni noktaları eğitim gömmesindeki komşularına göre yerleştirir.
+        
+        t-SNE yeni noktaları dönüştüremediği için her nokta, orijinal uzaydaki
+        en yakın eğitim noktalarının gömme koordinatlarının ters mesafe ağırlıklı
+        ortalamasına yerleştirilir. Eğitim noktasıyla çakışan noktalar o noktanın
+        koordinatını alır.
+        
+        Args:
+            X: Yeni veri
+            
+        Returns:
+            np.ndarray: Gömme koordinatları
+        """
+        if self.neighbor_index_ is None:
+            raise ValueError("t-SNE modeli henüz eğitilmemiş!")
+            
+        distances, indices = self.neighbor_index_.kneighbors(X)
+        exact = distances[:, 0] == 0
+        weights = 1.0 / np.where(exact[:, None], 1.0, distances)
+        # Çakışan noktalarda yalnızca ilk komşu (kendisi) ağırlık alır
+        weights[exact, 1:] = 0.0
+        weights /= weights.sum(axis=1, keepdims=True)
+        
+        X_embedded = np.einsum('ij,ijk->ik', weights, self.embedding_[indices])
+        return X_embedded.astype(self.dtype, copy=False)
         
     @property
     def explained_variance_ratio_(self) -> Optional[np.ndarray]:
@@ -76,6 +139,1113 @@ class DimensionalityReducer:
             return self.model.explained_variance_ratio_
         return None
 
+class EmbeddingCache:
+    """
+    Boyut azaltma sonuçları için içerik adresli disk önbelleği.
+    
+    Her kayıt, girdi dizisinin parmak izi ile yöntem ve parametrelerden türetilen
+    bir anahtar altında gömme (embedding) ve eğitilmiş DimensionalityReducer'ı
+    saklar. Toplam boyut max_mb'yi aşınca en uzun süredir kullanılmayan kayıtlar
+    (dosya değişiklik zamanına göre) silinir.
+    """
+    
+    def __init__(self, cache_dir: Union[str, Path], max_mb: float = 1024):
+        """
+        Args:
+            cache_dir: Önbellek dizini
+            max_mb: Önbelleğin en fazla boyutu (MB)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_mb * 1024 ** 2)
+        
+    def make_key(self, X: np.ndarray, method: str, **params) -> str:
+        """
+        Girdi ve parametrelerden önbellek anahtarı üretir.
+        
+        Args:
+            X: Boyut azaltılacak veri
+            method: Boyut azaltma yöntemi
+            **params: Sonucu etkileyen tüm parametreler
+            
+        Returns:
+            str: Önbellek anahtarı
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(array_fingerprint(X).encode())
+        digest.update(f"{method}|{sorted(params.items())!r}".encode())
+        return digest.hexdigest()
+        
+    def _path(self, key: str) -> Path:
+        """Anahtarın dosya yolunu döndürür."""
+        return self.cache_dir / f"{key}.joblib"
+        
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, 'DimensionalityReducer']]:
+        """
+        Kaydı okur ve kullanım zamanını günceller.
+        
+        Args:
+            key: Önbellek anahtarı
+            
+        Returns:
+            Optional[Tuple]: Gömme ve reducer, kayıt yoksa None
+        """
+        path = self._path(key)
+        try:
+            entry = joblib.load(path)
+        except (FileNotFoundError, EOFError):
+            return None
+        path.touch()
+        return entry['embedding'], entry['reducer']
+        
+    def put(self, key: str, embedding: np.ndarray, reducer: 'DimensionalityReducer'):
+        """
+        Kaydı yazar ve gerekirse eski kayıtları siler.
+        
+        Args:
+            key: Önbellek anahtarı
+            embedding: Dönüştürülmüş veri
+            reducer: Eğitilmiş DimensionalityReducer
+        """
+        path = self._path(key)
+        # Yarım kalan yazımlar okunmasın diye geçici dosya üzerinden taşınır
+        tmp_path = path.with_suffix('.tmp')
+        joblib.dump({'embedding': embedding, 'reducer': reducer}, tmp_path)
+        tmp_path.replace(path)
+        self.evict()
+        
+    def evict(self):
+        """Toplam boyut sınırın altına inene kadar en eski kayıtları siler."""
+        entries = [(p.stat().st_mtime, p.stat().st_size, p)
+                   for p in self.cache_dir.glob('*.joblib')]
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+def _expand_ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """[start, start + length) aralıklarını art arda tek bir indeks dizisine açar."""
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+def grid_radius_neighbors(X: np.ndarray, radius: float, cells_per_radius: int = 1,
+                          max_pairs: int = 1 << 22) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Düşük boyutlu veride yarıçap komşuluklarını ızgara indeksiyle bulur.
+    
+    Noktalar kenarı radius / cells_per_radius olan hücrelere yerleştirilip hücre
+    anahtarına göre sıralanır; böylece her hücrenin noktaları bitişik bir aralık
+    olur. Her nokta yalnızca, en yakın köşeleri arası mesafe radius'u aşmayan
+    komşu hücrelerdeki aralıklarla karşılaştırılır (komşu hücreler sıralı
+    anahtarlarda searchsorted ile bulunur). Küçük hücreler, yarıçap küresi
+    dışında kalan aday çift oranını azaltır. Yoğunluk sabit kaldıkça çalışma
+    süresi nokta sayısına göre neredeyse doğrusaldır; komşu hücre sayısı boyutla
+    üstel büyüdüğü için düşük boyutlarda (d <= 3) avantajlıdır. Kare mesafeler
+    sklearn gibi yarıçapın karesiyle karşılaştırılır.
+    
+    Args:
+        X: Veri matrisi
+        radius: Komşuluk yarıçapı
+        cells_per_radius: Bir yarıçap uzunluğuna düşen hücre sayısı
+        max_pairs: Bir seferde değerlendirilecek en fazla aday nokta çifti
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Satır indeksleri (artan sırada),
+            komşu indeksleri ve mesafeler
+    """
+    n_samples, n_features = X.shape
+    # Kenarlarda boş hücre payı bırakılır; komşu anahtarları başka hücreye taşmaz
+    reach = cells_per_radius
+    cells = np.floor((X - X.min(axis=0)) / (radius / reach)).astype(np.int64) + reach
+    shape = cells.max(axis=0) + reach + 1
+    if np.sum(np.log2(shape.astype(np.float64))) > 62:
+        raise ValueError("Izgara hücre sayısı int64 sınırını aşıyor; 'sklearn' motoru kullanılmalı")
+    strides = np.concatenate([np.cumprod(shape[::-1])[::-1][1:], [1]])
+    keys = cells @ strides
+    
+    # Noktalar hücre sırasına dizilir; hesaplar sıralı konumlar üzerinde yapılır
+    order = np.argsort(keys, kind='stable')
+    X_sorted = X[order]
+    cell_keys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+    cell_of_point = np.repeat(np.arange(len(cell_keys)), counts)
+    
+    # Her hücre için komşu hücrelerin nokta aralıkları (boş hücreler 0 uzunlukta);
+    # en yakın köşeleri yarıçaptan uzak hücre kaymaları elenir
+    steps = np.arange(-reach, reach + 1)
+    offsets = np.array(np.meshgrid(*[steps] * n_features, indexing='ij')).reshape(n_features, -1).T
+    gaps = np.maximum(np.abs(offsets) - 1, 0)
+    offsets = offsets[np.sum(gaps ** 2, axis=1) <= reach ** 2]
+    neighbor_keys = cell_keys[:, None] + (offsets @ strides)[None, :]
+    position = np.minimum(np.searchsorted(cell_keys, neighbor_keys), len(cell_keys) - 1)
+    found = cell_keys[position] == neighbor_keys
+    range_starts = np.where(found, starts[position], 0)
+    range_lengths = np.where(found, counts[position], 0)
+    candidates_per_point = range_lengths.sum(axis=1)[cell_of_point]
+    
+    # Aday çift sayısı max_pairs'i aşmayacak şekilde nokta grupları halinde işlenir
+    bounds = np.searchsorted(np.cumsum(candidates_per_point),
+                             np.arange(max_pairs, candidates_per_point.sum(), max_pairs))
+    bounds = np.unique(np.concatenate([[0], bounds + 1, [n_samples]]).clip(max=n_samples))
+    
+    # Sütunlar ayrı dizilerde tutulur; tek boyutlu indeksleme satır kopyalamaktan hızlıdır
+    columns = [np.ascontiguousarray(X_sorted[:, j]) for j in range(n_features)]
+    index_dtype = np.int32 if n_samples < np.iinfo(np.int32).max else np.int64
+    
+    rows, cols, sq_dists = [], [], []
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        point_cells = cell_of_point[first:last]
+        row_pos = np.repeat(np.arange(first, last, dtype=index_dtype),
+                            candidates_per_point[first:last])
+        col_pos = _expand_ranges(range_starts[point_cells].ravel(),
+                                 range_lengths[point_cells].ravel()).astype(index_dtype)
+        sq = np.zeros(len(row_pos), dtype=X.dtype)
+        for column in columns:
+            diff = column[row_pos] - column[col_pos]
+            sq += diff * diff
+        # sklearn gibi kare mesafe yarıçapın karesiyle karşılaştırılır
+        keep = sq <= radius * radius
+        rows.append(row_pos[keep])
+        cols.append(col_pos[keep])
+        sq_dists.append(sq[keep])
+        
+    row_pos, col_pos = np.concatenate(rows), np.concatenate(cols)
+    dists = np.sqrt(np.concatenate(sq_dists))
+    
+    # Satır blokları sıralı konumdan orijinal indeks sırasına taşınır
+    lengths = np.bincount(row_pos, minlength=n_samples)
+    block_starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    inverse = np.empty(n_samples, dtype=np.int64)
+    inverse[order] = np.arange(n_samples)
+    gather = _expand_ranges(block_starts[inverse], lengths[inverse])
+    
+    rows = np.repeat(np.arange(n_samples), lengths[inverse])
+    return rows, order[col_pos[gather]], dists[gather]
+
+def estimate_neighbor_counts(X: np.ndarray, radii: Iterable[float], n_queries: int = 256,
+                             n_reference: int = 4096, random_state: int = 42) -> np.ndarray:
+    """
+    Her yarıçap için nokta başına beklenen komşu sayısını (nokta dahil) tahmin eder.
+    
+    Rastgele sorgu noktalarının rastgele bir referans alt örneklemindeki
+    komşuları sayılır ve n / n_reference ile ölçeklenir. Komşuluk grafı
+    kurulmadan önce kenar sayısını ve yoğunluğu kestirmek için kullanılır.
+    
+    Args:
+        X: Veri matrisi
+        radii: Yarıçaplar
+        n_queries: Sorgu noktası sayısı
+        n_reference: Referans alt örneklem boyutu
+        random_state: Rastgele durum
+        
+    Returns:
+        np.ndarray: Her yarıçap için nokta başına beklenen komşu sayısı
+    """
+    radii = np.asarray(list(radii), dtype=np.float64)
+    n_samples = len(X)
+    rng = np.random.default_rng(random_state)
+    queries = X[rng.choice(n_samples, size=min(n_queries, n_samples), replace=False)]
+    reference = X[rng.choice(n_samples, size=min(n_reference, n_samples), replace=False)]
+    
+    distances, _ = NearestNeighbors(radius=radii.max()).fit(reference).radius_neighbors(
+        queries, return_distance=True
+    )
+    distances = np.sort(np.concatenate(distances))
+    counts = np.searchsorted(distances, radii, side='right') / len(queries)
+    return counts * n_samples / len(reference)
+
+class RadiusNeighborGraph:
+    """
+    DBSCAN parametre ızgarası için bir kez hesaplanan yarıçap komşuluk grafı.
+    
+    Komşuluklar en büyük eps değerinde bir kez sorgulanır ve CSR düzeninde,
+    her satır mesafeye göre sıralı tutulur. Her min_samples için bir kez
+    çekirdek mesafesi (satırdaki min_samples'ıncı mesafe; eps bu değerden
+    küçük değilse nokta çekirdektir), çekirdek-çekirdek kenarlarının
+    max(d, çekirdek mesafeleri) ağırlıkları ve bazı eps değerlerinde sınır
+    noktası olabilecek kenarlar
+    hesaplanır. Kümeler artan eps sırasında yalnızca yeni eklenen kenarlarla
+    güncellenir; böylece her (eps, min_samples) çifti için CSR grafı ve
+    çekirdek maskesi baştan kurulmaz. Komşuluklar
+    sklearn'ün ağaç tabanlı araması ('sklearn') veya düşük boyutlar için ızgara
+    indeksi ('grid', bkz. grid_radius_neighbors) ile bulunur; iki motor aynı
+    grafı üretir.
+    """
+    
+    def __init__(self, X: np.ndarray, radius: float,
+                 engine: Literal['sklearn', 'grid'] = 'sklearn'):
+        """
+        Args:
+            X: Veri matrisi
+            radius: Komşuluk yarıçapı (denenecek en büyük eps)
+            engine: Komşuluk arama motoru ('sklearn' veya 'grid')
+        """
+        self.radius = radius
+        self.n_samples = len(X)
+        self.engine = engine
+        
+        if engine == 'grid':
+            rows, indices, distances = grid_radius_neighbors(X, radius)
+            # Satırlar gruplu gelir; her satır kendi içinde mesafeye göre sıralanır
+            order = np.lexsort((distances, rows))
+            self.rows, self.indices, self.distances = rows[order], indices[order], distances[order]
+            lengths = np.bincount(self.rows, minlength=self.n_samples)
+        elif engine == 'sklearn':
+            distances, indices = NearestNeighbors(radius=radius).fit(X).radius_neighbors(
+                X, return_distance=True, sort_results=True
+            )
+            lengths = np.fromiter((len(row) for row in indices), dtype=np.int64,
+                                  count=self.n_samples)
+            self.indices = np.concatenate(indices).astype(np.int64, copy=False)
+            self.distances = np.concatenate(distances)
+            self.rows = np.repeat(np.arange(self.n_samples), lengths)
+        else:
+            raise ValueError(f"Desteklenmeyen komşuluk motoru: {engine}")
+        
+        # CSR düzeninde satır başlangıçları, komşu indeksleri ve mesafeler
+        self.indptr = np.concatenate([[0], np.cumsum(lengths)])
+        # Yönsüz kenarlar (i < j) tüm min_samples değerlerince paylaşılır
+        self._edges = np.flatnonzero(self.rows < self.indices)
+        self._structures = {}
+        
+    def prepare(self, min_samples_range: Iterable[int]) -> None:
+        """
+        Verilen min_samples değerlerinin yapılarını önceden hesaplar.
+        
+        Paralel taramada yapıların her işçide yeniden hesaplanmaması için
+        adaylar dağıtılmadan önce çağrılır.
+        
+        Args:
+            min_samples_range: min_samples değerleri
+        """
+        for min_samples in min_samples_range:
+            self._min_samples_structure(min_samples)
+            
+    def _min_samples_structure(self, min_samples: int) -> Dict:
+        """Bir min_samples değeri için çekirdek mesafelerini, kenar ağırlıklarını ve sınır adaylarını döndürür."""
+        if min_samples in self._structures:
+            return self._structures[min_samples]
+            
+        # Satırlar mesafeye göre sıralı: min_samples'ıncı mesafe çekirdek mesafesidir
+        lengths = np.diff(self.indptr)
+        core_distance = np.full(self.n_samples, np.inf)
+        has_core = lengths >= min_samples
+        core_distance[has_core] = self.distances[self.indptr[:-1][has_core] + min_samples - 1]
+        
+        # Çekirdek-çekirdek kenarı, ağırlığı eps'i aşmıyorsa eps'te vardır
+        # (çekirdek olamayan uçlarda ağırlık sonsuzdur)
+        weights = np.maximum(self.distances[self._edges],
+                             np.maximum(core_distance[self.rows[self._edges]],
+                                        core_distance[self.indices[self._edges]]))
+        
+        # Sınır adayı: komşu çekirdek ve kenar içerideyken noktanın kendisi çekirdek değil
+        reach = np.maximum(self.distances, core_distance[self.indices])
+        border = reach < core_distance[self.rows]
+        
+        structure = {
+            'core_distance': core_distance,
+            'edge_weights': weights,
+            # Satır sırası korunur: aynı noktanın adayları bitişiktir
+            'border_rows': self.rows[border],
+            'border_cols': self.indices[border],
+            'border_reach': reach[border],
+            'border_core_distance': core_distance[self.rows[border]],
+            # Artan eps sırasında sürdürülen bağlı bileşenler
+            'eps': -np.inf,
+            'components': np.arange(self.n_samples)
+        }
+        self._structures[min_samples] = structure
+        return structure
+        
+    def _core_components(self, structure: Dict, eps: float) -> np.ndarray:
+        """
+        Çekirdek-çekirdek kenarlarının eps'teki bağlı bileşenlerini döndürür.
+        
+        Bileşenler artan eps sırasında birleşim-bul gibi sürdürülür: yalnızca
+        önceki eps'ten bu yana eklenen kenarlar mevcut bileşenler üzerinde
+        birleştirilir. Daha küçük bir eps istenirse baştan başlanır.
+        """
+        if eps < structure['eps']:
+            structure['eps'], structure['components'] = -np.inf, np.arange(self.n_samples)
+            
+        weights = structure['edge_weights']
+        added = self._edges[(weights > structure['eps']) & (weights <= eps)]
+        components = structure['components']
+        if len(added):
+            merged = csr_matrix(
+                (np.ones(len(added), dtype=np.int8),
+                 (components[self.rows[added]], components[self.indices[added]])),
+                shape=(self.n_samples, self.n_samples)
+            )
+            _, merged_components = connected_components(merged, directed=False)
+            components = merged_components[components]
+            
+        structure['eps'], structure['components'] = eps, components
+        return components
+        
+    def dbscan_labels(self, eps: float, min_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Verilen parametreler için DBSCAN etiketlerini türetir.
+        
+        Etiketler sklearn DBSCAN ile aynıdır: kümeler en küçük indeksli çekirdek
+        noktalarına göre numaralanır ve sınır noktaları komşu oldukları en küçük
+        numaralı kümeye atanır. Aynı min_samples için eps artan sırada
+        istendiğinde her kenar yalnızca bir kez işlenir.
+        
+        Args:
+            eps: Komşuluk yarıçapı (radius değerinden büyük olamaz)
+            min_samples: Çekirdek nokta için gereken komşu sayısı (nokta dahil)
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Küme etiketleri ve çekirdek nokta indeksleri
+        """
+        if eps > self.radius:
+            raise ValueError(f"eps ({eps}) komşuluk grafı yarıçapından ({self.radius}) büyük olamaz")
+            
+        structure = self._min_samples_structure(min_samples)
+        labels = np.full(self.n_samples, -1, dtype=np.int64)
+        core_indices = np.flatnonzero(structure['core_distance'] <= eps)
+        if len(core_indices) == 0:
+            return labels, core_indices
+            
+        # Bileşenleri en küçük çekirdek nokta indeksine göre numaralandır
+        components = self._core_components(structure, eps)
+        core_components = components[core_indices]
+        unique_components, first_seen = np.unique(core_components, return_index=True)
+        remap = np.empty(components.max() + 1, dtype=np.int64)
+        remap[unique_components[np.argsort(first_seen)]] = np.arange(len(unique_components))
+        labels[core_indices] = remap[core_components]
+        
+        # Sınır noktaları: eps içindeki çekirdek komşuların en küçük küme numarası
+        active = (structure['border_reach'] <= eps) & (eps < structure['border_core_distance'])
+        if np.any(active):
+            border_rows = structure['border_rows'][active]
+            starts = np.flatnonzero(np.concatenate([[True], border_rows[1:] != border_rows[:-1]]))
+            labels[border_rows[starts]] = np.minimum.reduceat(
+                labels[structure['border_cols'][active]], starts
+            )
+            
+        return labels, core_indices
+
+class ClusterAssigner:
+    """
+    Eğitim sırasında kurulan, yeni noktaları küme etiketlerine atayan indeks.
+    
+    Referans noktaları (DBSCAN için çekirdek noktalar, diğer algoritmalar için
+    gürültü olmayan küme üyeleri) indirgenmiş uzayda bir KD/Ball ağacında
+    tutulur; yeni nokta en yakın referans noktasının etiketini O(log n) ile
+    alır. Etiketler eğitim etiketleriyle aynıdır. radius verilirse (DBSCAN eps)
+    en yakın referans noktası bu mesafeden uzak olan noktalar gürültü (-1) olur.
+    """
+    
+    def __init__(self, reference_points: np.ndarray, reference_labels: np.ndarray,
+                 radius: Optional[float] = None):
+        """
+        Args:
+            reference_points: İndirgenmiş uzaydaki referans noktaları
+            reference_labels: Referans noktalarının küme etiketleri
+            radius: En fazla atama mesafesi (None ise sınırsız)
+        """
+        # KD-ağacı düşük boyutta, Ball-ağacı yüksek boyutta daha verimlidir
+        tree_cls = KDTree if reference_points.shape[1] <= 15 else BallTree
+        self.tree = tree_cls(reference_points)
+        self.labels = np.asarray(reference_labels)
+        self.radius = radius
+        
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Yeni noktaları etiketler.
+        
+        Args:
+            X: İndirgenmiş uzaydaki veri
+            
+        Returns:
+            np.ndarray: Küme etiketleri
+        """
+        distances, indices = self.tree.query(X, k=1)
+        labels = self.labels[indices[:, 0]]
+        if self.radius is not None:
+            labels = np.where(distances[:, 0] <= self.radius, labels, -1)
+        return labels
+
+class SweepCheckpoint:
+    """
+    Uzun aday taramaları için diskte kontrol noktası.
+    
+    Her tamamlanan aday, sonucu (model ve diziler hariç) ile birlikte
+    candidates.jsonl dosyasına tek satır olarak eklenir; yeniden başlatmada
+    bu adaylar tekrar değerlendirilmez. Taramanın o ana kadarki en iyi modeli
+    skor her iyileştiğinde best_model.joblib dosyasına atomik olarak yazılır.
+    Dizin adı veri parmak izi ve tarama ayarlarından türetilir.
+    """
+    
+    def __init__(self, checkpoint_dir: Union[str, Path], X: np.ndarray, settings: Dict):
+        """
+        Args:
+            checkpoint_dir: Kontrol noktası kök dizini
+            X: Taranacak veri (parmak izi için)
+            settings: Sonucu etkileyen tarama ayarları
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(array_fingerprint(X).encode())
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+        self.path = Path(checkpoint_dir) / digest.hexdigest()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.results_path = self.path / 'candidates.jsonl'
+        self.best_path = self.path / 'best_model.joblib'
+        self.completed = self._load()
+        
+    def _load(self) -> Dict[str, Dict]:
+        """Tamamlanmış aday sonuçlarını okur; yarım yazılmış son satır atlanır."""
+        completed = {}
+        if self.results_path.exists():
+            with open(self.results_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    completed[entry['key']] = entry['outcome']
+        return completed
+        
+    @staticmethod
+    def candidate_key(func: Callable, X: np.ndarray, params: Dict) -> str:
+        """
+        Değerlendirici, veri ve skaler parametrelerden aday anahtarı üretir.
+        
+        Args:
+            func: Aday değerlendiricisi
+            X: Adayın değerlendirildiği veri (tam veri veya alt örneklem)
+            params: Aday ve ortak parametreler (dizi değerleri anahtara girmez)
+            
+        Returns:
+            str: Aday anahtarı
+        """
+        scalars = {key: value for key, value in params.items()
+                   if not isinstance(value, (np.ndarray, RadiusNeighborGraph))}
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{func.__name__}|{X.shape}".encode())
+        digest.update(json.dumps(scalars, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+        
+    def get(self, key: str) -> Optional[Dict]:
+        """Tamamlanmış adayın sonucunu döndürür (yoksa None)."""
+        return self.completed.get(key)
+        
+    def record(self, key: str, outcome: Dict):
+        """
+        Aday sonucunu dosyaya ekler; model ve numpy dizileri kaydedilmez.
+        
+        Args:
+            key: Aday anahtarı
+            outcome: Değerlendirme sonucu
+        """
+        def to_json(value):
+            if isinstance(value, dict):
+                return {k: to_json(v) for k, v in value.items()
+                        if k != 'model' and not isinstance(v, np.ndarray)}
+            if isinstance(value, (list, tuple)):
+                return [to_json(v) for v in value]
+            if isinstance(value, np.generic):
+                return value.item()
+            return value
+            
+        entry = to_json(outcome)
+        self.completed[key] = entry
+        with open(self.results_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'key': key, 'outcome': entry}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+            
+    def save_best(self, score: float, model, params: Dict):
+        """En iyi modeli geçici dosya üzerinden atomik olarak yazar."""
+        tmp_path = self.best_path.with_suffix('.tmp')
+        joblib.dump({'score': score, 'model': model, 'params': params}, tmp_path)
+        tmp_path.replace(self.best_path)
+        
+    def load_best(self) -> Optional[Dict]:
+        """Kaydedilmiş en iyi modeli döndürür (yoksa None)."""
+        try:
+            return joblib.load(self.best_path)
+        except (FileNotFoundError, EOFError):
+            return None
+
+def array_fingerprint(X: np.ndarray) -> str:
+    """
+    Veri matrisinin içeriğine dayalı hızlı bir parmak izi üretir.
+    
+    Args:
+        X: Veri matrisi
+        
+    Returns:
+        str: Şekil, veri tipi ve içerikten türetilen özet
+    """
+    X = np.ascontiguousarray(X)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{X.shape}|{X.dtype.str}".encode())
+    digest.update(memoryview(X).cast('B'))
+    return digest.hexdigest()
+
+def cut_linkage(linkage_matrix: np.ndarray, n_clusters: int) -> np.ndarray:
+    """
+    Hazır bir bağlantı matrisini istenen küme sayısında keser.
+    
+    Kesim birleşme sırasına göre yapılır (ilk n - k birleşme uygulanır), bu
+    yüzden eşit birleşme yüksekliklerinde de tam olarak k küme elde edilir.
+    
+    Args:
+        linkage_matrix: scipy formatında bağlantı matrisi
+        n_clusters: Küme sayısı
+        
+    Returns:
+        np.ndarray: 0'dan başlayan küme etiketleri
+    """
+    n_samples = len(linkage_matrix) + 1
+    merge_order = np.arange(len(linkage_matrix), dtype=np.float64)
+    labels = fcluster(linkage_matrix, t=n_samples - n_clusters - 1,
+                      criterion='monocrit', monocrit=merge_order)
+    return labels - 1
+
+def truncate_components(pca: Union[PCA, IncrementalPCA], n_components: int):
+    """
+    Eğitilmiş bir PCA/IncrementalPCA nesnesini ilk n_components bileşene indirger.
+    
+    Args:
+        pca: Eğitilmiş PCA nesnesi
+        n_components: Korunacak bileşen sayısı
+        
+    Returns:
+        Aynı nesne (yerinde güncellenir)
+    """
+    pca.components_ = pca.components_[:n_components]
+    pca.explained_variance_ = pca.explained_variance_[:n_components]
+    pca.explained_variance_ratio_ = pca.explained_variance_ratio_[:n_components]
+    pca.singular_values_ = pca.singular_values_[:n_components]
+    pca.n_components_ = n_components
+    pca.n_components = n_components
+    return pca
+
+def _update_reservoir(reservoir: np.ndarray, batch: np.ndarray, n_seen: int,
+                      rng: np.random.Generator) -> int:
+    """
+    Batch'i rezervuar örneklemine ekler (vektörel Algorithm R).
+    
+    Args:
+        reservoir: Sabit boyutlu örneklem dizisi (yerinde güncellenir)
+        batch: Yeni batch
+        n_seen: Şu ana kadar görülen örnek sayısı
+        rng: Rastgele sayı üreteci
+        
+    Returns:
+        int: Güncel görülen örnek sayısı
+    """
+    capacity = len(reservoir)
+    positions = n_seen + np.arange(len(batch))
+    
+    # Rezervuar dolana kadar doğrudan yaz
+    fill = positions < capacity
+    reservoir[positions[fill]] = batch[fill]
+    
+    # Sonrasında i. örnek capacity / (i + 1) olasılıkla rastgele bir yuvaya yazılır
+    rest = ~fill
+    if np.any(rest):
+        slots = rng.integers(0, positions[rest] + 1)
+        keep = slots < capacity
+        reservoir[slots[keep]] = batch[rest][keep]
+        
+    return n_seen + len(batch)
+
+def build_coreset(X: np.ndarray, size: int,
+                  random_state: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    K-Means için ağırlıklı hafif bir coreset oluşturur.
+    
+    Noktalar q(x) = 1/(2n) + d(x, μ)² / (2 Σ d²) önem olasılığıyla iadeli
+    seçilir ve 1 / (size · q(x)) ile ağırlıklandırılır (Bachem vd., 2018);
+    böylece her merkez kümesi için ağırlıklı K-Means maliyeti tüm veri
+    üzerindeki maliyetin yansız bir tahminidir. Merkezden uzak noktalar (hassasiyeti
+    yüksek olanlar) daha sık seçilir, küçük ama uzak kümeler kaybolmaz.
+    
+    Args:
+        X: Veri matrisi
+        size: Coreset boyutu
+        random_state: Rastgele sayı üreteci için tohum değeri
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Coreset noktaları ve ağırlıkları
+    """
+    n = len(X)
+    if size >= n:
+        return X, np.ones(n)
+        
+    residuals = X - X.mean(axis=0)
+    sq_distances = np.einsum('ij,ij->i', residuals, residuals).astype(np.float64)
+    total = sq_distances.sum()
+    probabilities = 0.5 / n + (0.5 * sq_distances / total if total > 0 else 0.5 / n)
+    probabilities /= probabilities.sum()
+    
+    rng = np.random.default_rng(random_state)
+    idx = rng.choice(n, size=size, replace=True, p=probabilities)
+    return X[idx], 1.0 / (size * probabilities[idx])
+
+def compute_sample_weights(X: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """
+    Veri dengesizliğini ele almak için örnek ağırlıkları hesaplar.
+    
+    Args:
+        X: Veri matrisi
+        labels: Küme etiketleri
+        
+    Returns:
+        np.ndarray: Örnek ağırlıkları
+    """
+    # Küme boyutlarını hesapla
+    unique_labels, counts = np.unique(labels[labels != -1], return_counts=True)
+    
+    if len(unique_labels) == 0:
+        return np.ones(len(X))
+        
+    # Her küme için ağırlık hesapla (küçük kümeler daha yüksek ağırlık alır)
+    weights_per_cluster = {
+        label: 1.0 / count
+        for label, count in zip(unique_labels, counts)
+    }
+    
+    # Her örnek için ağırlık ata
+    sample_weights = np.ones(len(X))
+    for label in unique_labels:
+        mask = labels == label
+        sample_weights[mask] = weights_per_cluster[label]
+        
+    # Gürültü noktaları (-1) için ortalama ağırlık kullan
+    noise_mask = labels == -1
+    if np.any(noise_mask):
+        sample_weights[noise_mask] = np.mean(list(weights_per_cluster.values()))
+        
+    # Ağırlıkları normalize et
+    sample_weights /= np.sum(sample_weights)
+    sample_weights *= len(X)
+    
+    return sample_weights
+
+def _sampled_silhouettes(X: np.ndarray, strata: np.ndarray, counts: np.ndarray,
+                         idx: np.ndarray) -> np.ndarray:
+    """
+    Seçilen noktaların silhouette değerlerini tüm veriye göre hesaplar.
+    
+    Noktalar kümelere göre sıralanır; her bellek parçasında seçilen noktaların
+    tüm noktalara uzaklıkları küme aralıklarında toplanır (np.add.reduceat).
+    Sonuçlar sklearn silhouette_samples ile aynıdır.
+    
+    Args:
+        X: Veri matrisi
+        strata: 0..k-1 aralığındaki küme indeksleri
+        counts: Küme boyutları
+        idx: Silhouette değeri hesaplanacak noktalar
+        
+    Returns:
+        np.ndarray: Seçilen noktaların silhouette değerleri
+    """
+    order = np.argsort(strata, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    X_sorted = X[order]
+    
+    sums = np.concatenate(list(pairwise_distances_chunked(
+        X[idx], X_sorted, reduce_func=lambda chunk, _: np.add.reduceat(chunk, starts, axis=1)
+    )))
+    
+    own = strata[idx]
+    rows = np.arange(len(idx))
+    # Kendine uzaklık 0 olduğundan küme içi ortalama n_c - 1 noktaya bölünür
+    a = sums[rows, own] / np.maximum(counts[own] - 1, 1)
+    other = sums / counts
+    other[rows, own] = np.inf
+    b = other.min(axis=1)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sil = np.nan_to_num((b - a) / np.maximum(a, b))
+    # Tek noktalı kümelerin silhouette değeri sklearn'deki gibi 0'dır
+    sil[counts[own] == 1] = 0.0
+    return sil
+
+def estimate_silhouette(X: np.ndarray, labels: np.ndarray,
+                        sample_size: Optional[int] = None,
+                        sample_weights: Optional[np.ndarray] = None,
+                        confidence: float = 0.95,
+                        random_state: int = 42) -> Tuple[float, float, float]:
+    """
+    Silhouette skorunu kümelere göre tabakalı bir örneklem üzerinde tahmin eder.
+    
+    Her kümeden boyutuyla orantılı (en az 2) nokta seçilir ve yalnızca bu
+    noktaların silhouette değerleri tüm veriye göre (kesin a(i) ve b(i) ile)
+    hesaplanır; böylece O(n²) maliyet O(sample_size · n) olur. Örneklenen
+    değerler tam veri silhouette değerleri olduğundan tahmin yansızdır ve güven
+    aralığı tabakalı ortalama tahmincisinin varyansından (sonlu popülasyon
+    düzeltmesiyle) normal yaklaşımla bulunur. Veri örneklem boyutundan
+    küçükse kesin skor hesaplanır.
+    
+    Args:
+        X: Veri matrisi
+        labels: Küme etiketleri
+        sample_size: Örneklem boyutu (None ise kesin hesaplama)
+        sample_weights: Ortalama için örnek ağırlıkları
+        confidence: Güven düzeyi
+        random_state: Rastgele sayı üreteci için tohum değeri
+        
+    Returns:
+        Tuple[float, float, float]: Tahmin, güven aralığı alt ve üst sınırı
+    """
+    n = len(X)
+    if sample_size is None or n <= sample_size:
+        sil_samples = silhouette_samples(X, labels)
+        if sample_weights is not None:
+            silhouette = np.average(sil_samples, weights=sample_weights)
+        else:
+            silhouette = np.mean(sil_samples)
+        return silhouette, silhouette, silhouette
+    
+    if sample_weights is None:
+        sample_weights = np.ones(n)
+        
+    # Orantılı dağıtım; tek noktalı kümeler dışında her küme en az 2 noktayla temsil edilir
+    _, strata, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    alloc = np.minimum(counts, np.maximum(2, np.round(sample_size * counts / n).astype(int)))
+    
+    rng = np.random.default_rng(random_state)
+    order = np.argsort(strata, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    idx = np.concatenate([
+        rng.choice(order[start:start + count], size=size, replace=False)
+        for start, count, size in zip(starts, counts, alloc)
+    ])
+    
+    sil_samples = _sampled_silhouettes(X, strata, counts, idx)
+    sample_strata = strata[idx]
+    w = sample_weights[idx]
+    
+    # Tabaka ağırlıkları tüm veri üzerindeki toplam örnek ağırlıklarından gelir
+    stratum_weights = np.bincount(strata, weights=sample_weights)
+    stratum_weights /= stratum_weights.sum()
+    
+    means = (np.bincount(sample_strata, weights=w * sil_samples) /
+             np.bincount(sample_strata, weights=w))
+    residuals = sil_samples - means[sample_strata]
+    variances = np.bincount(sample_strata, weights=residuals ** 2) / np.maximum(alloc - 1, 1)
+    
+    silhouette = np.sum(stratum_weights * means)
+    std_error = np.sqrt(np.sum(stratum_weights ** 2 * (1 - alloc / counts) * variances / alloc))
+    margin = norm.ppf(0.5 + confidence / 2) * std_error
+    
+    return silhouette, silhouette - margin, silhouette + margin
+
+def compute_cluster_metrics(X: np.ndarray, labels: np.ndarray,
+                            sample_weight: Optional[np.ndarray] = None) -> Dict[str, float]:
+    """
+    Calinski-Harabasz, Davies-Bouldin ve inertia skorlarını küme istatistiklerinden hesaplar.
+    
+    Küme başına sayım ve toplamlar (yeterli istatistikler) np.bincount ile tek
+    geçişte toplanır; merkezler bunlardan elde edilir. Noktaların kendi
+    merkezlerine uzaklıkları ikinci vektörel geçişte bir kez hesaplanır ve üç
+    metrik tarafından paylaşılır. Küme içi kareler toplamı Σx² - |S|²/n yerine
+    doğrudan artıklardan alınır, böylece sayısal iptal hatası oluşmaz.
+    Sonuçlar sklearn'ün calinski_harabasz_score ve davies_bouldin_score
+    fonksiyonlarıyla aynıdır.
+    
+    sample_weight verilirse (ör. coreset ağırlıkları) her nokta ağırlığı kadar
+    tekrarlanmış gibi sayılır; sayımlar, merkezler ve kareler toplamı ağırlıklıdır.
+    
+    Args:
+        X: Veri matrisi
+        labels: Küme etiketleri (en az 2 küme)
+        sample_weight: Örnek ağırlıkları
+        
+    Returns:
+        Dict[str, float]: 'calinski', 'davies' ve 'inertia' değerleri
+    """
+    n_samples, n_features = X.shape
+    _, inverse = np.unique(labels, return_inverse=True)
+    n_labels = inverse.max() + 1
+    
+    # Yeterli istatistikler: küme boyutları ve küme başına toplamlar
+    if sample_weight is None:
+        counts = np.bincount(inverse, minlength=n_labels).astype(np.float64)
+    else:
+        sample_weight = np.asarray(sample_weight, dtype=np.float64)
+        counts = np.bincount(inverse, weights=sample_weight, minlength=n_labels)
+        n_samples = counts.sum()
+    sums = np.empty((n_labels, n_features), dtype=np.float64)
+    for j in range(n_features):
+        column = X[:, j] if sample_weight is None else X[:, j] * sample_weight
+        sums[:, j] = np.bincount(inverse, weights=column, minlength=n_labels)
+    centroids = sums / counts[:, None]
+    overall_mean = sums.sum(axis=0) / n_samples
+    
+    # Kendi merkezine uzaklıklar: tüm metrikler bu tek geçişi paylaşır
+    residuals = X - centroids[inverse].astype(X.dtype, copy=False)
+    sq_distances = np.einsum('ij,ij->i', residuals, residuals)
+    distances = np.sqrt(sq_distances)
+    if sample_weight is not None:
+        sq_distances = sq_distances * sample_weight
+        distances = distances * sample_weight
+    within = np.bincount(inverse, weights=sq_distances, minlength=n_labels)
+    intra_dists = np.bincount(inverse, weights=distances, minlength=n_labels) / counts
+    
+    inertia = float(within.sum())
+    between = float(np.sum(counts * np.sum((centroids - overall_mean) ** 2, axis=1)))
+    calinski = (1.0 if inertia == 0.0 else
+                between * (n_samples - n_labels) / (inertia * (n_labels - 1.0)))
+    
+    centroid_sq_norms = np.einsum('ij,ij->i', centroids, centroids)
+    centroid_distances = np.sqrt(np.maximum(
+        centroid_sq_norms[:, None] + centroid_sq_norms[None, :] - 2 * centroids @ centroids.T, 0
+    ))
+    np.fill_diagonal(centroid_distances, 0)
+    if np.allclose(intra_dists, 0) or np.allclose(centroid_distances, 0):
+        davies = 0.0
+    else:
+        centroid_distances[centroid_distances == 0] = np.inf
+        combined_intra = intra_dists[:, None] + intra_dists[None, :]
+        davies = float(np.mean(np.max(combined_intra / centroid_distances, axis=1)))
+        
+    return {'calinski': float(calinski), 'davies': davies, 'inertia': inertia}
+
+def _score_labels(X: np.ndarray, labels: np.ndarray,
+                  sample_weights: Optional[np.ndarray] = None,
+                  silhouette_sample_size: Optional[int] = None,
+                  silhouette_confidence: float = 0.95,
+                  point_weights: Optional[np.ndarray] = None) -> Dict:
+    """
+    Verilen etiketler için kalite metriklerini hesaplar.
+    
+    Args:
+        X: Veri matrisi
+        labels: Küme etiketleri (en az 2 küme)
+        sample_weights: Silhouette ortalaması için örnek ağırlıkları
+        silhouette_sample_size: Örneklemli silhouette için örneklem boyutu
+        silhouette_confidence: Silhouette güven aralığı düzeyi
+        point_weights: Nokta ağırlıkları (ör. coreset); tüm metriklerde kullanılır
+        
+    Returns:
+        Dict: Silhouette (ve güven aralığı), Calinski-Harabasz, Davies-Bouldin,
+            inertia ve metrik hesaplama süresi
+    """
+    start = time.perf_counter()
+    if point_weights is not None:
+        sample_weights = (point_weights if sample_weights is None
+                          else sample_weights * point_weights)
+    # Silhouette score için sample_weight'i sadece ortalama hesaplamada kullan
+    silhouette, ci_low, ci_high = estimate_silhouette(
+        X, labels,
+        sample_size=silhouette_sample_size,
+        sample_weights=sample_weights,
+        confidence=silhouette_confidence
+    )
+        
+    # Coreset çalıştırmalarında Calinski-Harabasz, Davies-Bouldin ve inertia
+    # bilerek nokta ağırlıklarıyla hesaplanır (tüm veri maliyetinin tahmini)
+    scores = {
+        'silhouette': silhouette,
+        'silhouette_ci': (ci_low, ci_high),
+        **compute_cluster_metrics(X, labels, point_weights)
+    }
+    scores['metric_time'] = time.perf_counter() - start
+    return scores
+
+_EMPTY_SCORES = {'silhouette': 0, 'silhouette_ci': (0, 0), 'calinski': 0,
+                 'davies': float('inf'), 'inertia': 0, 'metric_time': 0.0}
+
+def _score_kmeans_labels(X: np.ndarray, labels: np.ndarray, n_clusters: int,
+                         handle_imbalance: bool = False, **score_options) -> Dict:
+    """Eğitilmiş bir K-Means adayının etiketlerini değerlendirir."""
+    if n_clusters > 1:  # Silhouette score en az 2 küme gerektirir
+        sample_weights = compute_sample_weights(X, labels) if handle_imbalance else None
+        return _score_labels(X, labels, sample_weights, **score_options)
+    # Tek küme için inertia modelin kendi değerinden gelir
+    return {key: value for key, value in _EMPTY_SCORES.items() if key != 'inertia'}
+
+def _evaluate_kmeans(X: np.ndarray, n_clusters: int, n_init: int = 10,
+                     handle_imbalance: bool = False,
+                     point_weights: Optional[np.ndarray] = None, **score_options) -> Dict:
+    """Tek bir K-Means adayını (varsa nokta ağırlıklarıyla) eğitir ve değerlendirir."""
+    start = time.perf_counter()
+    model = KMeans(n_clusters=n_clusters, n_init=n_init, random_state=42)
+    labels = model.fit_predict(X, sample_weight=point_weights)
+    
+    outcome = {'model': model, 'inertia': model.inertia_,
+               'fit_time': time.perf_counter() - start}
+    outcome.update(_score_kmeans_labels(X, labels, n_clusters, handle_imbalance,
+                                        point_weights=point_weights, **score_options))
+    return outcome
+
+def _split_kmeans_centers(X: np.ndarray, centers: np.ndarray, labels: np.ndarray,
+                          n_clusters: int, rank: int = 0,
+                          sample_weight: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Mevcut merkezlerden daha fazla küme için başlangıç merkezleri üretir.
+    
+    Her adımda en yüksek SSE'ye sahip küme (ilk adımda rank'inci en yüksek)
+    ana ekseni boyunca ikiye bölünür; yeni merkezler küme ortalamasının
+    ±sqrt(2λ/π)·v kadar ötesine yerleştirilir (λ, v: en büyük özdeğer ve vektör).
+    
+    Args:
+        X: Veri matrisi
+        centers: Mevcut küme merkezleri
+        labels: Mevcut küme etiketleri
+        n_clusters: Hedef küme sayısı
+        rank: İlk bölmede seçilecek kümenin SSE sırası
+        sample_weight: Nokta ağırlıkları (ör. coreset); SSE ve kovaryans ağırlıklıdır
+        
+    Returns:
+        np.ndarray: n_clusters adet başlangıç merkezi
+    """
+    if sample_weight is None:
+        sample_weight = np.ones(len(X))
+    centers = np.array(centers, copy=True)
+    while len(centers) < n_clusters:
+        residuals = np.einsum('ij,ij->i', X - centers[labels], X - centers[labels])
+        sse = np.bincount(labels, weights=residuals * sample_weight, minlength=len(centers))
+        order = np.argsort(sse)[::-1]
+        target = order[min(rank, len(order) - 1)]
+        rank = 0
+        
+        members = labels == target
+        points = X[members]
+        if len(points) > 1:
+            covariance = np.cov(points, rowvar=False, aweights=sample_weight[members])
+            eigvals, eigvecs = np.linalg.eigh(np.atleast_2d(covariance))
+            offset = eigvecs[:, -1] * np.sqrt(2 * max(eigvals[-1], 0) / np.pi)
+            new_center = centers[target] + offset
+            centers[target] = centers[target] - offset
+        else:
+            # Bölünemeyen küme: merkezine en uzak noktayı yeni merkez yap
+            new_center = X[np.argmax(residuals)]
+            
+        centers = np.vstack([centers, new_center.astype(centers.dtype)])
+        labels = pairwise_distances_argmin(X, centers)
+        
+    return centers
+
+def _evaluate_dbscan(X: np.ndarray, eps: float, min_samples: int,
+                     graph: RadiusNeighborGraph, handle_imbalance: bool = False,
+                     **score_options) -> Dict:
+    """Tek bir DBSCAN adayının etiketlerini ortak komşuluk grafından türetir ve değerlendirir."""
+    labels, core_indices = graph.dbscan_labels(eps, min_samples)
+    
+    # Eğitilmiş bir DBSCAN nesnesiyle aynı özniteliklere sahip model
+    model = DBSCAN(eps=eps, min_samples=min_samples)
+    model.labels_ = labels
+    model.core_sample_indices_ = core_indices
+    model.components_ = X[core_indices].copy()
+    
+    return {'model': model, **_score_density_labels(X, labels, handle_imbalance, **score_options)}
+
+def _fit_dbscan(X: np.ndarray, eps: float, min_samples: int, handle_imbalance: bool = False,
+                **score_options) -> Dict:
+    """Komşuluk grafı için fazla yoğun bir DBSCAN adayını sklearn ile eğitir ve değerlendirir."""
+    model = DBSCAN(eps=eps, min_samples=min_samples).fit(X)
+    return {'model': model, **_score_density_labels(X, model.labels_, handle_imbalance, **score_options)}
+
+def _score_density_labels(X: np.ndarray, labels: np.ndarray, handle_imbalance: bool = False,
+                          **score_options) -> Dict:
+    """Gürültü (-1) içeren yoğunluk tabanlı etiketleri gürültü hariç değerlendirir."""
+    outcome = {'n_clusters': 0, **_EMPTY_SCORES}
+    
+    # Gürültü noktalarını (-1) hariç tut
+    valid_points = labels != -1
+    if np.sum(valid_points) > 1:  # En az 2 geçerli nokta olmalı
+        X_valid = X[valid_points]
+        labels_valid = labels[valid_points]
+        
+        outcome['n_clusters'] = len(set(labels_valid))
+        if outcome['n_clusters'] > 1:  # En az 2 küme olmalı
+            sample_weights = (compute_sample_weights(X_valid, labels_valid)
+                              if handle_imbalance else None)
+            outcome.update(_score_labels(X_valid, labels_valid, sample_weights,
+                                         **score_options))
+    return outcome
+
+def _evaluate_hdbscan(X: np.ndarray, min_samples: int, min_cluster_size: int,
+                      cut_distances: List[float], handle_imbalance: bool = False,
+                      **score_options) -> Dict:
+    """
+    HDBSCAN'i bir kez eğitir ve ağaçtan tüm yoğunluk seviyelerini değerlendirir.
+    
+    Otomatik (EOM) seçim ile her kesim mesafesindeki DBSCAN* kümelemesi aynı
+    karşılıklı erişilebilirlik ağacından, yeniden eğitim yapılmadan çıkarılır.
+    """
+    start = time.perf_counter()
+    model = HDBSCAN(min_cluster_size=min_cluster_size, min_samples=min_samples).fit(X)
+    fit_time = time.perf_counter() - start
+    
+    selections = [('eom', None, model.labels_)]
+    selections += [('cut', cut, model.dbscan_clustering(cut, min_cluster_size=min_cluster_size))
+                   for cut in cut_distances]
+    
+    outcome = {'model': model, 'fit_time': fit_time, 'metric_time': 0.0, 'selections': []}
+    for selection, cut, labels in selections:
+        scores = _score_density_labels(X, labels, handle_imbalance, **score_options)
+        outcome['metric_time'] += scores['metric_time']
+        outcome['selections'].append({'selection': selection, 'cut_distance': cut,
+                                      'labels': labels, **scores})
+    return outcome
+
+def _evaluate_hierarchical(X: np.ndarray, n_clusters: int, linkage_matrix: np.ndarray,
+                           linkage: str = 'ward', **score_options) -> Dict:
+    """Ortak hiyerarşik ağacı verilen küme sayısında keser ve değerlendirir."""
+    labels = cut_linkage(linkage_matrix, n_clusters)
+    
+    # Eğitilmiş bir AgglomerativeClustering nesnesiyle aynı özniteliklere sahip model
+    model = AgglomerativeClustering(n_clusters=n_clusters, linkage=linkage)
+    model.labels_ = labels
+    model.n_clusters_ = n_clusters
+    model.n_leaves_ = len(X)
+    model.n_connected_components_ = 1
+    model.children_ = linkage_matrix[:, :2].astype(np.intp)
+    model.distances_ = linkage_matrix[:, 2].copy()
+    
+    outcome = {'model': model}
+    if n_clusters > 1:
+        outcome.update(_score_labels(X, labels, **score_options))
+    else:
+        outcome.update(_EMPTY_SCORES)
+    return outcome
+
+def _profile_candidate(func: Callable, X: np.ndarray, track_memory: bool = False,
+                       **kwargs) -> Dict:
+    """
+    Aday değerlendiricisini çalıştırır; süre ve tepe bellek bilgisini ekler.
+    
+    Değerlendirici fit_time vermezse toplam süreden metrik süresi çıkarılarak
+    bulunur. Tepe bellek tracemalloc ile ölçülür; dışarıda zaten bir ölçüm
+    sürüyorsa (ör. benchmark) onu bozmamak için ölçülmez (None).
+    
+    Args:
+        func: Aday değerlendiricisi
+        X: Veri matrisi
+        track_memory: Tepe bellek ölçülsün mü
+        **kwargs: Değerlendirici parametreleri
+        
+    Returns:
+        Dict: Değerlendirme sonucu, 'fit_time', 'metric_time' ve 'peak_memory_mb'
+    """
+    track_memory = track_memory and not tracemalloc.is_tracing()
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        outcome = func(X, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if track_memory else None
+        if track_memory:
+            tracemalloc.stop()
+            
+    outcome.setdefault('metric_time', 0.0)
+    outcome.setdefault('fit_time', max(elapsed - outcome['metric_time'], 0.0))
+    outcome['peak_memory_mb'] = peak / 1024 ** 2 if peak is not None else None
+    return outcome
+
 class ClusteringOptimizer:
     """Kümeleme algoritmalarını optimize eden ve değerlendiren sınıf."""
     
@@ -91,6 +1261,44 @@ class ClusteringOptimizer:
         self.best_params = {}
         self.pca = None
         self.scaler = StandardScaler()
+        # Son eğitimin aşama süreleri (sn): scale, pca, sweep, metrics (ve parçalı eğitimde refine)
+        # ve aday bazında süre/bellek profili (bkz. _run_candidates)
+        self._reset_profile()
+        # Tarama kontrol noktası (config['checkpoint_dir'] verilirse _search_models açar)
+        self.checkpoint_ = None
+        # Aday bazında tepe bellek ölçümü (tracemalloc ek yük getirir)
+        self.profile_memory = self.config.get('profile_memory', False)
+        # predict metodu olmayan modeller için atama indeksi
+        self.assignment_index_ = None
+        # Hiyerarşik kümeleme için bir kez hesaplanan bağlantı matrisi
+        self.linkage_matrix_ = None
+        self._linkage_key = None
+        # Aday değerlendirmesi için paralel süreç sayısı (-1: tüm çekirdekler)
+        self.n_jobs = self.config.get('n_jobs', 1)
+        # Silhouette hesaplama modu ('exact' veya 'sampled')
+        self.silhouette_mode = self.config.get('silhouette_mode', 'exact')
+        if self.silhouette_mode not in ('exact', 'sampled'):
+            raise ValueError(f"Desteklenmeyen silhouette modu: {self.silhouette_mode}")
+        # Yoğunluk tabanlı arama ('dbscan' eps ızgarası veya 'hdbscan' hiyerarşisi)
+        self.density_search = self.config.get('density_search', 'dbscan')
+        if self.density_search not in ('dbscan', 'hdbscan'):
+            raise ValueError(f"Desteklenmeyen yoğunluk araması: {self.density_search}")
+        # DBSCAN komşuluk grafında tutulabilecek en fazla kenar sayısı
+        self.dbscan_max_edges = self.config.get('dbscan_max_edges', 5_000_000)
+        # DBSCAN komşuluk arama motoru ('auto', 'sklearn' veya 'grid')
+        self.dbscan_engine = self.config.get('dbscan_engine', 'auto')
+        if self.dbscan_engine not in ('auto', 'sklearn', 'grid'):
+            raise ValueError(f"Desteklenmeyen DBSCAN motoru: {self.dbscan_engine}")
+        # PCA çözücüsü ('full' veya geniş matrisler için 'randomized')
+        self.pca_solver = self.config.get('pca_solver', 'full')
+        if self.pca_solver not in ('full', 'randomized'):
+            raise ValueError(f"Desteklenmeyen PCA çözücüsü: {self.pca_solver}")
+        # Boyut azaltma sonuçları için disk önbelleği (dizin verilmezse kapalı)
+        cache_dir = self.config.get('embedding_cache_dir')
+        self.embedding_cache = (EmbeddingCache(cache_dir, self.config.get('embedding_cache_max_mb', 1024))
+                                if cache_dir else None)
+        # Tüm pipeline boyunca kullanılacak kayan nokta tipi ('float32' veya 'float64')
+        self.dtype = resolve_dtype(self.config.get('dtype', 'float64'))
         
     def _setup_logger(self) -> logging.Logger:
         """Logger ayarlarını yapılandırır."""
@@ -103,213 +1311,741 @@ class ClusteringOptimizer:
             logger.addHandler(handler)
         return logger
     
-    def apply_pca(self, X: np.ndarray, n_components: Optional[int] = None,
-                  variance_ratio: float = 0.95) -> Tuple[np.ndarray, PCA]:
+    def apply_pca(self, X: np.ndarray, n_components: Optional[int] = None,
+                  variance_ratio: float = 0.95) -> Tuple[np.ndarray, PCA]:
+        """
+        PCA uygular.
+        
+        config['pca_solver'] 'randomized' ise tam SVD yerine rastgele SVD kullanılır;
+        bileşen sayısı verilmemişse rank (config['pca_initial_rank'], varsayılan 8)
+        varyans hedefi karşılanana kadar ikiye katlanır ve hedefi sağlayan en
+        küçük bileşen sayısına indirilir.
+        
+        Args:
+            X: Veri matrisi
+            n_components: Bileşen sayısı (None ise variance_ratio kullanılır)
+            variance_ratio: Korunacak varyans oranı
+            
+        Returns:
+            Tuple[np.ndarray, PCA]: Dönüştürülmüş veri ve PCA nesnesi
+        """
+        if self.pca_solver == 'randomized' and n_components is None:
+            X_pca, pca = self._fit_randomized_pca(X, variance_ratio)
+        else:
+            if n_components is None:
+                pca = PCA(n_components=variance_ratio, svd_solver='full')
+            elif self.pca_solver == 'randomized':
+                pca = PCA(n_components=n_components, svd_solver='randomized', random_state=42)
+            else:
+                pca = PCA(n_components=n_components)
+            X_pca = pca.fit_transform(X)
+        self.pca = pca
+        
+        explained_var = np.sum(pca.explained_variance_ratio_)
+        self.logger.info(f"PCA sonrası açıklanan varyans: {explained_var:.4f}")
+        self.logger.info(f"Seçilen bileşen sayısı: {pca.n_components_}")
+        
+        return X_pca, pca
+    
+    def _fit_randomized_pca(self, X: np.ndarray,
+                            variance_ratio: float) -> Tuple[np.ndarray, PCA]:
+        """
+        Varyans hedefini karşılayana kadar rankı artırarak rastgele SVD ile PCA eğitir.
+        
+        Veri bir kez merkezlenir ve toplam varyans bir kez hesaplanır; her rank
+        denemesi yalnızca rastgele SVD'nin matris çarpımlarını tekrarlar. Güç
+        iterasyonu sayısı config['pca_power_iterations'] (varsayılan 2) ile ayarlanır.
+        
+        Args:
+            X: Veri matrisi
+            variance_ratio: Korunacak varyans oranı
+            
+        Returns:
+            Tuple[np.ndarray, PCA]: Dönüştürülmüş veri ve hedefi sağlayan en küçük
+                bileşen sayısına indirilmiş PCA nesnesi
+        """
+        n_samples, n_features = X.shape
+        max_rank = min(n_samples, n_features)
+        rank = min(self.config.get('pca_initial_rank', 8), max_rank)
+        n_iter = self.config.get('pca_power_iterations', 2)
+        
+        mean = X.mean(axis=0)
+        X_centered = X - mean
+        total_var = np.einsum('ij,ij->', X_centered, X_centered) / (n_samples - 1)
+        
+        while True:
+            if rank >= max_rank:
+                # Rank tam boyuta ulaştıysa rastgele SVD'nin avantajı kalmaz
+                pca = PCA(n_components=variance_ratio, svd_solver='full')
+                return pca.fit_transform(X), pca
+                
+            U, S, Vt = randomized_svd(X_centered, rank, n_iter=n_iter,
+                                      flip_sign=False, random_state=42)
+            explained_variance = S ** 2 / (n_samples - 1)
+            cumulative = np.cumsum(explained_variance) / total_var
+            self.logger.info(f"Rastgele SVD rank={rank}: açıklanan varyans {cumulative[-1]:.4f}")
+            if cumulative[-1] >= variance_ratio:
+                break
+            rank = min(2 * rank, max_rank)
+            
+        # Tam çözücüyle aynı seçim kuralı ve işaret düzeni
+        n_components = min(int(np.searchsorted(cumulative, variance_ratio, side='right') + 1), rank)
+        U, Vt = svd_flip(U, Vt, u_based_decision=False)
+        
+        pca = PCA(n_components=n_components, svd_solver='randomized', random_state=42)
+        pca.mean_ = mean
+        pca.components_ = Vt[:n_components]
+        pca.explained_variance_ = explained_variance[:n_components]
+        pca.explained_variance_ratio_ = explained_variance[:n_components] / total_var
+        pca.singular_values_ = S[:n_components]
+        pca.noise_variance_ = ((total_var - explained_variance[:n_components].sum())
+                               / max(max_rank - n_components, 1))
+        pca.n_components_ = n_components
+        pca.n_samples_ = n_samples
+        pca.n_features_in_ = n_features
+        
+        X_pca = U[:, :n_components] * S[:n_components]
+        return X_pca.astype(X.dtype, copy=False), pca
+    
+    def compute_sample_weights(self, X: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        """
+        Veri dengesizliğini ele almak için örnek ağırlıkları hesaplar.
+        
+        Args:
+            X: Veri matrisi
+            labels: Küme etiketleri
+            
+        Returns:
+            np.ndarray: Örnek ağırlıkları
+        """
+        return compute_sample_weights(X, labels)
+    
+    def _run_candidates(self, func: Callable, X: np.ndarray, candidates: List[Dict],
+                        desc: str, selects_best: bool = True, **shared) -> Iterator[Dict]:
+        """
+        Aday parametre kombinasyonlarını değerlendirir.
+        
+        n_jobs 1'den farklıysa adaylar süreç havuzuna dağıtılır; büyük veri
+        matrisi işçilere kopyalanmak yerine salt okunur memmap olarak paylaşılır.
+        Sonuçlar tamamlanma sırasından bağımsız olarak aday sırasıyla döner.
+        
+        Kontrol noktası açıksa tamamlanmış adaylar diskten döner (model None).
+        Sonuç en iyi model seçiminde kullanılıyorsa (selects_best) ve kayıtlı
+        skor mevcut en iyi skoru aşıyorsa aday yeniden değerlendirilir; böylece
+        sonucu yazılıp modeli kaydedilemeden kesilen aday da kaybolmaz.
+        
+        Args:
+            func: Tek bir adayı değerlendiren modül seviyesinde fonksiyon
+            X: Veri matrisi
+            candidates: Aday parametre sözlükleri
+            desc: İlerleme çubuğu açıklaması
+            selects_best: Sonuçlar en iyi model seçiminde kullanılıyor mu
+            **shared: Tüm adaylar için ortak parametreler
+            
+        Yields:
+            Dict: Her aday için değerlendirme sonucu
+        """
+        stored = [None] * len(candidates)
+        keys = [None] * len(candidates)
+        if self.checkpoint_ is not None:
+            for i, candidate in enumerate(candidates):
+                keys[i] = SweepCheckpoint.candidate_key(func, X, {**shared, **candidate})
+                outcome = self.checkpoint_.get(keys[i])
+                if outcome is not None and (not selects_best or
+                                            self._outcome_score(outcome) <= self.best_score):
+                    stored[i] = outcome
+            n_resumed = sum(outcome is not None for outcome in stored)
+            if n_resumed:
+                self.logger.info(f"{desc}: {n_resumed}/{len(candidates)} aday kontrol noktasından alındı")
+        pending = [candidate for candidate, outcome in zip(candidates, stored) if outcome is None]
+        
+        track_memory = self.profile_memory
+        if self.n_jobs == 1 or len(pending) < 2:
+            outcomes = (_profile_candidate(func, X, track_memory, **shared, **candidate)
+                        for candidate in pending)
+        else:
+            parallel = Parallel(
+                n_jobs=self.n_jobs,
+                max_nbytes=self.config.get('max_nbytes', '1M'),
+                mmap_mode='r',
+                return_as='generator'
+            )
+            outcomes = parallel(
+                delayed(_profile_candidate)(func, X, track_memory, **shared, **candidate)
+                for candidate in pending
+            )
+        outcomes = iter(tqdm(outcomes, total=len(pending), desc=desc))
+            
+        for candidate, key, outcome in zip(candidates, keys, stored):
+            if outcome is not None:
+                yield {**outcome, 'model': None}
+                continue
+            outcome = next(outcomes)
+            # Metrik süreleri aday bazında toplanır (paralelde işçi süreleri toplamı)
+            self._record_phase('metrics', outcome['metric_time'])
+            self._record_candidate(desc, candidate, outcome)
+            if key is not None:
+                self.checkpoint_.record(key, outcome)
+            yield outcome
+    
+    @staticmethod
+    def _outcome_score(outcome: Dict) -> float:
+        """Aday sonucunun en iyi silhouette skorunu döndürür (HDBSCAN'de seçimlerin en iyisi)."""
+        if 'selections' in outcome:
+            return max((selected['silhouette'] for selected in outcome['selections']), default=-1)
+        return outcome.get('silhouette', -1)
+    
+    def _reset_profile(self):
+        """
+        Aşama sürelerini ve aday profilini sıfırlar.
+        
+        profile_ yapısı:
+            candidates: Aday başına aşama adı, parametreler, fit_time,
+                metric_time ve peak_memory_mb (bellek ölçümü kapalıysa None)
+            stages: Aday grubu başına aday sayısı, toplam süreler ve en yüksek bellek
+            phases: phase_times_ ile aynı sözlük
+        """
+        self.phase_times_ = {}
+        self.profile_ = {'candidates': [], 'stages': {}, 'phases': self.phase_times_}
+    
+    def _record_candidate(self, stage: str, candidate: Dict, outcome: Dict):
+        """
+        Aday ölçümünü profile_ içine ekler ve aşama toplamlarını günceller.
+        
+        Args:
+            stage: Aday grubunun adı (ilerleme çubuğu açıklaması)
+            candidate: Aday parametreleri (dizi değerleri kaydedilmez)
+            outcome: _profile_candidate sonucu
+        """
+        params = {key: value for key, value in candidate.items()
+                  if not isinstance(value, np.ndarray)}
+        peak = outcome['peak_memory_mb']
+        self.profile_['candidates'].append({
+            'stage': stage,
+            'params': params,
+            'fit_time': outcome['fit_time'],
+            'metric_time': outcome['metric_time'],
+            'peak_memory_mb': peak
+        })
+        
+        totals = self.profile_['stages'].setdefault(stage, {
+            'n_candidates': 0, 'fit_time': 0.0, 'metric_time': 0.0, 'peak_memory_mb': None
+        })
+        totals['n_candidates'] += 1
+        totals['fit_time'] += outcome['fit_time']
+        totals['metric_time'] += outcome['metric_time']
+        if peak is not None:
+            totals['peak_memory_mb'] = max(peak, totals['peak_memory_mb'] or 0.0)
+    
+    def _record_profile(self, results: Dict, outcome: Dict):
+        """Aday ölçümlerini find_optimal_* sonuç sözlüğüne ekler."""
+        for key in ('fit_time', 'metric_time', 'peak_memory_mb'):
+            results[key].append(outcome[key])
+    
+    def profile_summary(self, top: int = 5) -> Dict:
+        """
+        Profil özetini döndürür: aşama toplamları ve en pahalı adaylar.
+        
+        Args:
+            top: Listelenecek en yavaş aday sayısı
+            
+        Returns:
+            Dict: 'phases', 'stages' ve 'slowest' (fit + metrik süresine göre)
+        """
+        slowest = sorted(self.profile_['candidates'],
+                         key=lambda entry: entry['fit_time'] + entry['metric_time'],
+                         reverse=True)[:top]
+        return {'phases': dict(self.profile_['phases']),
+                'stages': dict(self.profile_['stages']),
+                'slowest': slowest}
+    
+    def _record_phase(self, phase: str, elapsed: float):
+        """Aşama süresini phase_times_ içinde biriktirir."""
+        self.phase_times_[phase] = self.phase_times_.get(phase, 0.0) + elapsed
+    
+    def _score_options(self) -> Dict:
+        """Aday değerlendiricilerine iletilecek skor ayarlarını döndürür."""
+        if self.silhouette_mode == 'sampled':
+            return {
+                # Örneklenen noktalar tüm veriye karşı skorlanır (maliyet örneklem x n)
+                'silhouette_sample_size': self.config.get('silhouette_sample_size', 2000),
+                'silhouette_confidence': self.config.get('silhouette_confidence', 0.95)
+            }
+        return {}
+    
+    def build_linkage(self, X: np.ndarray, linkage: str = 'ward') -> np.ndarray:
+        """
+        Tam hiyerarşik ağacı oluşturur veya önbellekteki ağacı döndürür.
+        
+        Args:
+            X: Veri matrisi
+            linkage: Bağlantı kriteri ('ward', 'complete', 'average', 'single')
+            
+        Returns:
+            np.ndarray: scipy formatında bağlantı matrisi
+        """
+        key = (linkage, array_fingerprint(X))
+        if self.linkage_matrix_ is None or self._linkage_key != key:
+            self.linkage_matrix_ = linkage_tree(X, method=linkage, metric='euclidean')
+            self._linkage_key = key
+            self.logger.info(f"Hiyerarşik ağaç oluşturuldu ({linkage}, {len(X)} nokta)")
+        return self.linkage_matrix_
+    
+    def cut_hierarchical_tree(self, n_clusters: int) -> np.ndarray:
+        """
+        Önbellekteki hiyerarşik ağacı verilen küme sayısında keser.
+        
+        Args:
+            n_clusters: Küme sayısı
+            
+        Returns:
+            np.ndarray: Eğitim verisi için küme etiketleri
+        """
+        if self.linkage_matrix_ is None:
+            raise ValueError("Henüz bir hiyerarşik ağaç oluşturulmamış!")
+        return cut_linkage(self.linkage_matrix_, n_clusters)
+    
+    def _update_best(self, score: float, model, params: Dict):
+        """En iyi model bilgilerini günceller (kontrol noktası açıksa diske de yazar)."""
+        self.best_score = score
+        self.best_model = model
+        self.best_params = params
+        if self.checkpoint_ is not None:
+            self.checkpoint_.save_best(score, model, params)
+    
+    def _warm_start_kmeans(self, X: np.ndarray, k_range: List[int], n_init: int,
+                           point_weights: Optional[np.ndarray] = None) -> List[Dict]:
+        """
+        K-Means modellerini bir önceki k çözümünden başlatarak sırayla eğitir.
+        
+        İlk k (ve bir öncekinden küçük her k) n_init başlangıçla soğuk eğitilir.
+        Sonraki her k, önceki merkezlerin en yüksek SSE'li kümesi bölünerek
+        başlatılır ve yalnızca warm_restarts kadar (farklı kümeyi bölen) başlangıç denenir.
+        
+        Args:
+            X: Veri matrisi
+            k_range: Denenecek k değerleri
+            n_init: Soğuk başlangıçlar için deneme sayısı
+            point_weights: K-Means eğitiminde kullanılacak nokta ağırlıkları
+            
+        Returns:
+            List[Dict]: Her k için model, etiketler, inertia ve eğitim süresi
+        """
+        restarts = self.config.get('warm_restarts', 2)
+        fitted = []
+        previous = None
+        
+        for k in tqdm(k_range, desc="K-Means sıcak başlangıçlı eğitim"):
+            start = time.perf_counter()
+            if previous is None or k <= previous.n_clusters:
+                model = KMeans(n_clusters=k, n_init=n_init,
+                               random_state=42).fit(X, sample_weight=point_weights)
+            else:
+                model = None
+                for rank in range(restarts):
+                    init = _split_kmeans_centers(X, previous.cluster_centers_,
+                                                 previous.labels_, k, rank=rank,
+                                                 sample_weight=point_weights)
+                    candidate = KMeans(n_clusters=k, init=init, n_init=1,
+                                       random_state=42).fit(X, sample_weight=point_weights)
+                    if model is None or candidate.inertia_ < model.inertia_:
+                        model = candidate
+                        
+            fitted.append({
+                'model': model,
+                'labels': model.labels_,
+                'inertia': model.inertia_,
+                'fit_time': time.perf_counter() - start
+            })
+            self._record_candidate("K-Means sıcak başlangıçlı eğitim", {'n_clusters': k},
+                                   {'fit_time': fitted[-1]['fit_time'], 'metric_time': 0.0,
+                                    'peak_memory_mb': None})
+            previous = model
+            
+        return fitted
+    
+    def find_optimal_kmeans(self, X: np.ndarray, k_range: List[int],
+                           n_init: int = 10, handle_imbalance: bool = False,
+                           sweep: Optional[Literal['cold', 'warm']] = None,
+                           point_weights: Optional[np.ndarray] = None) -> Dict:
+        """
+        K-Means için optimal küme sayısını bulur.
+        
+        Args:
+            X: Veri matrisi
+            k_range: Denenecek k değerleri
+            n_init: Her k için kaç kez farklı başlangıç noktasıyla deneneceği
+            handle_imbalance: Veri dengesizliğini ele al
+            sweep: 'cold' her k'yı bağımsız eğitir, 'warm' k+1'i k çözümünden
+                başlatır (None ise config['kmeans_sweep'], varsayılan 'cold')
+            point_weights: Eğitim ve metriklerde kullanılacak nokta ağırlıkları
+                (ör. coreset ağırlıkları)
+            
+        Returns:
+            Dict: Her k değeri için metrikler ve eğitim süreleri
+        """
+        sweep = sweep or self.config.get('kmeans_sweep', 'cold')
+        if sweep not in ('cold', 'warm'):
+            raise ValueError(f"Desteklenmeyen K-Means tarama modu: {sweep}")
+            
+        results = {
+            'k_values': k_range,
+            'inertia': [],
+            'silhouette': [],
+            'silhouette_ci': [],
+            'calinski': [],
+            'davies': [],
+            'fit_time': [],
+            'metric_time': [],
+            'peak_memory_mb': []
+        }
+        
+        if sweep == 'warm':
+            # Eğitim zinciri sıralıdır; yalnızca skorlama paralel yürütülür
+            fitted = self._warm_start_kmeans(X, k_range, n_init, point_weights)
+            candidates = [{'labels': f['labels'], 'n_clusters': k}
+                          for k, f in zip(k_range, fitted)]
+            scores = self._run_candidates(
+                _score_kmeans_labels, X, candidates, desc="K-Means optimizasyonu",
+                handle_imbalance=handle_imbalance, point_weights=point_weights,
+                **self._score_options()
+            )
+            # Eğitim süresi sıralı zincirden, metrik süresi ve bellek skorlamadan gelir
+            outcomes = ({**score, **f} for f, score in zip(fitted, scores))
+        else:
+            candidates = [{'n_clusters': k} for k in k_range]
+            outcomes = self._run_candidates(
+                _evaluate_kmeans, X, candidates, desc="K-Means optimizasyonu",
+                n_init=n_init, handle_imbalance=handle_imbalance,
+                point_weights=point_weights, **self._score_options()
+            )
+        
+        for k, outcome in zip(k_range, outcomes):
+            results['inertia'].append(outcome['inertia'])
+            self._record_profile(results, outcome)
+            results['silhouette'].append(outcome['silhouette'])
+            results['silhouette_ci'].append(outcome['silhouette_ci'])
+            results['calinski'].append(outcome['calinski'])
+            results['davies'].append(outcome['davies'])
+                
+            if (results['silhouette'][-1] > self.best_score and k > 1):
+                self._update_best(results['silhouette'][-1], outcome['model'],
+                                  {'n_clusters': k, 'algorithm': 'kmeans'})
+                
+        self.logger.info(f"K-Means taraması ({sweep}) toplam eğitim süresi: "
+                         f"{sum(results['fit_time']):.2f} sn")
+        return results
+    
+    def find_optimal_kmeans_coreset(self, X: np.ndarray, k_range: List[int],
+                                    n_init: int = 10, handle_imbalance: bool = False,
+                                    coreset_size: Optional[int] = None,
+                                    compare: Optional[bool] = None) -> Dict:
+        """
+        K-Means k taramasını tüm veri yerine ağırlıklı bir coreset üzerinde yapar.
+        
+        Tarama kazanan modeli üretirse yalnızca o model, coreset merkezlerinden
+        başlatılarak tüm veri üzerinde yeniden eğitilir ve bu veri üzerinde
+        yeniden skorlanır; önceki en iyi modeli geçemezse o korunur. Sonuçlara yaklaşım
+        kalitesi eklenir: coreset maliyet tahmininin tüm veri maliyetine göre
+        hatası ve iyileştirme kazancı; compare True ise ayrıca tüm veri üzerindeki
+        taramayla k bazında karşılaştırma.
+        
+        Args:
+            X: Veri matrisi
+            k_range: Denenecek k değerleri
+            n_init: Her k için kaç kez farklı başlangıç noktasıyla deneneceği
+            handle_imbalance: Veri dengesizliğini ele al
+            coreset_size: Coreset boyutu (None ise config['coreset_size'], varsayılan 10000)
+            compare: Tüm veri taramasıyla karşılaştır (None ise config['coreset_compare'])
+            
+        Returns:
+            Dict: find_optimal_kmeans sonuçları, 'coreset_size' ve 'approximation'
+        """
+        coreset_size = coreset_size or self.config.get('coreset_size', 10000)
+        compare = self.config.get('coreset_compare', False) if compare is None else compare
+        
+        start = time.perf_counter()
+        points, weights = build_coreset(X, coreset_size)
+        previous_best, previous_score, previous_params = self.best_model, self.best_score, self.best_params
+        results = self.find_optimal_kmeans(points, k_range, n_init, handle_imbalance,
+                                           point_weights=weights)
+        sweep_time = time.perf_counter() - start
+        results['coreset_size'] = len(points)
+        
+        approximation = {'sweep_time': sweep_time}
+        if self.best_model is not previous_best:
+            # Kazanan coreset modeli: maliyet tahmini tüm veriyle kıyaslanır ve iyileştirilir
+            coreset_model = self.best_model
+            k = self.best_params['n_clusters']
+            _, distances = pairwise_distances_argmin_min(X, coreset_model.cluster_centers_)
+            full_cost = float(np.sum(distances.astype(np.float64) ** 2))
+            
+            start = time.perf_counter()
+            refined = KMeans(n_clusters=k, init=coreset_model.cluster_centers_,
+                             n_init=1, random_state=42).fit(X)
+            refine_time = time.perf_counter() - start
+            
+            # Coreset silhouette'i tüm veri modelini temsil etmez; model eğitildiği
+            # veri üzerinde diğer adaylarla aynı şekilde yeniden skorlanır
+            scores = _score_kmeans_labels(X, refined.labels_, k, handle_imbalance,
+                                          **self._score_options())
+            coreset_score = self.best_score
+            if previous_best is None or scores['silhouette'] > previous_score:
+                self._update_best(scores['silhouette'], refined, self.best_params)
+            else:
+                self._update_best(previous_score, previous_best, previous_params)
+                
+            approximation.update({
+                'n_clusters': k,
+                'refine_time': refine_time,
+                'coreset_silhouette': coreset_score,
+                'refined_silhouette': scores['silhouette'],
+                'coreset_inertia': float(coreset_model.inertia_),
+                'full_inertia': full_cost,
+                'refined_inertia': float(refined.inertia_),
+                # Coreset maliyet tahmininin göreli hatası
+                'cost_error': abs(coreset_model.inertia_ - full_cost) / full_cost if full_cost > 0 else 0.0,
+                # Tüm veri üzerinde iyileştirmenin maliyeti azaltma oranı
+                'refine_gain': (full_cost - refined.inertia_) / full_cost if full_cost > 0 else 0.0
+            })
+            self.logger.info(f"Coreset K-Means (k={k}) tüm veri üzerinde iyileştirildi; "
+                             f"maliyet tahmini hatası: {approximation['cost_error']:.4f}")
+        
+        if compare:
+            # Tüm veri taraması ayrı bir nesnede yapılır; en iyi model etkilenmez
+            reference = ClusteringOptimizer({**self.config, 'n_jobs': self.n_jobs})
+            start = time.perf_counter()
+            full_results = reference.find_optimal_kmeans(X, k_range, n_init, handle_imbalance)
+            full_time = time.perf_counter() - start
+            full_inertia = np.asarray(full_results['inertia'], dtype=np.float64)
+            candidates = [i for i, k in enumerate(k_range) if k > 1]
+            best_coreset = max(candidates, key=lambda i: results['silhouette'][i], default=None)
+            best_full = max(candidates, key=lambda i: full_results['silhouette'][i], default=None)
+            approximation['comparison'] = {
+                'inertia_error': (np.abs(np.asarray(results['inertia']) - full_inertia) / full_inertia).tolist(),
+                'silhouette_error': np.abs(np.asarray(results['silhouette']) -
+                                           np.asarray(full_results['silhouette'])).tolist(),
+                'selected_k': k_range[best_coreset] if best_coreset is not None else None,
+                'full_selected_k': k_range[best_full] if best_full is not None else None,
+                'full_sweep_time': full_time,
+                'speedup': full_time / sweep_time if sweep_time > 0 else float('inf')
+            }
+            self.logger.info(f"Coreset/tam tarama karşılaştırması: {approximation['comparison']}")
+            
+        results['approximation'] = approximation
+        return results
+    
+    def build_radius_graph(self, X: np.ndarray, radius: float) -> RadiusNeighborGraph:
         """
-        PCA uygular.
+        DBSCAN taraması için komşuluk grafını seçilen motorla oluşturur.
+        
+        config['dbscan_engine']: 'sklearn' ağaç tabanlı arama, 'grid' ızgara
+        indeksi, 'auto' (varsayılan) en fazla 3 boyutta ve bu yarıçapta nokta
+        başına beklenen komşu sayısı (hücre doluluğuyla orantılı) en fazla 10
+        ise ızgara kullanır. Yoğun grafta ızgaranın aday çiftleri ve satır
+        sıralaması ağaç aramasından pahalıdır.
         
         Args:
             X: Veri matrisi
-            n_components: Bileşen sayısı (None ise variance_ratio kullanılır)
-            variance_ratio: Korunacak varyans oranı
+            radius: Komşuluk yarıçapı
             
         Returns:
-            Tuple[np.ndarray, PCA]: Dönüştürülmüş veri ve PCA nesnesi
+            RadiusNeighborGraph: Komşuluk grafı
         """
-        if n_components is None:
-            pca = PCA(n_components=variance_ratio, svd_solver='full')
-        else:
-            pca = PCA(n_components=n_components)
+        engine = self.dbscan_engine
+        if engine == 'auto':
+            sparse = X.shape[1] <= 3 and estimate_neighbor_counts(X, [radius])[0] <= 10
+            engine = 'grid' if sparse else 'sklearn'
             
-        X_pca = pca.fit_transform(X)
-        self.pca = pca
-        
-        explained_var = np.sum(pca.explained_variance_ratio_)
-        self.logger.info(f"PCA sonrası açıklanan varyans: {explained_var:.4f}")
-        self.logger.info(f"Seçilen bileşen sayısı: {pca.n_components_}")
-        
-        return X_pca, pca
+        start = time.perf_counter()
+        graph = RadiusNeighborGraph(X, radius=radius, engine=engine)
+        self.logger.info(f"DBSCAN komşuluk grafı oluşturuldu ({engine}): {len(graph.indices)} kenar, "
+                         f"{time.perf_counter() - start:.2f} sn")
+        return graph
     
-    def compute_sample_weights(self, X: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    def _run_dbscan_candidates(self, X: np.ndarray, candidates: List[Dict], desc: str,
+                               selects_best: bool = True,
+                               handle_imbalance: bool = False) -> Iterator[Tuple[int, Dict]]:
         """
-        Veri dengesizliğini ele almak için örnek ağırlıkları hesaplar.
+        DBSCAN adaylarını ortak komşuluk grafıyla değerlendirir.
+        
+        Graf, tahmini kenar sayısı config['dbscan_max_edges'] sınırını aşmayan en
+        büyük eps için bir kez kurulur ve bu eps'e kadar olan adaylar graftan
+        türetilir. Graf bu sınırı aşacak kadar yoğun olan daha büyük eps
+        değerleri sklearn DBSCAN ile tek tek eğitilir.
         
         Args:
             X: Veri matrisi
-            labels: Küme etiketleri
+            candidates: eps ve min_samples içeren aday parametreleri
+            desc: İlerleme çubuğu açıklaması
+            selects_best: Adaylar en iyi modeli seçmek için mi değerlendiriliyor
+            handle_imbalance: Veri dengesizliğini ele al
             
-        Returns:
-            np.ndarray: Örnek ağırlıkları
+        Yields:
+            Tuple[int, Dict]: Aday indeksi ve değerlendirme sonucu
         """
-        # Küme boyutlarını hesapla
-        unique_labels, counts = np.unique(labels, exclude=[-1], return_counts=True)
-        
-        if len(unique_labels) == 0:
-            return np.ones(len(X))
-            
-        # Her küme için ağırlık hesapla (küçük kümeler daha yüksek ağırlık alır)
-        weights_per_cluster = {
-            label: 1.0 / count
-            for label, count in zip(unique_labels, counts)
-        }
+        eps_values = np.unique([candidate['eps'] for candidate in candidates])
+        expected_edges = estimate_neighbor_counts(X, eps_values) * len(X)
+        graph_eps = eps_values[expected_edges <= self.dbscan_max_edges]
+        radius = graph_eps.max() if len(graph_eps) else -np.inf
+        graph_idx = [i for i, candidate in enumerate(candidates) if candidate['eps'] <= radius]
+        fit_idx = [i for i, candidate in enumerate(candidates) if candidate['eps'] > radius]
         
-        # Her örnek için ağırlık ata
-        sample_weights = np.ones(len(X))
-        for label in unique_labels:
-            mask = labels == label
-            sample_weights[mask] = weights_per_cluster[label]
+        if graph_idx:
+            graph = self.build_radius_graph(X, radius=radius)
+            # Paralel işçiler min_samples yapılarını yeniden hesaplamaz
+            graph.prepare({candidates[i]['min_samples'] for i in graph_idx})
+            outcomes = self._run_candidates(
+                _evaluate_dbscan, X, [candidates[i] for i in graph_idx], desc=desc,
+                selects_best=selects_best, graph=graph, handle_imbalance=handle_imbalance,
+                **self._score_options()
+            )
+            yield from zip(graph_idx, outcomes)
+            # Graf, yoğun eps değerlerindeki eğitimlerden önce bırakılır
+            del graph, outcomes
             
-        # Gürültü noktaları (-1) için ortalama ağırlık kullan
-        noise_mask = labels == -1
-        if np.any(noise_mask):
-            sample_weights[noise_mask] = np.mean(list(weights_per_cluster.values()))
+        if fit_idx:
+            self.logger.info(f"{len(fit_idx)} DBSCAN adayı için komşuluk grafı "
+                             f"{self.dbscan_max_edges} kenar sınırını aşıyor; sklearn DBSCAN kullanılıyor")
+            outcomes = self._run_candidates(
+                _fit_dbscan, X, [candidates[i] for i in fit_idx], desc=desc,
+                selects_best=selects_best, handle_imbalance=handle_imbalance,
+                **self._score_options()
+            )
+            yield from zip(fit_idx, outcomes)
             
-        # Ağırlıkları normalize et
-        sample_weights /= np.sum(sample_weights)
-        sample_weights *= len(X)
-        
-        return sample_weights
-    
-    def find_optimal_kmeans(self, X: np.ndarray, k_range: List[int],
-                           n_init: int = 10, handle_imbalance: bool = False) -> Dict:
+    def find_optimal_dbscan(self, X: np.ndarray, eps_range: List[float],
+                           min_samples_range: List[int],
+                           handle_imbalance: bool = False) -> Dict:
         """
-        K-Means için optimal küme sayısını bulur.
+        DBSCAN için optimal parametreleri bulur.
         
         Args:
             X: Veri matrisi
-            k_range: Denenecek k değerleri
-            n_init: Her k için kaç kez farklı başlangıç noktasıyla deneneceği
+            eps_range: Denenecek eps değerleri
+            min_samples_range: Denenecek min_samples değerleri
             handle_imbalance: Veri dengesizliğini ele al
             
         Returns:
-            Dict: Her k değeri için metrikler
+            Dict: Her parametre kombinasyonu için metrikler
         """
         results = {
-            'k_values': k_range,
-            'inertia': [],
+            'eps': [],
+            'min_samples': [],
+            'n_clusters': [],
             'silhouette': [],
+            'silhouette_ci': [],
             'calinski': [],
-            'davies': []
+            'davies': [],
+            'inertia': [],
+            'fit_time': [],
+            'metric_time': [],
+            'peak_memory_mb': []
         }
         
-        for k in tqdm(k_range, desc="K-Means optimizasyonu"):
-            model = KMeans(n_clusters=k, n_init=n_init, random_state=42)
-            labels = model.fit_predict(X)
-            
-            if handle_imbalance:
-                sample_weights = self.compute_sample_weights(X, labels)
-            else:
-                sample_weights = None
-            
-            results['inertia'].append(model.inertia_)
+        candidates = [
+            {'eps': eps, 'min_samples': min_samples}
+            for eps in eps_range
+            for min_samples in min_samples_range
+        ]
+        outcomes = self._run_dbscan_candidates(X, candidates, desc="DBSCAN optimizasyonu",
+                                               handle_imbalance=handle_imbalance)
+        
+        for i, outcome in outcomes:
+            candidate = candidates[i]
+            results['eps'].append(candidate['eps'])
+            results['min_samples'].append(candidate['min_samples'])
+            results['n_clusters'].append(outcome['n_clusters'])
+            results['silhouette'].append(outcome['silhouette'])
+            results['silhouette_ci'].append(outcome['silhouette_ci'])
+            results['calinski'].append(outcome['calinski'])
+            results['davies'].append(outcome['davies'])
+            results['inertia'].append(outcome['inertia'])
+            self._record_profile(results, outcome)
             
-            if k > 1:  # Silhouette score en az 2 küme gerektirir
-                # Silhouette score için sample_weight'i sadece ortalama hesaplamada kullan
-                sil_samples = silhouette_samples(X, labels)
-                if sample_weights is not None:
-                    results['silhouette'].append(np.average(sil_samples, weights=sample_weights))
-                else:
-                    results['silhouette'].append(np.mean(sil_samples))
-                    
-                # Calinski-Harabasz ve Davies-Bouldin skorları için ağırlık kullanma
-                results['calinski'].append(calinski_harabasz_score(X, labels))
-                results['davies'].append(davies_bouldin_score(X, labels))
-            else:
-                results['silhouette'].append(0)
-                results['calinski'].append(0)
-                results['davies'].append(float('inf'))
-                
-            if (results['silhouette'][-1] > self.best_score and k > 1):
-                self.best_score = results['silhouette'][-1]
-                self.best_model = model
-                self.best_params = {'n_clusters': k, 'algorithm': 'kmeans'}
+            if outcome['silhouette'] > self.best_score and outcome['n_clusters'] > 1:
+                self._update_best(outcome['silhouette'], outcome['model'], {
+                    'eps': candidate['eps'],
+                    'min_samples': candidate['min_samples'],
+                    'algorithm': 'dbscan'
+                })
                 
         return results
     
-    def find_optimal_dbscan(self, X: np.ndarray, eps_range: List[float],
-                           min_samples_range: List[int],
-                           handle_imbalance: bool = False) -> Dict:
+    def find_optimal_hdbscan(self, X: np.ndarray, min_samples_range: List[int],
+                             cut_distances: Optional[List[float]] = None,
+                             handle_imbalance: bool = False) -> Dict:
         """
-        DBSCAN için optimal parametreleri bulur.
+        Yoğunluk tabanlı kümeleri HDBSCAN hiyerarşisinden bulur.
+        
+        Her min_samples için karşılıklı erişilebilirlik ağacı bir kez kurulur;
+        HDBSCAN'in otomatik (EOM) seçimi ve verilen her kesim mesafesindeki
+        DBSCAN* kümelemesi bu ağaçtan çıkarılır. Böylece eps ızgarasındaki tüm
+        DBSCAN adayları min_samples başına tek bir eğitimle kapsanır. En küçük
+        küme boyutu config['hdbscan_min_cluster_size'] ile verilir (varsayılan
+        örnek sayısının %1'i, en az 5).
         
         Args:
             X: Veri matrisi
-            eps_range: Denenecek eps değerleri
             min_samples_range: Denenecek min_samples değerleri
+            cut_distances: DBSCAN* kesim mesafeleri (eps karşılığı; None ise yalnızca EOM)
             handle_imbalance: Veri dengesizliğini ele al
             
         Returns:
-            Dict: Her parametre kombinasyonu için metrikler
+            Dict: Her (min_samples, seçim) çifti için metrikler
         """
+        min_cluster_size = self.config.get('hdbscan_min_cluster_size') or max(5, len(X) // 100)
+        cut_distances = list(cut_distances) if cut_distances is not None else []
         results = {
-            'eps': [],
             'min_samples': [],
+            'selection': [],
+            'cut_distance': [],
             'n_clusters': [],
             'silhouette': [],
+            'silhouette_ci': [],
             'calinski': [],
-            'davies': []
+            'davies': [],
+            'inertia': [],
+            'fit_time': [],
+            'metric_time': [],
+            'peak_memory_mb': []
         }
         
-        total_combinations = len(eps_range) * len(min_samples_range)
-        pbar = tqdm(total=total_combinations, desc="DBSCAN optimizasyonu")
+        candidates = [{'min_samples': min_samples} for min_samples in min_samples_range]
+        outcomes = self._run_candidates(
+            _evaluate_hdbscan, X, candidates, desc="HDBSCAN optimizasyonu",
+            min_cluster_size=min_cluster_size, cut_distances=cut_distances,
+            handle_imbalance=handle_imbalance, **self._score_options()
+        )
         
-        for eps in eps_range:
-            for min_samples in min_samples_range:
-                model = DBSCAN(eps=eps, min_samples=min_samples)
-                labels = model.fit_predict(X)
+        for candidate, outcome in zip(candidates, outcomes):
+            for position, selected in enumerate(outcome['selections']):
+                results['min_samples'].append(candidate['min_samples'])
+                results['selection'].append(selected['selection'])
+                results['cut_distance'].append(selected['cut_distance'])
+                results['n_clusters'].append(selected['n_clusters'])
+                results['silhouette'].append(selected['silhouette'])
+                results['silhouette_ci'].append(selected['silhouette_ci'])
+                results['calinski'].append(selected['calinski'])
+                results['davies'].append(selected['davies'])
+                results['inertia'].append(selected['inertia'])
+                # Ağaç eğitimi ve bellek tepe değeri aynı min_samples'taki seçimlerce
+                # paylaşılır; toplamlar şişmesin diye yalnızca ilk seçimde kaydedilir
+                shared = outcome if position == 0 else {'fit_time': 0.0, 'peak_memory_mb': None}
+                self._record_profile(results, {**shared, 'metric_time': selected['metric_time']})
                 
-                # Gürültü noktalarını (-1) hariç tut
-                valid_points = labels != -1
-                if sum(valid_points) > 1:  # En az 2 geçerli nokta olmalı
-                    X_valid = X[valid_points]
-                    labels_valid = labels[valid_points]
-                    
-                    if handle_imbalance:
-                        sample_weights = self.compute_sample_weights(X_valid, labels_valid)
-                    else:
-                        sample_weights = None
+                if selected['silhouette'] > self.best_score and selected['n_clusters'] > 1:
+                    # Aynı ağaçtan çıkan seçimler modeli paylaşır; kazanan kendi etiketlerini taşır
+                    model = copy.copy(outcome['model'])
+                    model.labels_ = selected['labels']
+                    params = {'min_samples': candidate['min_samples'],
+                              'min_cluster_size': min_cluster_size,
+                              'selection': selected['selection'],
+                              'algorithm': 'hdbscan'}
+                    if selected['cut_distance'] is not None:
+                        params['cut_distance'] = selected['cut_distance']
+                    self._update_best(selected['silhouette'], model, params)
                     
-                    n_clusters = len(set(labels_valid))
-                    if n_clusters > 1:  # En az 2 küme olmalı
-                        # Silhouette score için sample_weight'i sadece ortalama hesaplamada kullan
-                        sil_samples = silhouette_samples(X_valid, labels_valid)
-                        if sample_weights is not None:
-                            silhouette = np.average(sil_samples, weights=sample_weights)
-                        else:
-                            silhouette = np.mean(sil_samples)
-                            
-                        # Diğer metrikler için ağırlık kullanma
-                        calinski = calinski_harabasz_score(X_valid, labels_valid)
-                        davies = davies_bouldin_score(X_valid, labels_valid)
-                    else:
-                        silhouette = 0
-                        calinski = 0
-                        davies = float('inf')
-                else:
-                    n_clusters = 0
-                    silhouette = 0
-                    calinski = 0
-                    davies = float('inf')
-                
-                results['eps'].append(eps)
-                results['min_samples'].append(min_samples)
-                results['n_clusters'].append(n_clusters)
-                results['silhouette'].append(silhouette)
-                results['calinski'].append(calinski)
-                results['davies'].append(davies)
-                
-                if silhouette > self.best_score and n_clusters > 1:
-                    self.best_score = silhouette
-                    self.best_model = model
-                    self.best_params = {
-                        'eps': eps,
-                        'min_samples': min_samples,
-                        'algorithm': 'dbscan'
-                    }
-                
-                pbar.update(1)
-                
-        pbar.close()
         return results
     
     def find_optimal_hierarchical(self, X: np.ndarray, k_range: List[int],
@@ -328,41 +2064,218 @@ class ClusteringOptimizer:
         results = {
             'k_values': k_range,
             'silhouette': [],
+            'silhouette_ci': [],
             'calinski': [],
-            'davies': []
+            'davies': [],
+            'inertia': [],
+            'fit_time': [],
+            'metric_time': [],
+            'peak_memory_mb': []
         }
         
-        for k in tqdm(k_range, desc="Hiyerarşik kümeleme optimizasyonu"):
-            model = AgglomerativeClustering(n_clusters=k, linkage=linkage)
-            labels = model.fit_predict(X)
+        # Ağaç bir kez oluşturulur, her k değeri için yalnızca kesilir
+        linkage_matrix = self.build_linkage(X, linkage)
+        
+        candidates = [{'n_clusters': k} for k in k_range]
+        outcomes = self._run_candidates(
+            _evaluate_hierarchical, X, candidates,
+            desc="Hiyerarşik kümeleme optimizasyonu",
+            linkage_matrix=linkage_matrix, linkage=linkage,
+            **self._score_options()
+        )
+        
+        for k, outcome in zip(k_range, outcomes):
+            results['silhouette'].append(outcome['silhouette'])
+            results['silhouette_ci'].append(outcome['silhouette_ci'])
+            results['calinski'].append(outcome['calinski'])
+            results['davies'].append(outcome['davies'])
+            results['inertia'].append(outcome['inertia'])
+            self._record_profile(results, outcome)
             
-            if k > 1:
-                silhouette = silhouette_score(X, labels)
-                calinski = calinski_harabasz_score(X, labels)
-                davies = davies_bouldin_score(X, labels)
-            else:
-                silhouette = 0
-                calinski = 0
-                davies = float('inf')
-                
-            results['silhouette'].append(silhouette)
-            results['calinski'].append(calinski)
-            results['davies'].append(davies)
-            
-            if silhouette > self.best_score and k > 1:
-                self.best_score = silhouette
-                self.best_model = model
-                self.best_params = {
+            if outcome['silhouette'] > self.best_score and k > 1:
+                self._update_best(outcome['silhouette'], outcome['model'], {
                     'n_clusters': k,
                     'linkage': linkage,
                     'algorithm': 'hierarchical'
-                }
+                })
+                
+        return results
+    
+    def _evaluate_candidate_set(self, X: np.ndarray, candidates: List[Tuple[str, Dict]],
+                                sample_fraction: float, n_init: int,
+                                handle_imbalance: bool, desc: str,
+                                selects_best: bool = True) -> List[Dict]:
+        """
+        Karışık algoritma adaylarını aynı veri üzerinde değerlendirir.
+        
+        Alt örneklemde DBSCAN'in yoğunluk eşiği korunsun diye min_samples
+        örneklem oranıyla ölçeklenir (en az 2).
+        
+        Args:
+            X: Veri matrisi (tam veri veya alt örneklem)
+            candidates: (algoritma, parametreler) çiftleri
+            sample_fraction: X'in tam veriye oranı
+            n_init: K-Means başlangıç sayısı
+            handle_imbalance: Veri dengesizliğini ele al
+            desc: İlerleme çubuğu açıklaması
+            selects_best: Sonuçlar en iyi model seçiminde kullanılıyor mu
+                (alt örneklem turlarında yalnızca eleme için kullanılır)
+            
+        Returns:
+            List[Dict]: Aday sırasıyla değerlendirme sonuçları
+        """
+        outcomes = [None] * len(candidates)
+        
+        kmeans_idx = [i for i, (algorithm, _) in enumerate(candidates) if algorithm == 'kmeans']
+        if kmeans_idx:
+            kmeans_outcomes = self._run_candidates(
+                _evaluate_kmeans, X, [candidates[i][1] for i in kmeans_idx],
+                desc=f"{desc} (K-Means)", selects_best=selects_best, n_init=n_init,
+                handle_imbalance=handle_imbalance, **self._score_options()
+            )
+            for i, outcome in zip(kmeans_idx, kmeans_outcomes):
+                outcomes[i] = {**outcome, 'n_clusters': candidates[i][1]['n_clusters']}
+                
+        dbscan_idx = [i for i, (algorithm, _) in enumerate(candidates) if algorithm == 'dbscan']
+        if dbscan_idx:
+            dbscan_params = []
+            for i in dbscan_idx:
+                params = dict(candidates[i][1])
+                if sample_fraction < 1:
+                    params['min_samples'] = max(2, int(round(params['min_samples'] * sample_fraction)))
+                dbscan_params.append(params)
+                
+            dbscan_outcomes = self._run_dbscan_candidates(
+                X, dbscan_params, desc=f"{desc} (DBSCAN)", selects_best=selects_best,
+                handle_imbalance=handle_imbalance
+            )
+            for i, outcome in dbscan_outcomes:
+                outcomes[dbscan_idx[i]] = outcome
+                
+        return outcomes
+    
+    def successive_halving_search(self, X: np.ndarray, k_range: List[int],
+                                  eps_range: List[float], min_samples_range: List[int],
+                                  n_init: int = 10, handle_imbalance: bool = False) -> Dict:
+        """
+        K-Means ve DBSCAN adaylarını ardışık yarılama ile arar.
+        
+        Tüm adaylar önce küçük bir alt örneklemde skorlanır; her turda en iyi
+        1/eta kısmı eta kat büyük örnekleme geçer. Yalnızca finalistler tam
+        veride eğitilir ve en iyi model bunlar arasından seçilir.
+        
+        Konfigürasyon:
+            halving_min_samples: İlk turdaki örneklem boyutu (varsayılan 1000)
+            halving_eta: Eleme ve büyüme oranı (varsayılan 3)
+            halving_finalists: Tam veride eğitilecek aday sayısı (varsayılan 3)
+        
+        Args:
+            X: Veri matrisi
+            k_range: Denenecek k değerleri
+            eps_range: Denenecek eps değerleri
+            min_samples_range: Denenecek min_samples değerleri
+            n_init: K-Means başlangıç sayısı
+            handle_imbalance: Veri dengesizliğini ele al
+            
+        Returns:
+            Dict: Tur geçmişi ve finalistlerin tam veri metrikleri
+        """
+        eta = self.config.get('halving_eta', 3)
+        sample_size = self.config.get('halving_min_samples', 1000)
+        n_finalists = self.config.get('halving_finalists', 3)
+        
+        candidates = [('kmeans', {'n_clusters': k}) for k in k_range]
+        candidates += [
+            ('dbscan', {'eps': eps, 'min_samples': min_samples})
+            for eps in eps_range
+            for min_samples in min_samples_range
+        ]
+        
+        n_samples = len(X)
+        # İç içe örneklemler: her tur aynı permütasyonun daha uzun bir önekini kullanır
+        order = np.random.default_rng(42).permutation(n_samples)
+        active = list(range(len(candidates)))
+        rungs = []
+        
+        while len(active) > n_finalists and sample_size < n_samples:
+            X_rung = X[np.sort(order[:sample_size])]
+            outcomes = self._evaluate_candidate_set(
+                X_rung, [candidates[i] for i in active], sample_size / n_samples,
+                n_init, handle_imbalance, desc=f"Ardışık yarılama ({sample_size} örnek)",
+                selects_best=False
+            )
+            scores = [outcome['silhouette'] for outcome in outcomes]
+            rungs.append({
+                'sample_size': sample_size,
+                'candidates': [candidates[i] for i in active],
+                'silhouette': scores
+            })
+            
+            n_keep = max(n_finalists, int(np.ceil(len(active) / eta)))
+            promoted = np.sort(np.argsort(-np.asarray(scores), kind='stable')[:n_keep])
+            active = [active[j] for j in promoted]
+            sample_size *= eta
+            
+        finalists = [candidates[i] for i in active]
+        self.logger.info(f"Ardışık yarılama: {len(candidates)} adaydan {len(finalists)} finalist")
+        
+        outcomes = self._evaluate_candidate_set(
+            X, finalists, 1.0, n_init, handle_imbalance, desc="Finalistler (tam veri)"
+        )
+        results = {'rungs': rungs, 'finalists': finalists, 'silhouette': [],
+                   'silhouette_ci': [], 'calinski': [], 'davies': [], 'inertia': [],
+                   'n_clusters': []}
+        
+        for (algorithm, params), outcome in zip(finalists, outcomes):
+            for key in ('silhouette', 'silhouette_ci', 'calinski', 'davies', 'inertia', 'n_clusters'):
+                results[key].append(outcome[key])
+                
+            if outcome['silhouette'] > self.best_score and outcome['n_clusters'] > 1:
+                self._update_best(outcome['silhouette'], outcome['model'],
+                                  {**params, 'algorithm': algorithm})
                 
         return results
     
+    def _plot_candidate_profile(self, ax_time: plt.Axes, ax_memory: plt.Axes,
+                                x: List, results: Dict, xlabel: str):
+        """
+        Aday başına eğitim/metrik süresini ve tepe belleği çizer.
+        
+        Args:
+            ax_time: Süre grafiği ekseni (yığılmış çubuk)
+            ax_memory: Bellek grafiği ekseni (ölçülmediyse kapatılır)
+            x: Aday değerleri
+            results: fit_time, metric_time ve peak_memory_mb içeren sonuçlar
+            xlabel: x ekseni etiketi
+        """
+        if 'fit_time' not in results:
+            ax_time.axis('off')
+            ax_memory.axis('off')
+            return
+            
+        positions = np.arange(len(x))
+        ax_time.bar(positions, results['fit_time'], color='steelblue', label='Eğitim')
+        ax_time.bar(positions, results['metric_time'], bottom=results['fit_time'],
+                    color='darkorange', label='Metrik')
+        ax_time.set_xticks(positions)
+        ax_time.set_xticklabels(x)
+        ax_time.set_xlabel(xlabel)
+        ax_time.set_ylabel('Süre (sn)')
+        ax_time.set_title('Aday Süreleri')
+        ax_time.legend()
+        
+        peaks = results['peak_memory_mb']
+        if all(peak is None for peak in peaks):
+            ax_memory.axis('off')
+            return
+        ax_memory.plot(x, [np.nan if peak is None else peak for peak in peaks], 'ko-')
+        ax_memory.set_xlabel(xlabel)
+        ax_memory.set_ylabel('Tepe Bellek (MB)')
+        ax_memory.set_title('Aday Bellek Kullanımı')
+    
     def plot_kmeans_optimization(self, results: Dict, save_path: Optional[Union[str, Path]] = None):
-        """K-Means optimizasyon sonuçlarını görselleştirir."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+        """K-Means optimizasyon sonuçlarını ve aday profilini görselleştirir."""
+        fig, ((ax1, ax2, ax5), (ax3, ax4, ax6)) = plt.subplots(2, 3, figsize=(22, 10))
         
         # Elbow curve (inertia)
         ax1.plot(results['k_values'], results['inertia'], 'bo-')
@@ -388,6 +2301,9 @@ class ClusteringOptimizer:
         ax4.set_ylabel('Davies-Bouldin Score')
         ax4.set_title('Davies-Bouldin Analysis')
         
+        # Aday başına süre ve bellek
+        self._plot_candidate_profile(ax5, ax6, results['k_values'], results, 'Küme Sayısı (k)')
+        
         plt.tight_layout()
         
         if save_path:
@@ -407,14 +2323,22 @@ class ClusteringOptimizer:
         # Silhouette score heatmap için matrix oluştur
         silhouette_matrix = np.zeros((len(unique_min_samples), len(unique_eps)))
         n_clusters_matrix = np.zeros((len(unique_min_samples), len(unique_eps)))
+        # Aday profili: toplam süre (eğitim + metrik) ve tepe bellek
+        time_matrix = np.full((len(unique_min_samples), len(unique_eps)), np.nan)
+        memory_matrix = np.full((len(unique_min_samples), len(unique_eps)), np.nan)
         
         for i, eps in enumerate(results['eps']):
             eps_idx = unique_eps.index(eps)
             min_samples_idx = unique_min_samples.index(results['min_samples'][i])
             silhouette_matrix[min_samples_idx, eps_idx] = results['silhouette'][i]
             n_clusters_matrix[min_samples_idx, eps_idx] = results['n_clusters'][i]
+            if 'fit_time' in results:
+                time_matrix[min_samples_idx, eps_idx] = (results['fit_time'][i] +
+                                                         results['metric_time'][i])
+                if results['peak_memory_mb'][i] is not None:
+                    memory_matrix[min_samples_idx, eps_idx] = results['peak_memory_mb'][i]
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 5))
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
         # Silhouette score heatmap
         sns.heatmap(silhouette_matrix, annot=True, fmt='.2f', cmap='viridis',
@@ -432,6 +2356,19 @@ class ClusteringOptimizer:
         ax2.set_ylabel('Min Samples')
         ax2.set_title('Number of Clusters')
         
+        # Aday başına süre ve tepe bellek (ölçülmediyse panel boş kalır)
+        for ax, matrix, fmt, title in ((ax3, time_matrix, '.3f', 'Süre (sn): Eğitim + Metrik'),
+                                       (ax4, memory_matrix, '.1f', 'Tepe Bellek (MB)')):
+            if np.all(np.isnan(matrix)):
+                ax.axis('off')
+                continue
+            sns.heatmap(matrix, annot=True, fmt=fmt, cmap='magma',
+                       xticklabels=[f'{eps:.2f}' for eps in unique_eps],
+                       yticklabels=unique_min_samples, ax=ax)
+            ax.set_xlabel('Epsilon')
+            ax.set_ylabel('Min Samples')
+            ax.set_title(title)
+        
         plt.tight_layout()
         
         if save_path:
@@ -445,8 +2382,8 @@ class ClusteringOptimizer:
         
     def plot_hierarchical_optimization(self, results: Dict,
                                      save_path: Optional[Union[str, Path]] = None):
-        """Hiyerarşik kümeleme optimizasyon sonuçlarını görselleştirir."""
-        fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(15, 5))
+        """Hiyerarşik kümeleme optimizasyon sonuçlarını ve aday profilini görselleştirir."""
+        fig, ((ax1, ax2, ax3), (ax4, ax5, ax6)) = plt.subplots(2, 3, figsize=(20, 10))
         
         # Silhouette score
         ax1.plot(results['k_values'], results['silhouette'], 'ro-')
@@ -466,6 +2403,18 @@ class ClusteringOptimizer:
         ax3.set_ylabel('Davies-Bouldin Score')
         ax3.set_title('Davies-Bouldin Analysis')
         
+        # Önbellekteki ağaçtan kesilmiş dendrogram
+        if self.linkage_matrix_ is not None:
+            dendrogram(self.linkage_matrix_, truncate_mode='lastp', p=30,
+                       no_labels=True, ax=ax4)
+            ax4.set_ylabel('Birleşme Mesafesi')
+            ax4.set_title('Dendrogram')
+        else:
+            ax4.axis('off')
+            
+        # Aday başına süre ve bellek
+        self._plot_candidate_profile(ax5, ax6, results['k_values'], results, 'Küme Sayısı (k)')
+        
         plt.tight_layout()
         
         if save_path:
@@ -529,7 +2478,9 @@ class ClusteringOptimizer:
             'model': self.best_model,
             'params': self.best_params,
             'score': self.best_score,
-            'pca': self.pca
+            'pca': self.pca,
+            'scaler': self.scaler,
+            'assignment_index': self.assignment_index_
         }
         
         joblib.dump(model_info, save_path / 'best_clustering_model.joblib')
@@ -549,11 +2500,92 @@ class ClusteringOptimizer:
         self.best_params = model_info['params']
         self.best_score = model_info['score']
         self.pca = model_info['pca']
+        # Eski kayıtlarda ölçekleyici ve atama indeksi bulunmayabilir
+        self.scaler = model_info.get('scaler', self.scaler)
+        self.assignment_index_ = model_info.get('assignment_index')
         
         self.logger.info("Model yüklendi")
         self.logger.info(f"En iyi parametreler: {self.best_params}")
         self.logger.info(f"En iyi skor: {self.best_score}")
+
+    def _affine_transform(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ölçekleyici ve PCA'yı tek bir afin dönüşüme birleştirir.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: _transform_input(X) == X @ W + b olacak
+                şekilde (W, b)
+        """
+        n_features = self.scaler.n_features_in_
+        mean = self.scaler.mean_ if self.scaler.mean_ is not None else np.zeros(n_features)
+        scale = self.scaler.scale_ if self.scaler.scale_ is not None else np.ones(n_features)
+        
+        # Ölçekleme: (x - mu) / sigma
+        W = np.diag(1.0 / scale)
+        b = -mean / scale
+        
+        if self.pca is not None:
+            # PCA: (z - m) C^T, whiten ise ayrıca sqrt(özdeğer) ile bölünür
+            projection = self.pca.components_.T.copy()
+            if self.pca.whiten:
+                projection /= np.sqrt(self.pca.explained_variance_)
+            W = W @ projection
+            b = (b - self.pca.mean_) @ projection
+        
+        return W, b
+
+    def export_inference_artifact(self, save_path: Union[str, Path]) -> Path:
+        """
+        Eğitilmiş modeli sklearn gerektirmeyen tek bir .npz dosyasına derler.
+        
+        Dosya cluster_predictor.CompiledClusterPredictor ile yüklenir. K-Means
+        modellerinde ölçekleyici, PCA ve merkez mesafeleri tek bir matrise
+        birleştirilir; diğer modellerde afin dönüşüm ve atama indeksinin
+        referans noktaları yazılır.
+        
+        Args:
+            save_path: .npz dosya yolu
+        
+        Returns:
+            Path: Yazılan dosya yolu
+        """
+        if self.best_model is None:
+            raise ValueError("Henüz bir model eğitilmemiş!")
+        
+        save_path = Path(save_path)
+        save_path.parent.mkdir(parents=True, exist_ok=True)
         
+        W, b = self._affine_transform()
+        arrays = {
+            'version': np.array(ARTIFACT_VERSION),
+            'n_features_in': np.array(W.shape[0])
+        }
+        
+        if hasattr(self.best_model, 'cluster_centers_'):
+            centers = self.best_model.cluster_centers_
+            arrays['kind'] = np.array('centroid')
+            arrays['A'] = -2 * W @ centers.T
+            arrays['beta'] = np.einsum('ij,ij->i', centers, centers) - 2 * b @ centers.T
+        elif self.assignment_index_ is not None:
+            radius = self.assignment_index_.radius
+            arrays['kind'] = np.array('nearest')
+            arrays['W'] = W
+            arrays['b'] = b
+            arrays['reference_points'] = np.asarray(self.assignment_index_.tree.data)
+            arrays['reference_labels'] = self.assignment_index_.labels
+            arrays['radius'] = np.array(np.nan if radius is None else radius)
+        else:
+            raise ValueError("Model için atama indeksi kurulmamış! "
+                             "build_assignment_index çağrılmalıdır.")
+        
+        # Tahmin edici girdiyi tabloların tipine çevirir; float32 modelde float32 kalır
+        for key in ('A', 'beta', 'W', 'b', 'reference_points'):
+            if key in arrays:
+                arrays[key] = arrays[key].astype(self.dtype, copy=False)
+        np.savez(save_path, **arrays)
+        self.logger.info(f"Tahmin artifact'ı kaydedildi: {save_path} ({arrays['kind']})")
+        return save_path
+
     def apply_dimensionality_reduction(self, X: np.ndarray,
                                      method: Literal['pca', 'tsne', 'umap'] = 'pca',
                                      n_components: Optional[int] = None,
@@ -561,6 +2593,9 @@ class ClusteringOptimizer:
         """
         Boyut azaltma uygular.
         
+        config['embedding_cache_dir'] verilmişse aynı veri ve parametrelerle
+        yapılan tekrar çağrılar önbellekten döner.
+        
         Args:
             X: Veri matrisi
             method: Kullanılacak yöntem ('pca', 'tsne', 'umap')
@@ -570,14 +2605,28 @@ class ClusteringOptimizer:
         Returns:
             Tuple[np.ndarray, DimensionalityReducer]: Dönüştürülmüş veri ve model
         """
+        X = np.asarray(X, dtype=self.dtype)
+        if self.embedding_cache is not None:
+            cache_key = self.embedding_cache.make_key(
+                X, method, n_components=n_components, **kwargs
+            )
+            cached = self.embedding_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Boyut azaltma sonucu önbellekten alındı: {method}")
+                return cached
+        
         reducer = DimensionalityReducer(
             method=method,
             n_components=n_components,
+            dtype=self.dtype,
             **kwargs
         )
         
         X_reduced = reducer.fit_transform(X)
         
+        if self.embedding_cache is not None:
+            self.embedding_cache.put(cache_key, X_reduced, reducer)
+        
         if method == 'pca':
             explained_var = np.sum(reducer.explained_variance_ratio_)
             self.logger.info(f"PCA sonrası açıklanan varyans: {explained_var:.4f}")
@@ -586,6 +2635,133 @@ class ClusteringOptimizer:
         
         return X_reduced, reducer
     
+    def build_assignment_index(self, X_reduced: np.ndarray):
+        """
+        En iyi model için örneklem dışı atama indeksini kurar.
+        
+        predict metodu olan modeller (K-Means) için indeks gerekmez. DBSCAN için
+        çekirdek noktalar eps yarıçapıyla, diğer modeller için gürültü olmayan
+        tüm eğitim noktaları kullanılır.
+        
+        Args:
+            X_reduced: En iyi modelin eğitildiği indirgenmiş veri
+        """
+        self.assignment_index_ = None
+        if self.best_model is None or hasattr(self.best_model, 'predict'):
+            return
+            
+        labels = self.best_model.labels_
+        if isinstance(self.best_model, DBSCAN):
+            core = self.best_model.core_sample_indices_
+            self.assignment_index_ = ClusterAssigner(
+                X_reduced[core], labels[core], radius=self.best_model.eps
+            )
+        elif isinstance(self.best_model, HDBSCAN):
+            # DBSCAN* kesiminde sınır noktası yoktur; tüm üyeler kesim yarıçapıyla referanstır
+            members = labels != -1
+            self.assignment_index_ = ClusterAssigner(
+                X_reduced[members], labels[members], radius=self.best_params.get('cut_distance')
+            )
+        else:
+            members = labels != -1
+            self.assignment_index_ = ClusterAssigner(X_reduced[members], labels[members])
+            
+        self.logger.info(f"Atama indeksi kuruldu: {len(self.assignment_index_.labels)} referans noktası")
+    
+    def search_space(self, n_samples: int) -> Dict:
+        """
+        Varsayılan aday parametre aralıklarını döndürür.
+        
+        Args:
+            n_samples: Örnek sayısı
+            
+        Returns:
+            Dict: 'k_range', 'eps_range' ve 'min_samples_range'
+        """
+        return {
+            'k_range': range(2, min(11, n_samples // 2)),
+            'eps_range': np.linspace(0.1, 2.0, 20),
+            'min_samples_range': [3, 5, 7, 10]
+        }
+    
+    def _search_models(self, X_reduced: np.ndarray):
+        """
+        Boyutu indirgenmiş veri üzerinde aday modelleri arar ve en iyisini seçer.
+        
+        config['checkpoint_dir'] verilmişse tamamlanan adaylar ve o ana kadarki
+        en iyi model diske yazılır; aynı veri ve tarama ayarlarıyla yeniden
+        çalıştırıldığında tarama kaldığı yerden devam eder.
+        
+        Args:
+            X_reduced: Ölçeklendirilmiş ve boyutu indirgenmiş veri
+        """
+        self._open_checkpoint(X_reduced)
+        try:
+            space = self.search_space(len(X_reduced))
+            k_range = space['k_range']
+            eps_range = space['eps_range']
+            min_samples_range = space['min_samples_range']
+            
+            search_strategy = self.config.get('search_strategy', 'exhaustive')
+            if search_strategy == 'halving':
+                # Bütçeli arama: adaylar alt örneklemlerde elenir
+                self.successive_halving_search(X_reduced, k_range, eps_range, min_samples_range)
+            elif search_strategy == 'exhaustive':
+                # K-Means optimizasyonu (config['coreset_size'] aşılırsa coreset üzerinde)
+                coreset_size = self.config.get('coreset_size')
+                if coreset_size is not None and len(X_reduced) > coreset_size:
+                    self.find_optimal_kmeans_coreset(X_reduced, k_range)
+                else:
+                    self.find_optimal_kmeans(X_reduced, k_range)
+            
+                # Yoğunluk tabanlı arama: eps ızgarası veya tek bir HDBSCAN hiyerarşisi
+                if self.density_search == 'hdbscan':
+                    self.find_optimal_hdbscan(X_reduced, min_samples_range, cut_distances=eps_range)
+                else:
+                    self.find_optimal_dbscan(X_reduced, eps_range, min_samples_range)
+            else:
+                raise ValueError(f"Desteklenmeyen arama stratejisi: {search_strategy}")
+            
+            # En iyi modeli seç
+            if self.best_model is None:
+                # Varsayılan olarak K-Means kullan
+                self.best_model = KMeans(n_clusters=3, random_state=42)
+                self.best_model.fit(X_reduced)
+                self.best_params = {"algorithm": "kmeans", "n_clusters": 3}
+                labels = self.best_model.labels_
+                self.best_score = silhouette_score(X_reduced, labels) if len(np.unique(labels)) > 1 else 0
+            
+            self.build_assignment_index(X_reduced)
+        finally:
+            self.checkpoint_ = None
+    
+    def _open_checkpoint(self, X_reduced: np.ndarray):
+        """
+        Tarama kontrol noktasını açar ve kayıtlı en iyi modeli geri yükler.
+        
+        Kontrol noktası indirgenmiş verinin parmak izi ve sonucu etkileyen
+        ayarlarla anahtarlanır; paralellik, profil ve dizin ayarları anahtara girmez.
+        
+        Args:
+            X_reduced: Taranacak veri
+        """
+        checkpoint_dir = self.config.get('checkpoint_dir')
+        if not checkpoint_dir:
+            return
+            
+        runtime_keys = {'checkpoint_dir', 'n_jobs', 'max_nbytes', 'profile_memory',
+                        'embedding_cache_dir', 'embedding_cache_max_mb'}
+        settings = {key: value for key, value in self.config.items() if key not in runtime_keys}
+        self.checkpoint_ = SweepCheckpoint(checkpoint_dir, X_reduced, settings)
+        
+        best = self.checkpoint_.load_best()
+        if best is not None and best['score'] > self.best_score:
+            self.best_score = best['score']
+            self.best_model = best['model']
+            self.best_params = best['params']
+        self.logger.info(f"Kontrol noktası: {self.checkpoint_.path} "
+                         f"({len(self.checkpoint_.completed)} tamamlanmış aday)")
+    
     def fit(self, X: np.ndarray) -> 'ClusteringOptimizer':
         """
         Veriyi eğitir ve en iyi modeli bulur.
@@ -598,33 +2774,25 @@ class ClusteringOptimizer:
         """
         try:
             self.logger.info("Model eğitimi başlıyor")
+            self._reset_profile()
+            X = np.asarray(X, dtype=self.dtype)
             
             # Veriyi ölçeklendir
+            start = time.perf_counter()
             X_scaled = self.scaler.fit_transform(X)
+            self._record_phase('scale', time.perf_counter() - start)
             
             # PCA uygula
+            start = time.perf_counter()
             if X.shape[1] > 2:
                 X_reduced, self.pca = self.apply_pca(X_scaled)
             else:
                 X_reduced = X_scaled
+            self._record_phase('pca', time.perf_counter() - start)
             
-            # K-Means optimizasyonu
-            k_range = range(2, min(11, len(X) // 2))
-            kmeans_results = self.find_optimal_kmeans(X_reduced, k_range)
-            
-            # DBSCAN optimizasyonu
-            eps_range = np.linspace(0.1, 2.0, 20)
-            min_samples_range = [3, 5, 7, 10]
-            dbscan_results = self.find_optimal_dbscan(X_reduced, eps_range, min_samples_range)
-            
-            # En iyi modeli seç
-            if self.best_model is None:
-                # Varsayılan olarak K-Means kullan
-                self.best_model = KMeans(n_clusters=3, random_state=42)
-                self.best_model.fit(X_reduced)
-                self.best_params = {"algorithm": "kmeans", "n_clusters": 3}
-                labels = self.best_model.labels_
-                self.best_score = silhouette_score(X_reduced, labels) if len(np.unique(labels)) > 1 else 0
+            start = time.perf_counter()
+            self._search_models(X_reduced)
+            self._record_phase('sweep', time.perf_counter() - start)
             
             self.logger.info(f"Model eğitimi tamamlandı. En iyi skor: {self.best_score:.4f}")
             return self
@@ -633,6 +2801,160 @@ class ClusteringOptimizer:
             self.logger.error(f"Model eğitimi hatası: {str(e)}", exc_info=True)
             raise
     
+    def _batch_source(self, data: Union[np.ndarray, Callable, Iterable],
+                      batch_size: int) -> Tuple[Callable[[], Iterator[np.ndarray]], bool]:
+        """
+        Veri kaynağını batch üreten bir fonksiyona dönüştürür.
+        
+        Args:
+            data: Numpy dizisi/memmap, yeni iterator döndüren fonksiyon veya iterable
+            batch_size: Dizi kaynakları için batch boyutu
+            
+        Returns:
+            Tuple[Callable, bool]: Batch üreticisi ve kaynağın tekrar okunabilir olup olmadığı
+        """
+        if isinstance(data, np.ndarray):
+            def batches():
+                for start in range(0, len(data), batch_size):
+                    yield np.asarray(data[start:start + batch_size], dtype=self.dtype)
+            return batches, True
+        if callable(data):
+            return lambda: (np.asarray(batch, dtype=self.dtype) for batch in data()), True
+            
+        iterator = (np.asarray(batch, dtype=self.dtype) for batch in data)
+        return lambda: iterator, False
+    
+    def _transform_input(self, X: np.ndarray) -> np.ndarray:
+        """Ham veriyi eğitilmiş ölçekleyici ve PCA ile indirgenmiş uzaya taşır."""
+        X_scaled = self.scaler.transform(np.asarray(X, dtype=self.dtype))
+        if self.pca is not None:
+            # IncrementalPCA istatistikleri float64 tutar; çıktı seçilen tipe getirilir
+            return self.pca.transform(X_scaled).astype(self.dtype, copy=False)
+        return X_scaled
+    
+    def fit_chunked(self, data: Union[str, Path, np.ndarray, Callable, Iterable],
+                    batch_size: Optional[int] = None,
+                    variance_ratio: float = 0.95) -> 'ClusteringOptimizer':
+        """
+        Belleğe sığmayan veriyi batch'ler halinde eğitir.
+        
+        Ölçekleyici ve IncrementalPCA batch'ler üzerinde kısmi olarak eğitilir,
+        adaylar veri boyunca tutulan rastgele bir örneklem (reservoir sampling)
+        üzerinde değerlendirilir ve K-Means kazanırsa son model MiniBatchKMeans
+        ile tüm veri üzerinde iyileştirilir. Bellekte aynı anda yalnızca örneklem
+        ve tek bir batch tutulur; boyutları config['memory_budget_mb']
+        (varsayılan 512) ve config['reservoir_size'] (varsayılan 20000) ile sınırlanır.
+        Aday değerlendirmesinin çalışma belleği örneklem boyutuna bağlıdır.
+        
+        Args:
+            data: .npy dosya yolu, numpy dizisi/memmap, her çağrıda yeni bir batch
+                iterator'ı döndüren fonksiyon veya tek seferlik batch iterable'ı.
+                Tek seferlik kaynaklarda PCA ve son iyileştirme örneklem üzerinde yapılır.
+            batch_size: Dizi kaynakları için batch boyutu (None ise bütçeden hesaplanır)
+            variance_ratio: Korunacak varyans oranı
+            
+        Returns:
+            self: Eğitilmiş model
+        """
+        try:
+            self.logger.info("Parçalı model eğitimi başlıyor")
+            self._reset_profile()
+            budget = self.config.get('memory_budget_mb', 512) * 1024 ** 2
+            
+            if isinstance(data, (str, Path)):
+                data = np.load(data, mmap_mode='r')
+            if isinstance(data, np.ndarray) and batch_size is None:
+                # Batch'in ölçeklenmiş ve indirgenmiş kopyaları için bütçenin 1/8'i
+                batch_size = max(1, budget // 8 // (data.shape[1] * self.dtype.itemsize))
+            batches, reiterable = self._batch_source(data, batch_size)
+            
+            # 1. geçiş: ölçekleyici istatistikleri ve rezervuar örneklemi
+            # (önceki eğitimlerin istatistikleri birikmesin diye yeni ölçekleyici)
+            start = time.perf_counter()
+            self.scaler = StandardScaler()
+            rng = np.random.default_rng(42)
+            reservoir = None
+            n_seen = 0
+            for batch in batches():
+                if reservoir is None:
+                    # Bütçenin yarısı rezervuar örneklemine ayrılır
+                    capacity = int(min(self.config.get('reservoir_size', 20000),
+                                       max(1, budget // 2 // batch[0].nbytes)))
+                    reservoir = np.empty((capacity, batch.shape[1]), dtype=batch.dtype)
+                self.scaler.partial_fit(batch)
+                n_seen = _update_reservoir(reservoir, batch, n_seen, rng)
+                
+            if reservoir is None:
+                raise ValueError("Veri kaynağı boş!")
+            reservoir = reservoir[:min(n_seen, len(reservoir))]
+            self._record_phase('scale', time.perf_counter() - start)
+            self.logger.info(f"Görülen örnek sayısı: {n_seen}, örneklem boyutu: {len(reservoir)}")
+            
+            # 2. geçiş: artımlı PCA
+            start = time.perf_counter()
+            n_features = reservoir.shape[1]
+            if n_features > 2:
+                self.pca = IncrementalPCA(n_components=n_features)
+                fitted = False
+                if reiterable:
+                    # IncrementalPCA her batch'te en az n_components örnek ister: kısa
+                    # batch'ler sonrakine eklenir, bir batch bekletilir ki sondaki
+                    # kısa parça ona eklenebilsin
+                    carry, pending = None, None
+                    for batch in batches():
+                        batch = self.scaler.transform(batch)
+                        if carry is not None:
+                            batch, carry = np.vstack([carry, batch]), None
+                        if len(batch) < n_features:
+                            carry = batch
+                            continue
+                        if pending is not None:
+                            self.pca.partial_fit(pending)
+                        pending = batch
+                    if carry is not None and pending is not None:
+                        pending = np.vstack([pending, carry])
+                    if pending is not None:
+                        self.pca.partial_fit(pending)
+                        fitted = True
+                if not fitted:
+                    self.pca.partial_fit(self.scaler.transform(reservoir))
+                    
+                n_components = int(np.searchsorted(
+                    np.cumsum(self.pca.explained_variance_ratio_), variance_ratio, side='right') + 1)
+                truncate_components(self.pca, min(n_components, n_features))
+                self.logger.info(f"PCA sonrası açıklanan varyans: "
+                                 f"{np.sum(self.pca.explained_variance_ratio_):.4f}")
+                self.logger.info(f"Seçilen bileşen sayısı: {self.pca.n_components_}")
+            else:
+                self.pca = None
+            self._record_phase('pca', time.perf_counter() - start)
+                
+            # Adaylar örneklem üzerinde değerlendirilir
+            start = time.perf_counter()
+            self._search_models(self._transform_input(reservoir))
+            self._record_phase('sweep', time.perf_counter() - start)
+            
+            # 3. geçiş: kazanan K-Means ise tüm veri üzerinde mini-batch iyileştirme
+            if self.best_params.get('algorithm') == 'kmeans' and reiterable:
+                start = time.perf_counter()
+                refined = MiniBatchKMeans(
+                    n_clusters=self.best_params['n_clusters'],
+                    init=self.best_model.cluster_centers_,
+                    n_init=1,
+                    random_state=42
+                )
+                for batch in batches():
+                    refined.partial_fit(self._transform_input(batch))
+                self.best_model = refined
+                self._record_phase('refine', time.perf_counter() - start)
+                
+            self.logger.info(f"Parçalı model eğitimi tamamlandı. En iyi skor: {self.best_score:.4f}")
+            return self
+            
+        except Exception as e:
+            self.logger.error(f"Parçalı model eğitimi hatası: {str(e)}", exc_info=True)
+            raise
+    
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
         Yeni veri için tahmin yapar.
@@ -647,17 +2969,17 @@ class ClusteringOptimizer:
             if self.best_model is None:
                 raise ValueError("Model henüz eğitilmemiş!")
             
-            # Veriyi ölçeklendir
-            X_scaled = self.scaler.transform(X)
+            # Veriyi ölçeklendir ve gerekirse PCA uygula
+            X_reduced = self._transform_input(X)
             
-            # Gerekirse PCA uygula
-            if self.pca is not None:
-                X_reduced = self.pca.transform(X_scaled)
+            # Tahmin yap (predict metodu olmayan modeller atama indeksini kullanır)
+            if self.assignment_index_ is not None:
+                labels = self.assignment_index_.predict(X_reduced)
+            elif hasattr(self.best_model, 'predict'):
+                labels = self.best_model.predict(X_reduced)
             else:
-                X_reduced = X_scaled
-            
-            # Tahmin yap
-            labels = self.best_model.predict(X_reduced)
+                raise ValueError("Model için atama indeksi kurulmamış! "
+                                 "build_assignment_index çağrılmalıdır.")
             return labels
             
         except Exception as e:
@@ -0,0 +1,228 @@
+from clustering import ClusteringOptimizer
+from benchmark_utils import measure
+from sklearn.datasets import make_blobs, make_moons
+import numpy as np
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Algoritmaların makul sürede çalıştığı en büyük örnek sayıları
+# (hiyerarşik kümeleme O(n^2) bellek kullanır; varsayılan eps ızgarası 2.0'a
+# kadar çıktığından DBSCAN komşulukları neredeyse tam graftır ve fit de DBSCAN
+# taramasını içerir; 10 bin örnekte 2 boyutlu tarama ~1 GB bellekle biter)
+DEFAULT_LIMITS = {
+    'fit': 10_000,
+    'kmeans': 1_000_000,
+    'dbscan': 10_000,
+    'hierarchical': 10_000
+}
+
+def generate_data(structure: str, n_samples: int, n_features: int,
+                  random_state: int = 42) -> np.ndarray:
+    """
+    Benchmark için sentetik veri üretir.
+    
+    Args:
+        structure: Küme yapısı ('blobs', 'anisotropic', 'moons' veya 'uniform')
+        n_samples: Örnek sayısı
+        n_features: Özellik sayısı
+        random_state: Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        np.ndarray: Üretilen veri
+    """
+    rng = np.random.default_rng(random_state)
+    if structure == 'blobs':
+        X, _ = make_blobs(n_samples=n_samples, n_features=n_features, centers=5,
+                          random_state=random_state)
+    elif structure == 'anisotropic':
+        X, _ = make_blobs(n_samples=n_samples, n_features=n_features, centers=5,
+                          random_state=random_state)
+        X = X @ rng.normal(size=(n_features, n_features))
+    elif structure == 'moons':
+        # İki boyutlu yapı, kalan boyutlara küçük gürültü eklenerek genişletilir
+        moons, _ = make_moons(n_samples=n_samples, noise=0.05, random_state=random_state)
+        noise = rng.normal(scale=0.05, size=(n_samples, max(n_features - 2, 0)))
+        X = np.hstack([moons, noise])[:, :n_features]
+    elif structure == 'uniform':
+        X = rng.uniform(-1, 1, size=(n_samples, n_features))
+    else:
+        raise ValueError(f"Desteklenmeyen veri yapısı: {structure}")
+    return X
+
+def run_case(method: str, X: np.ndarray, config: Dict, track_memory: bool) -> Dict:
+    """
+    Tek bir benchmark durumunu çalıştırır.
+    
+    fit tüm pipeline'ı ölçer; find_optimal_* yöntemleri ölçeklenmiş ve PCA
+    uygulanmış veri üzerinde, fit'in kullandığı varsayılan aralıklarla çalışır.
+    
+    Args:
+        method: 'fit', 'kmeans', 'dbscan' veya 'hierarchical'
+        X: Ham veri
+        config: ClusteringOptimizer ayarları
+        track_memory: tracemalloc ile tepe bellek ölçülsün mü
+    
+    Returns:
+        Dict: Süre, aşama süreleri, aday profili, tepe bellek ve en iyi model bilgisi
+    """
+    optimizer = ClusteringOptimizer(config)
+    
+    if method == 'fit':
+        _, wall_time, peak_memory_mb = measure(lambda: optimizer.fit(X), track_memory)
+        phase_times = dict(optimizer.phase_times_)
+    else:
+        X_reduced = optimizer.scaler.fit_transform(X)
+        if X.shape[1] > 2:
+            X_reduced, _ = optimizer.apply_pca(X_reduced)
+        space = optimizer.search_space(len(X_reduced))
+        searches = {
+            'kmeans': lambda: optimizer.find_optimal_kmeans(X_reduced, space['k_range']),
+            'dbscan': lambda: optimizer.find_optimal_dbscan(
+                X_reduced, space['eps_range'], space['min_samples_range']),
+            'hierarchical': lambda: optimizer.find_optimal_hierarchical(
+                X_reduced, space['k_range'])
+        }
+        # Yeni optimizer'ın profili boştur; ön işleme aday profiline girmez
+        _, wall_time, peak_memory_mb = measure(searches[method], track_memory)
+        phase_times = {**optimizer.phase_times_, 'sweep': wall_time}
+    
+    return {
+        'wall_time': wall_time,
+        'peak_memory_mb': peak_memory_mb,
+        'phase_times': phase_times,
+        'profile': optimizer.profile_summary()['stages'],
+        'best_params': {key: (value.item() if isinstance(value, np.generic) else value)
+                        for key, value in optimizer.best_params.items()},
+        'best_score': float(optimizer.best_score)
+    }
+
+def write_report(output_path: Path, meta: Dict, results: List[Dict]) -> None:
+    """
+    Raporu geçici dosyaya yazıp yerine taşır; yarıda kalan çalıştırmada da
+    tamamlanan durumlar okunabilir kalır.
+    
+    Args:
+        output_path: Rapor dosyası
+        meta: Çalıştırma bilgileri
+        results: O ana kadarki sonuçlar
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+    temp_path.write_text(json.dumps({'meta': meta, 'results': results}, indent=2, default=str))
+    temp_path.replace(output_path)
+
+def case_key(case: Dict) -> str:
+    """Sonuçları eşleştirmek için durum anahtarı üretir."""
+    return f"{case['method']}|{case['structure']}|n={case['n_samples']}|d={case['n_features']}"
+
+def compare_to_baseline(results: List[Dict], baseline: List[Dict],
+                        tolerance: float, min_time: float = 0.5) -> List[Dict]:
+    """
+    Sonuçları referans çalıştırmayla karşılaştırır.
+    
+    Args:
+        results: Mevcut sonuçlar
+        baseline: Referans sonuçları
+        tolerance: İzin verilen göreli artış (ör. 0.2 = %20)
+        min_time: Bundan kısa süren durumların süre karşılaştırması atlanır (sn);
+            çok kısa ölçümler gürültüye baskındır
+    
+    Returns:
+        List[Dict]: Gerilemeler (süre veya bellek eşiği aşan durumlar)
+    """
+    reference = {case_key(entry['case']): entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        base = reference.get(case_key(entry['case']))
+        if base is None or 'wall_time' not in entry or 'wall_time' not in base:
+            continue
+        for metric in ('wall_time', 'peak_memory_mb'):
+            current, previous = entry.get(metric), base.get(metric)
+            if current is None or previous is None or previous <= 0:
+                continue
+            if metric == 'wall_time' and max(current, previous) < min_time:
+                continue
+            ratio = current / previous
+            if ratio > 1 + tolerance:
+                regressions.append({'case': case_key(entry['case']), 'metric': metric,
+                                    'baseline': previous, 'current': current, 'ratio': ratio})
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="ClusteringOptimizer ölçeklenme benchmark'ı")
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--dims', type=int, nargs='+', default=[2, 10, 50])
+    parser.add_argument('--structures', nargs='+',
+                        default=['blobs', 'anisotropic', 'moons', 'uniform'])
+    parser.add_argument('--methods', nargs='+', default=list(DEFAULT_LIMITS),
+                        choices=list(DEFAULT_LIMITS))
+    parser.add_argument('--config', type=str, default=None,
+                        help="ClusteringOptimizer ayarları (JSON metni)")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="tracemalloc ölçümünü kapatır (ek yükü önler)")
+    parser.add_argument('--output', type=str, default='output/benchmark/results.json')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help="Karşılaştırılacak referans sonuç dosyası")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help="Süre karşılaştırması için en kısa ölçüm (sn)")
+    args = parser.parse_args(argv)
+    
+    config = json.loads(args.config) if args.config else {}
+    meta = {
+        'timestamp': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'config': config
+    }
+    output_path = Path(args.output)
+    results = []
+    
+    for structure in args.structures:
+        for n_features in args.dims:
+            for n_samples in args.sizes:
+                X = generate_data(structure, n_samples, n_features)
+                for method in args.methods:
+                    case = {'method': method, 'structure': structure,
+                            'n_samples': n_samples, 'n_features': n_features}
+                    if n_samples > DEFAULT_LIMITS[method]:
+                        results.append({'case': case, 'status': 'skipped'})
+                        write_report(output_path, meta, results)
+                        continue
+                    print(f"Çalışıyor: {case_key(case)}", flush=True)
+                    try:
+                        outcome = run_case(method, X, config, not args.no_memory)
+                        results.append({'case': case, 'status': 'ok', **outcome})
+                        print(f"  {outcome['wall_time']:.2f} sn, "
+                              f"aşamalar: {outcome['phase_times']}", flush=True)
+                    except Exception as e:
+                        results.append({'case': case, 'status': 'error', 'error': str(e)})
+                        print(f"  Hata: {e}", flush=True)
+                    # Her durumdan sonra yazılır; kesilen çalıştırmada sonuçlar kaybolmaz
+                    write_report(output_path, meta, results)
+    
+    print(f"\nSonuçlar kaydedildi: {output_path}")
+    
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())['results']
+        regressions = compare_to_baseline(results, baseline, args.tolerance,
+                                          args.min_time)
+        if regressions:
+            print(f"\n{len(regressions)} gerileme bulundu (tolerans %{args.tolerance * 100:.0f}):")
+            for regression in regressions:
+                print(f"  {regression['case']} {regression['metric']}: "
+                      f"{regression['baseline']:.3f} -> {regression['current']:.3f} "
+                      f"(x{regression['ratio']:.2f})")
+            return 1
+        print("\nReferansa göre gerileme yok")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
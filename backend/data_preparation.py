@@ -10,6 +10,25 @@ from pathlib import Path
 import joblib
 from tqdm import tqdm
 import numpy as np
+
+# Pipeline boyunca desteklenen kayan nokta tipleri
+SUPPORTED_DTYPES = (np.float32, np.float64)
+
+def resolve_dtype(dtype: Union[str, np.dtype, type]) -> np.dtype:
+    """
+    Kayan nokta tipini doğrular ve np.dtype olarak döndürür.
+    
+    Args:
+        dtype: 'float32' veya 'float64' (ya da karşılık gelen numpy tipi)
+        
+    Returns:
+        np.dtype: Doğrulanmış veri tipi
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Desteklenmeyen veri tipi: {dtype}")
+    return dtype
+
 class DataPreparation:
     def __init__(self, config: Optional[Dict] = None):
         """
@@ -21,6 +40,8 @@ class DataPreparation:
         self.config = config or {}
         self.logger = self._setup_logger()
         self.transformers = {}
+        # Sayısal sütunların kayan nokta tipi ('float32' veya 'float64')
+        self.dtype = resolve_dtype(self.config.get('dtype', 'float64'))
         
     def _setup_logger(self) -> logging.Logger:
         """Logger ayarlarını yapılandırır."""
@@ -54,9 +75,42 @@ class DataPreparation:
         else:
             raise ValueError(f"Desteklenmeyen dosya formatı: {file_path.suffix}")
             
+        df = self.cast_numeric(df)
         self.logger.info(f"Veri yüklendi. Boyut: {df.shape}")
         return df
 
+    def _is_numeric(self, series: pd.Series) -> bool:
+        """Sütunun tamsayı veya kayan nokta tipinde olup olmadığını döndürür."""
+        return series.dtype.kind in 'iuf'
+
+    def cast_numeric(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Kayan nokta sütunlarını yapılandırılmış veri tipine çevirir.
+        
+        Args:
+            df: İşlenecek DataFrame
+            
+        Returns:
+            pd.DataFrame: Kayan nokta sütunları self.dtype olan DataFrame
+        """
+        float_cols = [col for col in df.columns
+                      if df[col].dtype.kind == 'f' and df[col].dtype != self.dtype]
+        if not float_cols:
+            return df
+        return df.astype({col: self.dtype for col in float_cols})
+
+    def to_array(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        DataFrame'i yapılandırılmış veri tipinde numpy dizisine dönüştürür.
+        
+        Args:
+            df: Sayısal DataFrame
+            
+        Returns:
+            np.ndarray: self.dtype tipinde dizi
+        """
+        return df.to_numpy(dtype=self.dtype)
+
     def analyze_missing_values(self, df: pd.DataFrame) -> Dict:
         """
         Eksik değerleri analiz eder.
@@ -104,8 +158,8 @@ class DataPreparation:
                 self.logger.warning(f"Geçersiz strateji: {method}")
                 continue
                 
-            if df[column].dtype in ['int64', 'float64']:
-                df_cleaned[column] = imputer.fit_transform(df[[column]])
+            if self._is_numeric(df[column]):
+                df_cleaned[column] = imputer.fit_transform(df[[column]]).astype(self.dtype, copy=False)
                 
         return df_cleaned
 
@@ -144,7 +198,7 @@ class DataPreparation:
         outliers = {}
         
         for column in columns:
-            if df[column].dtype not in ['int64', 'float64']:
+            if not self._is_numeric(df[column]):
                 continue
                 
             if method == 'iqr':
@@ -210,13 +264,13 @@ class DataPreparation:
         df_transformed = df.copy()
         
         for column in columns:
-            if df[column].dtype not in ['int64', 'float64']:
+            if not self._is_numeric(df[column]):
                 continue
                 
             transformer = PowerTransformer(method='yeo-johnson')
             df_transformed[column] = transformer.fit_transform(
                 df[[column]].fillna(df[column].mean())
-            )
+            ).astype(self.dtype, copy=False)
             self.transformers[f"{column}_normalizer"] = transformer
             
         return df_transformed
@@ -237,7 +291,7 @@ class DataPreparation:
         df_scaled = df.copy()
         
         for column in columns:
-            if df[column].dtype not in ['int64', 'float64']:
+            if not self._is_numeric(df[column]):
                 continue
                 
             if scaler_type == 'standard':
@@ -247,7 +301,7 @@ class DataPreparation:
                 
             df_scaled[column] = scaler.fit_transform(
                 df[[column]].fillna(df[column].mean())
-            )
+            ).astype(self.dtype, copy=False)
             self.transformers[f"{column}_scaler"] = scaler
             
         return df_scaled
@@ -297,7 +351,7 @@ class DataPreparation:
             save_path: Grafiklerin kaydedileceği dizin
         """
         for column in columns:
-            if df[column].dtype not in ['int64', 'float64']:
+            if not self._is_numeric(df[column]):
                 continue
                 
             fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
@@ -0,0 +1,92 @@
+from clustering import ClusteringOptimizer
+from auto_cluster import AutoCluster
+from data_preparation import DataPreparation
+from benchmark_utils import measure
+from sklearn.datasets import make_blobs
+from sklearn.metrics import adjusted_rand_score
+import numpy as np
+import pandas as pd
+import argparse
+from typing import Dict
+
+def run_precision(X: np.ndarray, dtype: str, n_batches: int) -> Dict:
+    """
+    Pipeline'ı verilen hassasiyetle çalıştırır.
+    
+    Args:
+        X: Ham veri
+        dtype: 'float32' veya 'float64'
+        n_batches: Streaming testi için batch sayısı
+    
+    Returns:
+        Dict: Aşama bazında süre, bellek ve etiketler
+    """
+    config = {
+        'dtype': dtype,
+        'silhouette_mode': 'sampled',
+        'search_strategy': 'halving',
+        'n_clusters': 5,
+        'n_components': 3
+    }
+    results = {'dtype': dtype}
+    
+    # Veri hazırlama: DataFrame -> ölçekleme -> numpy
+    preparation = DataPreparation(config)
+    df = preparation.cast_numeric(pd.DataFrame(X))
+    
+    def prepare():
+        scaled = preparation.scale_features(df, list(df.columns))
+        return preparation.to_array(scaled)
+    
+    X_prepared, results['prepare_time'], results['prepare_peak_mb'] = measure(prepare)
+    
+    # Statik kümeleme
+    optimizer = ClusteringOptimizer(config)
+    _, results['fit_time'], results['fit_peak_mb'] = measure(lambda: optimizer.fit(X_prepared))
+    results['labels'], results['predict_time'], results['predict_peak_mb'] = measure(
+        lambda: optimizer.predict(X_prepared)
+    )
+    results['best_params'] = optimizer.best_params
+    results['best_score'] = float(optimizer.best_score)
+    
+    # Streaming kümeleme
+    auto_cluster = AutoCluster(config=config)
+    batches = np.array_split(X_prepared, n_batches)
+    
+    def stream():
+        for batch in batches:
+            auto_cluster.partial_fit(batch, update_buffer=False)
+    
+    _, results['stream_time'], results['stream_peak_mb'] = measure(stream)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="float32 ve float64 pipeline karşılaştırması")
+    parser.add_argument('--n-samples', type=int, default=20000)
+    parser.add_argument('--n-features', type=int, default=16)
+    parser.add_argument('--n-batches', type=int, default=20)
+    args = parser.parse_args()
+    
+    X, _ = make_blobs(n_samples=args.n_samples, n_features=args.n_features,
+                      centers=5, random_state=42)
+    
+    runs = {dtype: run_precision(X, dtype, args.n_batches) for dtype in ('float64', 'float32')}
+    
+    print(f"\nVeri: {args.n_samples} x {args.n_features}")
+    print(f"{'Aşama':<20}{'float64':>17}{'float32':>20}{'Oran':>8}")
+    for stage in ('prepare', 'fit', 'predict', 'stream'):
+        for metric, unit in (('time', 'sn'), ('peak_mb', 'MB')):
+            key = f"{stage}_{metric}"
+            base, single = runs['float64'][key], runs['float32'][key]
+            ratio = single / base if base > 0 else float('nan')
+            print(f"{key:<20}{base:>12.3f} {unit:<4}{single:>15.3f} {unit:<4}{ratio:>8.2f}")
+    
+    agreement = adjusted_rand_score(runs['float64']['labels'], runs['float32']['labels'])
+    print(f"\nEn iyi model (float64): {runs['float64']['best_params']} "
+          f"skor={runs['float64']['best_score']:.4f}")
+    print(f"En iyi model (float32): {runs['float32']['best_params']} "
+          f"skor={runs['float32']['best_score']:.4f}")
+    print(f"Etiket uyumu (ARI): {agreement:.4f}")
+
+if __name__ == "__main__":
+    main()
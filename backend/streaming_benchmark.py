@@ -0,0 +1,71 @@
+from auto_cluster import AutoCluster
+from sklearn.datasets import make_blobs
+from sklearn.metrics import adjusted_rand_score
+import numpy as np
+import argparse
+import time
+from typing import Dict, List
+
+def run_stream(batches: List[np.ndarray], config: Dict) -> Dict:
+    """
+    Batch'leri AutoCluster.partial_fit ile işler ve batch başına süreyi ölçer.
+    
+    Args:
+        batches: Veri batch'leri (ilki modeli başlatır ve ölçüme katılmaz)
+        config: AutoCluster ayarları
+    
+    Returns:
+        Dict: Batch süreleri (sn), saniyedeki satır sayısı, son batch
+            etiketleri ve son inertia
+    """
+    auto_cluster = AutoCluster(config=config)
+    auto_cluster.partial_fit(batches[0], update_buffer=False)
+    
+    times = []
+    for batch in batches[1:]:
+        start = time.perf_counter()
+        labels = auto_cluster.partial_fit(batch, update_buffer=False)
+        times.append(time.perf_counter() - start)
+    
+    times = np.asarray(times)
+    n_rows = sum(len(batch) for batch in batches[1:])
+    return {
+        'median_batch_ms': float(np.median(times) * 1000),
+        'rows_per_sec': n_rows / float(times.sum()),
+        'labels': labels,
+        'inertia': float(auto_cluster.model.inertia_)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="AutoCluster.partial_fit: birleşik K-Means adımı ile partial_fit + predict karşılaştırması"
+    )
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[256, 1024, 4096])
+    parser.add_argument('--n-batches', type=int, default=100)
+    parser.add_argument('--n-features', type=int, default=32)
+    parser.add_argument('--n-clusters', type=int, nargs='+', default=[8, 32])
+    parser.add_argument('--online-transform', action='store_true',
+                        help="Ölçekleyici ve PCA güncellemesini de ölçüme kat")
+    args = parser.parse_args()
+    
+    print(f"{'batch':>7}{'k':>5}{'eski ms':>10}{'birleşik ms':>13}"
+          f"{'eski satır/sn':>16}{'birleşik satır/sn':>19}{'hızlanma':>10}{'ARI':>7}")
+    for n_clusters in args.n_clusters:
+        for batch_size in args.batch_sizes:
+            X, _ = make_blobs(n_samples=batch_size * args.n_batches, n_features=args.n_features,
+                              centers=n_clusters, random_state=42)
+            batches = np.array_split(X, args.n_batches)
+            base_config = {'n_clusters': n_clusters, 'n_components': 0.95,
+                           'online_transform': args.online_transform}
+            
+            runs = {mode: run_stream(batches, {**base_config, 'fused_update': mode == 'fused'})
+                    for mode in ('separate', 'fused')}
+            separate, fused = runs['separate'], runs['fused']
+            agreement = adjusted_rand_score(separate['labels'], fused['labels'])
+            print(f"{batch_size:>7}{n_clusters:>5}"
+                  f"{separate['median_batch_ms']:>10.2f}{fused['median_batch_ms']:>13.2f}"
+                  f"{separate['rows_per_sec']:>16.0f}{fused['rows_per_sec']:>19.0f}"
+                  f"{fused['rows_per_sec'] / separate['rows_per_sec']:>10.2f}{agreement:>7.3f}")
+
+if __name__ == "__main__":
+    main()
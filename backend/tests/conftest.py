@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Backend modülleri birbirini düz (paket öneki olmadan) içe aktarır
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
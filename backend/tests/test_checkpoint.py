@@ -0,0 +1,42 @@
+import functools
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_blobs
+
+import clustering
+from clustering import ClusteringOptimizer
+
+def test_sweep_resumes_after_crash(tmp_path, monkeypatch):
+    X, _ = make_blobs(n_samples=400, n_features=3, centers=3, random_state=0)
+    original = clustering._evaluate_dbscan
+    calls = []
+    crash_at = [30]
+    
+    # Aday anahtarı fonksiyon adını içerir; sarmalayıcı aynı adı taşımalıdır
+    @functools.wraps(original)
+    def counted(*args, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == crash_at[0]:
+            raise RuntimeError("yarıda kesildi")
+        return original(*args, **kwargs)
+        
+    monkeypatch.setattr(clustering, '_evaluate_dbscan', counted)
+    crash_at[0] = None
+    reference = ClusteringOptimizer({}).fit(X)
+    n_candidates = len(calls)
+    
+    config = {'checkpoint_dir': str(tmp_path)}
+    calls.clear()
+    crash_at[0] = 30
+    with pytest.raises(RuntimeError):
+        ClusteringOptimizer(config).fit(X)
+        
+    # Tamamlanan 29 aday yeniden değerlendirilmez, sonuç kesintisiz çalıştırmayla aynıdır
+    calls.clear()
+    crash_at[0] = None
+    resumed = ClusteringOptimizer(config).fit(X)
+    assert len(calls) == n_candidates - 29
+    assert resumed.best_params == reference.best_params
+    assert resumed.best_score == pytest.approx(reference.best_score)
+    np.testing.assert_array_equal(resumed.predict(X), reference.predict(X))
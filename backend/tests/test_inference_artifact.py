@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+from sklearn.datasets import make_blobs, make_moons
+
+from cluster_predictor import CompiledClusterPredictor
+from clustering import ClusteringOptimizer
+
+def kmeans_only_space(self, n_samples):
+    """DBSCAN'in küme bulamadığı bir eps ile K-Means kazananını zorlar."""
+    return {'k_range': range(2, 6), 'eps_range': [1e-3], 'min_samples_range': [5]}
+
+@pytest.mark.parametrize('algorithm', ['kmeans', 'dbscan'])
+def test_artifact_predicts_like_optimizer(tmp_path, monkeypatch, algorithm):
+    if algorithm == 'kmeans':
+        monkeypatch.setattr(ClusteringOptimizer, 'search_space', kmeans_only_space)
+        X, _ = make_blobs(n_samples=500, n_features=4, centers=3, random_state=0)
+    else:
+        X, _ = make_moons(n_samples=500, noise=0.05, random_state=0)
+        
+    optimizer = ClusteringOptimizer({}).fit(X)
+    assert optimizer.best_params['algorithm'] == algorithm
+    
+    path = optimizer.export_inference_artifact(tmp_path / 'model.npz')
+    predictor = CompiledClusterPredictor.load(path)
+    
+    X_new = np.vstack([X, X + np.random.default_rng(0).normal(scale=0.5, size=X.shape)])
+    np.testing.assert_array_equal(predictor.predict(X_new), optimizer.predict(X_new))
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from sklearn.cluster import DBSCAN
+from sklearn.datasets import make_blobs
+
+from clustering import ClusteringOptimizer, RadiusNeighborGraph
+
+@pytest.fixture(scope='module')
+def data():
+    """Kopya noktalar içeren, ölçeklenmiş küçük küme verisi."""
+    X, _ = make_blobs(n_samples=600, n_features=2, centers=4, cluster_std=1.2, random_state=0)
+    X = np.vstack([X, X[:20]])
+    return (X - X.mean(axis=0)) / X.std(axis=0)
+
+@pytest.mark.parametrize('engine', ['sklearn', 'grid'])
+def test_dbscan_labels_match_sklearn(data, engine):
+    graph = RadiusNeighborGraph(data, radius=0.5, engine=engine)
+    for eps in (0.05, 0.1, 0.2, 0.35, 0.5):
+        for min_samples in (1, 3, 5, 10):
+            labels, core_indices = graph.dbscan_labels(eps, min_samples)
+            expected = DBSCAN(eps=eps, min_samples=min_samples).fit(data)
+            np.testing.assert_array_equal(labels, expected.labels_)
+            np.testing.assert_array_equal(core_indices, expected.core_sample_indices_)
+
+@pytest.mark.parametrize('engine', ['sklearn', 'grid'])
+def test_dbscan_labels_any_eps_order(data, engine):
+    graph = RadiusNeighborGraph(data, radius=0.5, engine=engine)
+    for eps in (0.4, 0.1, 0.3, 0.05):
+        labels, _ = graph.dbscan_labels(eps, 5)
+        np.testing.assert_array_equal(labels, DBSCAN(eps=eps, min_samples=5).fit(data).labels_)
+
+def test_dbscan_labels_rejects_eps_above_radius(data):
+    graph = RadiusNeighborGraph(data, radius=0.2)
+    with pytest.raises(ValueError):
+        graph.dbscan_labels(0.3, 5)
+
+def test_auto_engine_uses_density(data):
+    optimizer = ClusteringOptimizer({'dbscan_engine': 'auto'})
+    assert optimizer.build_radius_graph(data, radius=0.02).engine == 'grid'
+    assert optimizer.build_radius_graph(data, radius=1.0).engine == 'sklearn'
@@ -0,0 +1,35 @@
+import json
+from collections import deque
+
+import numpy as np
+
+from auto_cluster import ClusterHistory, RingBuffer
+
+def test_ring_buffer_wraparound_matches_deque():
+    rng = np.random.default_rng(0)
+    buffer = RingBuffer(capacity=7)
+    expected = deque(maxlen=7)
+    # Kapasiteden küçük, eşit ve büyük batch'ler sınırı birçok kez aşar
+    for size in (3, 5, 1, 7, 2, 12, 4, 6, 9, 1):
+        batch = rng.normal(size=(size, 3))
+        buffer.append(batch)
+        expected.extend(batch)
+        np.testing.assert_array_equal(buffer.view(), np.array(expected))
+        assert len(buffer) == len(expected)
+
+def test_cluster_history_round_trip_and_bounded():
+    history = ClusterHistory(capacity=4, rollup_size=3, rollup_capacity=2)
+    rng = np.random.default_rng(1)
+    sizes = rng.integers(0, 50, size=(20, 3))
+    for step, row in enumerate(sizes):
+        history.append(float(step), int(row.sum()), row, inertia=float(step))
+        
+    # Ham kayıtlar son capacity batch'tir
+    np.testing.assert_array_equal(history.recent()['cluster_sizes'], sizes[-4:])
+    np.testing.assert_allclose(history.distribution_stats()[0], sizes.mean(axis=0))
+    
+    restored = ClusterHistory.from_dict(json.loads(json.dumps(history.to_dict())))
+    for key, values in history.recent().items():
+        np.testing.assert_array_equal(restored.recent()[key], values)
+    for key, values in history.rollups().items():
+        np.testing.assert_array_equal(restored.rollups()[key], values)